@@ -0,0 +1,6 @@
+# asgi.py
+from setup import create_app
+from setup.asgi import create_asgi_app
+
+# uvicorn asgi:app, the user routes run on the asyncio repository and the others on the Flask app
+app = create_asgi_app(create_app())
@@ -0,0 +1,85 @@
+# gunicorn.conf.py
+# gunicorn -c gunicorn.conf.py, every setting can be overridden by its environment variable
+import os
+import tempfile
+
+# set before prometheus_client is imported: the workers write their metrics to mmap'd files in
+# this directory, on tmpfs when there is one, and /metrics adds up the files of all of them
+os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR",
+    os.path.join("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "prometheus"),
+)
+os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+from setup.server import cpu_limit, memory_limit, worker_count  # noqa: E402 - after PROMETHEUS_MULTIPROC_DIR is set
+
+# wsgi runs app:app on threaded workers, asgi runs asgi:app on uvicorn event loop workers
+interface = os.getenv("SERVER_INTERFACE", "wsgi")
+asynchronous = interface == "asgi"
+
+bind = "0.0.0.0:{}".format(os.getenv("PORT", "5000"))
+wsgi_app = "asgi:app" if asynchronous else "app:app"
+worker_class = "uvicorn.workers.UvicornWorker" if asynchronous else "gthread"
+
+# sized from the limits of the container cgroup, not from the CPUs and memory of the node
+workers = int(
+    os.getenv(
+        "WEB_CONCURRENCY",
+        worker_count(
+            cpu_limit(),
+            memory_limit(),
+            int(os.getenv("GUNICORN_WORKER_MEMORY_MB", "256")) * 1024 * 1024,
+            asynchronous=asynchronous,
+        ),
+    )
+)
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+
+# every thread of a worker can hold a connection, read when preload creates the engine below
+os.environ.setdefault("DB_POOL_SIZE", str(threads))
+
+# the application is imported once in the master and shared by the workers through copy on write
+preload_app = True
+
+# workers are recycled to bound slow leaks, the jitter keeps them from restarting all at once
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", str(max_requests // 10)))
+
+# longer than the 60s upstream idle timeout of the ingress, so the proxy closes idle connections first
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "65"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+
+# heartbeat files on tmpfs, a disk backed /tmp can stall workers into timeouts
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG")
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def on_starting(server):
+    # counters left by a previous run would be added to the new ones
+    from setup.metrics import clear_multiprocess_directory
+
+    clear_multiprocess_directory(os.environ["PROMETHEUS_MULTIPROC_DIR"])
+
+
+def pre_fork(server, worker):
+    # connections opened in the master while preloading are closed before a worker inherits them;
+    # in the worker, os.register_at_fork hooks of engine_registry and user_cache_invalidation give
+    # every engine a new pool and restart the LISTEN thread
+    from src.infra.config import engine_registry
+
+    for engine in engine_registry.engines():
+        engine.dispose()
+
+
+def post_fork(server, worker):
+    server.log.info("Worker %s spawned, one of %s %s workers", worker.pid, workers, interface)
+
+
+def child_exit(server, worker):
+    from setup.metrics import mark_process_dead
+
+    mark_process_dead(worker.pid)
@@ -0,0 +1,28 @@
+import sys
+import argparse
+from src.data.user.import_users import ImportUsersUseCase, ImportUsersParameter
+
+
+def import_users(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Import users from a CSV or NDJSON file")
+    parser.add_argument("path", help="CSV (name,last_name,email,cpf header) or NDJSON file, '-' for stdin")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="defaults to ndjson for .ndjson/.jsonl files, csv otherwise")
+    parser.add_argument("--on-conflict", choices=["skip", "update"], default="skip", help="what to do with users whose cpf or email exists")
+    args = parser.parse_args(argv)
+
+    file_format = args.format
+    if file_format is None:
+        file_format = "ndjson" if args.path.endswith((".ndjson", ".jsonl")) else "csv"
+
+    lines = sys.stdin if args.path == "-" else open(args.path, newline="", encoding="utf-8")
+    with lines:
+        use_case = ImportUsersUseCase()
+        parameter = ImportUsersParameter(lines=lines, format=file_format, on_conflict=args.on_conflict)
+        response = use_case.proceed(parameter)
+
+    print(use_case.stringify(response))
+    return 0 if response["success"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(import_users())
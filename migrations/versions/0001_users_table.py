@@ -0,0 +1,68 @@
+"""users table and keyset pagination indexes
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from datetime import datetime, timedelta, timezone
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+KEYSET_INDEXES = {
+    'ix_users_name_id': ('name', 'id'),
+    'ix_users_last_name_id': ('last_name', 'id'),
+    'ix_users_created_at_id': ('created_at', 'id'),
+}
+
+
+def upgrade():
+    # clusters provisioned by init-script-config.yaml already have the table
+    if not sa.inspect(op.get_bind()).has_table('users'):
+        op.create_table(
+            'users',
+            sa.Column('id', sa.String(length=36), primary_key=True),
+            sa.Column('name', sa.String(), nullable=False),
+            sa.Column('last_name', sa.String(), nullable=False),
+            sa.Column('cpf', sa.String(), nullable=False, unique=True),
+            sa.Column('email', sa.String(), nullable=False, unique=True),
+            sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        )
+    else:
+        created_at = next(
+            column for column in sa.inspect(op.get_bind()).get_columns('users')
+            if column['name'] == 'created_at'
+        )
+        if created_at['nullable']:
+            # created_at is a keyset sort column, a NULL row could never be paged after; the
+            # backfill is a bound DateTime so SQLite stores it in the format the repository compares
+            users = sa.table('users', sa.column('created_at', sa.DateTime()))
+            op.execute(
+                users.update()
+                .where(users.c.created_at.is_(None))
+                .values(created_at=datetime.now(timezone(timedelta(hours=-3))).replace(tzinfo=None))
+            )
+            with op.batch_alter_table('users') as batch_op:
+                batch_op.alter_column(
+                    'created_at',
+                    existing_type=sa.DateTime(),
+                    server_default=sa.func.now(),
+                    nullable=False,
+                )
+
+    for index_name, columns in KEYSET_INDEXES.items():
+        op.execute(
+            'CREATE INDEX IF NOT EXISTS {} ON users ({})'.format(index_name, ', '.join(columns))
+        )
+
+
+def downgrade():
+    for index_name in KEYSET_INDEXES:
+        op.execute('DROP INDEX IF EXISTS {}'.format(index_name))
@@ -0,0 +1,82 @@
+"""substring search indexes for name, last_name, email and cpf
+
+PostgreSQL gets pg_trgm GIN indexes, which serve ILIKE '%term%'. SQLite gets
+an FTS5 table with the trigram tokenizer, kept in sync by triggers and used by
+SqliteTrigramSearchBackend. Its rows are keyed on users.id, an UNINDEXED column:
+the implicit rowid of users, whose primary key is TEXT, may change on VACUUM.
+The triggers find the rows of a changed user by a scan of users_search, a cost
+left to the SQLite databases of development and tests.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+SEARCHABLE_COLUMNS = ('name', 'last_name', 'email', 'cpf')
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        # CONCURRENTLY keeps users writable while the indexes build
+        with op.get_context().autocommit_block():
+            for column in SEARCHABLE_COLUMNS:
+                op.execute(
+                    'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_{0}_trgm '
+                    'ON users USING gin ({0} gin_trgm_ops)'.format(column)
+                )
+
+    elif dialect == 'sqlite':
+        columns = ', '.join(SEARCHABLE_COLUMNS)
+        new_values = ', '.join('new.' + column for column in SEARCHABLE_COLUMNS)
+
+        # replaces a users_search keyed on users.rowid, which VACUUM may renumber
+        drop_sqlite_search()
+        op.execute(
+            "CREATE VIRTUAL TABLE users_search USING fts5("
+            "id UNINDEXED, {}, tokenize='trigram')".format(columns)
+        )
+        op.execute(
+            "CREATE TRIGGER users_search_insert AFTER INSERT ON users BEGIN "
+            "INSERT INTO users_search(id, {0}) VALUES (new.id, {1}); END".format(columns, new_values)
+        )
+        op.execute(
+            "CREATE TRIGGER users_search_delete AFTER DELETE ON users BEGIN "
+            "DELETE FROM users_search WHERE id = old.id; END"
+        )
+        op.execute(
+            "CREATE TRIGGER users_search_update AFTER UPDATE ON users BEGIN "
+            "DELETE FROM users_search WHERE id = old.id; "
+            "INSERT INTO users_search(id, {0}) VALUES (new.id, {1}); END".format(columns, new_values)
+        )
+        op.execute("INSERT INTO users_search(id, {0}) SELECT id, {0} FROM users".format(columns))
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            for column in SEARCHABLE_COLUMNS:
+                op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_users_{}_trgm'.format(column))
+
+    elif dialect == 'sqlite':
+        drop_sqlite_search()
+
+
+def drop_sqlite_search():
+    for trigger in ('users_search_insert', 'users_search_delete', 'users_search_update'):
+        op.execute('DROP TRIGGER IF EXISTS {}'.format(trigger))
+    op.execute('DROP TABLE IF EXISTS users_search')
@@ -16,4 +16,29 @@ def create_app():
     from . import routes
     app.register_blueprint(routes.bp)
 
+    from src.infra.cache import (
+        read_cache,
+        build_cache_backend,
+        user_cache_invalidation,
+        USER_NAMESPACE,
+        USER_LIST_NAMESPACE,
+    )
+    from src.infra.config import DBConnectionHandler
+
+    read_cache.configure(
+        build_cache_backend(
+            app.config['CACHE_BACKEND'],
+            app.config['CACHE_URL'],
+            maxsize=app.config['CACHE_MAX_ENTRIES'],
+        ),
+        ttls={
+            USER_NAMESPACE: app.config['CACHE_USER_TTL'],
+            USER_LIST_NAMESPACE: app.config['CACHE_LIST_TTL'],
+        },
+        serializer=app.config['CACHE_SERIALIZER'],
+    )
+
+    # evict users changed by other replicas from this worker's caches
+    user_cache_invalidation.start(DBConnectionHandler().engine)
+
     return app
@@ -0,0 +1,236 @@
+# asgi.py
+import json
+import time
+from urllib.parse import parse_qsl
+from asgiref.wsgi import WsgiToAsgi
+from werkzeug.datastructures import Headers, MultiDict
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import Map, Rule, RoutingException
+from src.infra.config import engine_registry, query_instrumentation
+from src.data.user.list_users import AsyncListUsersUseCase, ListUsersParameter
+from src.data.user.create_user import AsyncCreateUserUseCase, CreateUserParameter
+from src.data.user.get_user import AsyncGetUserUseCase, GetUserParameter
+from src.data.user.update_user import AsyncUpdateUserUseCase, UpdateUserParameter
+from src.data.user.delete_user import AsyncDeleteUserUseCase, DeleteUserParameter
+from .metrics import (
+    http_requests_total,
+    http_request_duration_seconds,
+    http_request_db_duration_seconds,
+    http_response_size_bytes,
+    exceptions_total,
+    cache_metrics,
+    endpoint_labels,
+)
+
+
+class AsgiRequest:
+    """The parts of an ASGI http scope the async routes read"""
+
+    def __init__(self, scope, receive):
+        self.method = scope['method']
+        self.path = scope['path']
+        self.args = MultiDict(parse_qsl(scope['query_string'].decode('latin-1'), keep_blank_values=True))
+        self.headers = Headers([(key.decode('latin-1'), value.decode('latin-1')) for key, value in scope['headers']])
+        self.start_time = time.time()
+        self.__receive = receive
+
+    async def get_json(self):
+        body = b''
+        while True:
+            message = await self.__receive()
+            body += message.get('body', b'')
+            if not message.get('more_body', False):
+                break
+
+        return json.loads(body) if body else None
+
+
+async def get_users(request):
+    # the batch lookup is served by the WSGI app
+    if 'ids' in request.args:
+        return None
+
+    use_case = AsyncListUsersUseCase()
+    parameter = ListUsersParameter(
+        name=request.args.get('name', ''),
+        email=request.args.get('email', ''),
+        last_name=request.args.get('last_name', ''),
+        cpf=request.args.get('cpf', ''),
+        column=request.args.get('column', 'name'),
+        order=request.args.get('order', 'asc'),
+        page=request.args.get('page', 0, type=int),
+        limit=request.args.get('limit', 10, type=int),
+        with_total=request.args.get('total', 'true') != 'false',
+        cursor=request.args.get('cursor'),
+        if_none_match=request.headers.get('If-None-Match'),
+    )
+    response = await use_case.proceed(parameter)
+    if 'msg' in response:
+        return json_response(use_case, response, 400)
+
+    return conditional_response(use_case, response)
+
+async def get_user(request, id):
+    use_case = AsyncGetUserUseCase()
+    parameter = GetUserParameter(id=id, if_none_match=request.headers.get('If-None-Match'))
+    response = await use_case.proceed(parameter)
+
+    return conditional_response(use_case, response)
+
+async def create_user(request):
+    data = await request.get_json()
+    use_case = AsyncCreateUserUseCase()
+    parameter = CreateUserParameter(
+        name=data.get('name'),
+        email=data.get('email'),
+        last_name=data.get('last_name'),
+        cpf=data.get('cpf'),
+    )
+    response = await use_case.proceed(parameter)
+    if 'errors' in response:
+        return json_response(use_case, response, 400)
+
+    return json_response(use_case, response, 201)
+
+async def update_user(request, id):
+    data = await request.get_json()
+    use_case = AsyncUpdateUserUseCase()
+    parameter = UpdateUserParameter(
+        id=id,
+        name=data.get('name'),
+        email=data.get('email'),
+        cpf=data.get('cpf'),
+        last_name=data.get('last_name'),
+    )
+    response = await use_case.proceed(parameter)
+    if 'errors' in response:
+        return json_response(use_case, response, 400)
+
+    return json_response(use_case, response)
+
+async def delete_user(request, id):
+    use_case = AsyncDeleteUserUseCase()
+    parameter = DeleteUserParameter(id=id)
+    response = await use_case.proceed(parameter)
+
+    return json_response(use_case, response, 204)
+
+def json_response(use_case, response, status=200):
+    """
+    Build a (status, headers, body) response encoding the use case response once, straight to bytes
+    """
+
+    return status, [('Content-Type', 'application/json')], use_case.dumps(response)
+
+def conditional_response(use_case, response):
+    """
+    Build a 304 with no body when the client copy is current, the JSON response with its ETag otherwise
+    """
+
+    if response.get('not_modified'):
+        return 304, [('ETag', response['etag'])], b''
+
+    status, headers, body = json_response(use_case, response)
+    if 'etag' in response:
+        headers.append(('ETag', response['etag']))
+    return status, headers, body
+
+
+# the routes of setup/routes.py served by the asyncio use cases, the others go to the WSGI app
+url_map = Map([
+    Rule('/users', endpoint=get_users, methods=['GET']),
+    Rule('/users', endpoint=create_user, methods=['POST']),
+    Rule('/users/<id>', endpoint=get_user, methods=['GET']),
+    Rule('/users/<id>', endpoint=update_user, methods=['PUT']),
+    Rule('/users/<id>', endpoint=delete_user, methods=['DELETE']),
+])
+
+
+class AsgiApplication:
+    """
+    ASGI entry point serving the user CRUD routes on the asyncio repository, so a worker keeps
+    many requests in flight while they wait on the database. Every other request is handed to
+    the Flask application, run in a thread by asgiref.
+    """
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self.wsgi_app = WsgiToAsgi(flask_app)
+        self.url_adapter = url_map.bind('localhost')
+        self.flask_url_adapter = flask_app.url_map.bind('localhost')
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self.__lifespan(receive, send)
+
+        route = self.__match(scope)
+        if route is None:
+            return await self.wsgi_app(scope, receive, send)
+
+        rule, arguments = route
+        request = AsgiRequest(scope, receive)
+        query_instrumentation.start_request()
+        try:
+            result = await rule.endpoint(request, **arguments)
+        except Exception as e:
+            exceptions_total.labels(exception_type=type(e).__name__).inc()
+            result = 500, [('Content-Type', 'text/html; charset=utf-8')], "An error occurred: {}".format(str(e)).encode()
+
+        if result is None:
+            return await self.wsgi_app(scope, receive, send)
+
+        status, headers, body = result
+        if 'origin' in request.headers:
+            headers.append(('Access-Control-Allow-Origin', '*'))
+        # as werkzeug does, 204 and 304 never carry a body
+        if status in (204, 304):
+            body = b''
+        else:
+            headers.append(('Content-Length', str(len(body))))
+        self.__record_request_data(request, rule, status, len(body))
+
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(key.lower().encode('latin-1'), value.encode('latin-1')) for key, value in headers],
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+    def __match(self, scope):
+        if scope['type'] != 'http':
+            return None
+
+        try:
+            rule, arguments = self.url_adapter.match(scope['path'], scope['method'], return_rule=True)
+            # static routes such as /users/export rank above /users/<id> in the Flask map only
+            flask_rule, _ = self.flask_url_adapter.match(scope['path'], scope['method'], return_rule=True)
+        except (HTTPException, RoutingException):
+            return None
+
+        if flask_rule.rule != rule.rule:
+            return None
+        return rule, arguments
+
+    def __record_request_data(self, request, rule, status, size):
+        request_latency = time.time() - request.start_time
+        endpoint = endpoint_labels.label(rule.rule)
+        http_requests_total.labels(request.method, endpoint, status).inc()
+        http_request_duration_seconds.labels(request.method, endpoint).observe(request_latency)
+        http_request_db_duration_seconds.labels(request.method, endpoint).observe(query_instrumentation.request_time())
+        http_response_size_bytes.labels(request.method, endpoint).observe(size)
+        cache_metrics.sync()
+
+    async def __lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                # pooled asyncio connections are closed on the loop that opened them
+                await engine_registry.dispose_async()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+def create_asgi_app(flask_app):
+    return AsgiApplication(flask_app)
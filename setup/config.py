@@ -5,3 +5,14 @@ basedir = os.path.abspath(os.path.dirname(__file__))
 class Config:
     SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(basedir, 'mock_data.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # admin endpoints are disabled unless a token is configured
+    ADMIN_TOKEN = os.getenv('ADMIN_TOKEN')
+    # read cache behind the in-process user cache and of the list pages: memory, redis, file or none
+    CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'memory')
+    # redis://host:6379/0 for redis, a directory for file
+    CACHE_URL = os.getenv('CACHE_URL')
+    # json by default, pickle only for a cache no one else can write to: loading it runs code
+    CACHE_SERIALIZER = os.getenv('CACHE_SERIALIZER', 'json')
+    CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', '10000'))
+    CACHE_USER_TTL = float(os.getenv('CACHE_USER_TTL', '60'))
+    CACHE_LIST_TTL = float(os.getenv('CACHE_LIST_TTL', '10'))
@@ -0,0 +1,248 @@
+# metrics.py
+import os
+import glob
+import time
+import threading
+from prometheus_client import Counter, Histogram, Gauge, CollectorRegistry, REGISTRY, generate_latest
+from prometheus_client import multiprocess
+from prometheus_client.mmap_dict import MmapedDict
+from sqlalchemy import event
+from src.infra.cache import user_cache, CacheStats
+from src.infra.config import engine_registry, query_instrumentation
+
+# gunicorn.conf.py sets it before prometheus_client is imported, so every worker writes its
+# samples to mmap'd files in this directory and any worker can aggregate them on a scrape
+MULTIPROC_DIR_ENV = 'PROMETHEUS_MULTIPROC_DIR'
+# endpoint labels are route templates, the cap is a backstop keeping the series of a process bounded
+MAX_ENDPOINT_LABELS = int(os.getenv('METRICS_MAX_ENDPOINTS', '100'))
+OTHER_ENDPOINT = 'other'
+
+http_requests_total = Counter('http_requests_total', 'Total HTTP Requests', ['method', 'endpoint', 'http_status'])
+http_request_duration_seconds = Histogram('http_request_duration_seconds', 'HTTP request duration in seconds', ['method', 'endpoint'])
+http_response_size_bytes = Histogram('http_response_size_bytes', 'HTTP response size in bytes', ['method', 'endpoint'])
+exceptions_total = Counter('exceptions_total', 'Total exceptions raised', ['exception_type'])
+start_time = time.time()
+# the oldest worker tells the uptime, written on each scrape
+app_uptime_seconds = Gauge('app_uptime_seconds', 'Application uptime in seconds', multiprocess_mode='max')
+db_pool_checkouts_total = Counter('db_pool_checkouts_total', 'Total connections checked out from the pool', ['database'])
+db_pool_checkins_total = Counter('db_pool_checkins_total', 'Total connections returned to the pool', ['database'])
+db_pool_invalidations_total = Counter('db_pool_invalidations_total', 'Total pooled connections invalidated', ['database'])
+db_pool_checkout_wait_seconds = Histogram('db_pool_checkout_wait_seconds', 'Time waited to check out a pooled connection', ['database'], buckets=(.0005, .001, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10, 30))
+# pool gauges add up the pools of the live workers
+db_pool_checked_out = Gauge('db_pool_checked_out', 'Connections currently checked out from the pool', ['database'], multiprocess_mode='livesum')
+db_pool_overflow = Gauge('db_pool_overflow', 'Connections currently open beyond pool_size', ['database'], multiprocess_mode='livesum')
+db_query_duration_seconds = Histogram('db_query_duration_seconds', 'SQL statement execution time in seconds', ['fingerprint'], buckets=(.0005, .001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10))
+http_request_db_duration_seconds = Histogram('http_request_db_duration_seconds', 'Time spent executing SQL per HTTP request in seconds', ['method', 'endpoint'])
+cache_hits = Counter('cache_hits', 'Cache lookups answered from the cache', ['cache'])
+cache_misses = Counter('cache_misses', 'Cache lookups that went to the database', ['cache'])
+cache_evictions = Counter('cache_evictions', 'Cache entries evicted to respect the size bound', ['cache'])
+cache_entries = Gauge('cache_entries', 'Entries currently cached', ['cache'], multiprocess_mode='livesum')
+
+
+def is_multiprocess():
+    return bool(os.getenv(MULTIPROC_DIR_ENV))
+
+
+def instrument_pool(engine):
+    """
+    Attach pool event listeners exporting connection pool telemetry for an engine.
+    Gauges are written on checkout and checkin, the only moments their values change.
+    """
+
+    database = str(engine.url.database)
+
+    def update_gauges(returning=0):
+        # NullPool and SingletonThreadPool (sqlite) do not keep these counters
+        pool = engine.pool
+        if hasattr(pool, 'checkedout'):
+            db_pool_checked_out.labels(database).set(pool.checkedout() - returning)
+        if hasattr(pool, 'overflow'):
+            # a connection returned to a full pool is closed, giving back its overflow slot
+            discarded = returning if returning and pool.checkedin() >= pool.size() else 0
+            db_pool_overflow.labels(database).set(max(pool.overflow() - discarded, 0))
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        db_pool_checkouts_total.labels(database).inc()
+        wait = connection_record.info.pop('checkout_wait', None)
+        if wait is not None:
+            db_pool_checkout_wait_seconds.labels(database).observe(wait)
+        update_gauges()
+
+    def on_checkin(dbapi_connection, connection_record):
+        db_pool_checkins_total.labels(database).inc()
+        # the event runs before the pool takes the connection back
+        update_gauges(returning=1)
+
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        db_pool_invalidations_total.labels(database).inc()
+
+    event.listen(engine, 'checkout', on_checkout)
+    event.listen(engine, 'checkin', on_checkin)
+    event.listen(engine, 'invalidate', on_invalidate)
+    event.listen(engine, 'soft_invalidate', on_invalidate)
+
+
+class EndpointLabels:
+    """
+    Bounds the values of the endpoint label: the first routes seen, up to the limit, are labelled
+    with their template, any other route or a request matching none is counted as 'other'
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.__lock = threading.Lock()
+        self.__endpoints = set()
+
+    def label(self, rule):
+        if rule is None:
+            return OTHER_ENDPOINT
+        if rule in self.__endpoints:
+            return rule
+
+        with self.__lock:
+            if rule not in self.__endpoints and len(self.__endpoints) < self.limit:
+                self.__endpoints.add(rule)
+        return rule if rule in self.__endpoints else OTHER_ENDPOINT
+
+
+endpoint_labels = EndpointLabels(MAX_ENDPOINT_LABELS)
+
+
+class CountedBody:
+    """
+    Iterates the encoded body of a response, counting the bytes handed to the server. Closing it
+    closes the original iterable, a generator such as the export stream releases its connection.
+    """
+
+    def __init__(self, response):
+        self.iterable = response.response
+        self.chunks = response.iter_encoded()
+        self.size = 0
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.size += len(chunk)
+            yield chunk
+
+    def close(self):
+        if hasattr(self.iterable, 'close'):
+            self.iterable.close()
+
+
+def observe_response_size(response, histogram):
+    """
+    Observe the body size of a response without reading it: its Content-Length when known,
+    otherwise the bytes counted as the server consumes the body, observed once it is closed
+    """
+
+    if response.content_length is not None:
+        histogram.observe(response.content_length)
+        return
+
+    body = CountedBody(response)
+    response.response = body
+    response.call_on_close(lambda: histogram.observe(body.size))
+
+
+class CacheMetrics:
+    """
+    Exports cache counters as regular metrics, so they are aggregated across workers like the
+    others. The caches count in memory, each worker writes its increments since the last sync
+    at the end of every request and before a scrape.
+    """
+
+    def __init__(self, caches):
+        self.caches = caches
+        self.__lock = threading.Lock()
+        self.__synced = {}
+
+    def sync(self):
+        with self.__lock:
+            for cache in self.caches:
+                stats = cache.stats()
+                last = self.__synced.get(cache.name, CacheStats(0, 0, 0, 0))
+                cache_hits.labels(cache.name).inc(stats.hits - last.hits)
+                cache_misses.labels(cache.name).inc(stats.misses - last.misses)
+                cache_evictions.labels(cache.name).inc(stats.evictions - last.evictions)
+                cache_entries.labels(cache.name).set(stats.size)
+                self.__synced[cache.name] = stats
+
+
+cache_metrics = CacheMetrics([user_cache])
+
+engine_registry.register_hook(instrument_pool)
+query_instrumentation.add_observer(
+    lambda fingerprint, seconds: db_query_duration_seconds.labels(fingerprint).observe(seconds)
+)
+
+
+def generate_metrics():
+    """
+    Encode the metrics of the scrape. In multiprocess mode a registry is built for each scrape,
+    reading the files of every worker, live or dead, so counters and histograms add up.
+    """
+
+    app_uptime_seconds.set(time.time() - start_time)
+    cache_metrics.sync()
+
+    if not is_multiprocess():
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+def clear_multiprocess_directory(path):
+    """
+    Remove the files left by a previous run, before the first worker starts
+    """
+
+    os.makedirs(path, exist_ok=True)
+    for file in glob.glob(os.path.join(path, '*.db')) + glob.glob(os.path.join(path, '*.tmp')):
+        os.remove(file)
+
+
+def archive_worker_file(path, kind, pid):
+    """
+    Add the samples of an exited worker to the archive file of their kind and remove its file.
+    The archive is written aside and renamed over the previous one, so a scrape reads either.
+    """
+
+    source = os.path.join(path, '{}_{}.db'.format(kind, pid))
+    if not os.path.exists(source):
+        return
+
+    archive = os.path.join(path, '{}_archive.db'.format(kind))
+    values = {}
+    for file in (archive, source):
+        if os.path.exists(file):
+            for key, value, timestamp, _ in MmapedDict.read_all_values_from_file(file):
+                values[key] = values.get(key, 0.0) + value
+
+    # not matched by the *.db glob of the collector until renamed
+    temporary = archive + '.tmp'
+    merged = MmapedDict(temporary)
+    try:
+        for key, value in values.items():
+            merged.write_value(key, value, 0.0)
+    finally:
+        merged.close()
+    os.replace(temporary, archive)
+    os.remove(source)
+
+
+def mark_process_dead(pid):
+    """
+    Clean up the files of an exited worker: its gauges are dropped, its counters and histograms
+    are kept in the archive files, so recycled workers do not grow the files read by a scrape
+    """
+
+    path = os.getenv(MULTIPROC_DIR_ENV)
+    if not path:
+        return
+
+    for file in glob.glob(os.path.join(path, 'gauge_*_{}.db'.format(pid))):
+        os.remove(file)
+    for kind in ('counter', 'histogram'):
+        archive_worker_file(path, kind, pid)
@@ -1,24 +1,38 @@
 # routes.py
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, request, jsonify, Response, current_app
 from flask_cors import CORS
-from prometheus_client import Counter, generate_latest, Histogram, Gauge
+from src.infra.config import query_instrumentation
 from src.data.user.list_users import (
     ListUsersUseCase,
     ListUsersParameter
 )
 from src.data.user.create_user import CreateUserUseCase, CreateUserParameter
+from src.data.user.create_users import CreateUsersUseCase, CreateUsersParameter
+from src.data.user.export_users import ExportUsersUseCase, ExportUsersParameter
+from src.data.user.import_users import ImportUsersUseCase, ImportUsersParameter
 from src.data.user.get_user import GetUserUseCase, GetUserParameter
+from src.data.user.get_users import GetUsersUseCase, GetUsersParameter
 from src.data.user.delete_user import DeleteUserUseCase, DeleteUserParameter
 from src.data.user.update_user import UpdateUserUseCase, UpdateUserParameter
+from src.data.user.patch_user import PatchUserUseCase, PatchUserParameter
+from src.data.user.update_users import UpdateUsersUseCase, UpdateUsersParameter
+from src.data.user.delete_users import DeleteUsersUseCase, DeleteUsersParameter
+from .metrics import (
+    http_requests_total,
+    http_request_duration_seconds,
+    http_request_db_duration_seconds,
+    http_response_size_bytes,
+    exceptions_total,
+    cache_metrics,
+    endpoint_labels,
+    observe_response_size,
+    generate_metrics,
+)
+import io
+import hmac
+import json
 import time
 
-http_requests_total = Counter('http_requests_total', 'Total HTTP Requests', ['method', 'endpoint', 'http_status'])
-http_request_duration_seconds = Histogram('http_request_duration_seconds', 'HTTP request duration in seconds', ['method', 'endpoint'])
-http_response_size_bytes = Histogram('http_response_size_bytes', 'HTTP response size in bytes', ['method', 'endpoint'])
-exceptions_total = Counter('exceptions_total', 'Total exceptions raised', ['exception_type'])
-start_time = time.time()
-app_uptime_seconds = Gauge('app_uptime_seconds', 'Application uptime in seconds')
-app_uptime_seconds.set_function(lambda: time.time() - start_time)
 
 bp = Blueprint('main', __name__)
 CORS(bp)
@@ -34,38 +48,156 @@ def index():
 
 @bp.route('/users', methods=['GET'])
 def get_users():
+    if 'ids' in request.args:
+        ids = [id for id in request.args.get('ids').split(',') if id]
+        return batch_get_response(ids)
+
     use_case = ListUsersUseCase()
     parameter = ListUsersParameter(
         name=request.args.get('name', ''),
+        email=request.args.get('email', ''),
+        last_name=request.args.get('last_name', ''),
+        cpf=request.args.get('cpf', ''),
+        column=request.args.get('column', 'name'),
+        order=request.args.get('order', 'asc'),
+        page=request.args.get('page', 0, type=int),
+        limit=request.args.get('limit', 10, type=int),
+        with_total=request.args.get('total', 'true') != 'false',
+        cursor=request.args.get('cursor'),
+        if_none_match=request.headers.get('If-None-Match'),
     )
     response = use_case.proceed(parameter)
-    serialized = use_case.serialize(response)        
+    if 'msg' in response:
+        return json_response(use_case, response, 400)
+
+    return conditional_response(use_case, response)
+
+@bp.route('/users/batch-get', methods=['POST'])
+def batch_get_users():
+    data = request.get_json()
+    ids = data.get('ids') if isinstance(data, dict) else data
+    return batch_get_response(ids)
+
+def batch_get_response(ids):
+    use_case = GetUsersUseCase()
+    parameter = GetUsersParameter(ids=ids)
+    response = use_case.proceed(parameter)
+    if 'msg' in response:
+        return json_response(use_case, response, 400)
+    if not response['success']:
+        return json_response(use_case, response, 500)
 
-    return jsonify(serialized)
+    return json_response(use_case, response)
+
+@bp.route('/users/export', methods=['GET'])
+def export_users():
+    use_case = ExportUsersUseCase()
+    parameter = ExportUsersParameter(
+        name=request.args.get('name', ''),
+        email=request.args.get('email', ''),
+        last_name=request.args.get('last_name', ''),
+        cpf=request.args.get('cpf', ''),
+        column=request.args.get('column', 'name'),
+        order=request.args.get('order', 'asc'),
+        format=request.args.get('format', 'ndjson'),
+    )
+    response = use_case.proceed(parameter)
+    if not response['success']:
+        return jsonify(response), 400
+
+    mimetype = 'text/csv' if parameter.format == 'csv' else 'application/x-ndjson'
+    filename = 'users.{}'.format(parameter.format)
+    return Response(
+        response['data'],
+        mimetype=mimetype,
+        headers={'Content-Disposition': 'attachment; filename={}'.format(filename)},
+    )
 
 @bp.route('/users/<id>', methods=['GET'])
 def get_user(id):
     use_case = GetUserUseCase()
-    parameter = GetUserParameter(id=id)
+    parameter = GetUserParameter(id=id, if_none_match=request.headers.get('If-None-Match'))
     response = use_case.proceed(parameter)
-    user = use_case.serialize(response)
 
-    return jsonify(user)
+    return conditional_response(use_case, response)
 
 @bp.route('/users', methods=['POST'])
 def create_user():
     data = request.get_json()
     use_case = CreateUserUseCase()
     parameter = CreateUserParameter(
-        name=data['name'],
-        email=data['email'],
-        last_name=data['last_name'],
-        cpf=data['cpf'],
+        name=data.get('name'),
+        email=data.get('email'),
+        last_name=data.get('last_name'),
+        cpf=data.get('cpf'),
     )
     response = use_case.proceed(parameter)
-    new_user = use_case.serialize(response)
+    if 'errors' in response:
+        return json_response(use_case, response, 400)
 
-    return jsonify(new_user), 201
+    return json_response(use_case, response, 201)
+
+@bp.route('/users/bulk', methods=['POST'])
+def create_users():
+    if request.mimetype == 'application/x-ndjson':
+        users = iter_ndjson(request.stream)
+    else:
+        users = request.get_json()
+        if not isinstance(users, list):
+            return jsonify({"success": False, "data": None, "msg": "Expected a JSON array of users"}), 400
+
+    use_case = CreateUsersUseCase()
+    parameter = CreateUsersParameter(users=users)
+    response = use_case.proceed(parameter)
+    if not response['success'] and 'failed' not in response:
+        return json_response(use_case, response, 500)
+
+    return json_response(use_case, response, 201 if response['failed'] == 0 else 207)
+
+@bp.route('/users/bulk', methods=['PATCH'])
+def update_users():
+    data = request.get_json()
+    use_case = UpdateUsersUseCase()
+    if isinstance(data, list):
+        parameter = UpdateUsersParameter(users=data)
+    else:
+        data = data if isinstance(data, dict) else {}
+        parameter = UpdateUsersParameter(ids=data.get('ids'), values=data.get('set'))
+    response = use_case.proceed(parameter)
+    if 'errors' in response:
+        return json_response(use_case, response, 400)
+    if 'conflict' in response:
+        return json_response(use_case, response, 409)
+    if not response['success']:
+        return json_response(use_case, response, 500)
+
+    return json_response(use_case, response)
+
+@bp.route('/users/bulk', methods=['DELETE'])
+def delete_users():
+    data = request.get_json()
+    use_case = DeleteUsersUseCase()
+    parameter = DeleteUsersParameter(ids=data.get('ids') if isinstance(data, dict) else data)
+    response = use_case.proceed(parameter)
+    if 'msg' in response:
+        return json_response(use_case, response, 400)
+    if not response['success']:
+        return json_response(use_case, response, 500)
+
+    return json_response(use_case, response)
+
+def iter_ndjson(stream):
+    """
+    Yield one user per non blank line of a NDJSON stream, None for lines that are not valid JSON
+    """
+
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None
 
 @bp.route('/users/<id>', methods=['PUT'])
 def update_user(id):
@@ -73,28 +205,88 @@ def update_user(id):
     use_case = UpdateUserUseCase()
     parameter = UpdateUserParameter(
         id=id,
-        name=data['name'],
-        email=data['email'],
-        cpf=data['cpf'],
-        last_name=data['last_name'],
+        name=data.get('name'),
+        email=data.get('email'),
+        cpf=data.get('cpf'),
+        last_name=data.get('last_name'),
     )
     response = use_case.proceed(parameter)
-    user = use_case.serialize(response)
+    if 'errors' in response:
+        return json_response(use_case, response, 400)
 
-    return jsonify(user)
+    return json_response(use_case, response)
+
+@bp.route('/users/<id>', methods=['PATCH'])
+def patch_user(id):
+    use_case = PatchUserUseCase()
+    parameter = PatchUserParameter(
+        id=id,
+        values=request.get_json(),
+        if_match=request.headers.get('If-Match'),
+    )
+    response = use_case.proceed(parameter)
+    if 'errors' in response:
+        return json_response(use_case, response, 400)
+    if response.get('not_found'):
+        return json_response(use_case, response, 404)
+    if response.get('precondition_failed'):
+        return json_response(use_case, response, 412)
+
+    result = json_response(use_case, response)
+    if response['success']:
+        result.headers['ETag'] = response['etag']
+    return result
 
 @bp.route('/users/<id>', methods=['DELETE'])
 def delete_user(id):
     use_case = DeleteUserUseCase()
     parameter = DeleteUserParameter(id=id)
     response = use_case.proceed(parameter)
-    serialized = use_case.serialize(response)
 
-    return jsonify(serialized), 204
+    return json_response(use_case, response, 204)
+
+@bp.route('/admin/users/import', methods=['POST'])
+def import_users():
+    token = current_app.config.get('ADMIN_TOKEN')
+    if not token or not hmac.compare_digest(request.headers.get('X-Admin-Token', ''), token):
+        return jsonify({"success": False, "data": None}), 403
+
+    file_format = 'ndjson' if request.mimetype == 'application/x-ndjson' else 'csv'
+    lines = io.TextIOWrapper(io.BufferedReader(request.stream), encoding='utf-8', newline='')
+
+    use_case = ImportUsersUseCase()
+    parameter = ImportUsersParameter(
+        lines=lines,
+        format=request.args.get('format', file_format),
+        on_conflict=request.args.get('on_conflict', 'skip'),
+    )
+    response = use_case.proceed(parameter)
+
+    return json_response(use_case, response)
+
+def json_response(use_case, response, status=200):
+    """
+    Build a JSON response encoding the use case response once, straight to bytes
+    """
+
+    return Response(use_case.dumps(response), status=status, mimetype='application/json')
+
+def conditional_response(use_case, response):
+    """
+    Build a 304 with no body when the client copy is current, the JSON response with its ETag otherwise
+    """
+
+    if response.get('not_modified'):
+        return Response(status=304, headers={'ETag': response['etag']})
+
+    result = json_response(use_case, response)
+    if 'etag' in response:
+        result.headers['ETag'] = response['etag']
+    return result
 
 @bp.route('/metrics', methods=['GET'])
 def get_metrics():
-    return Response(generate_latest(), mimetype='text/plain')
+    return Response(generate_metrics(), mimetype='text/plain')
 
 
 def increment_http_requests_total(method, success):
@@ -107,13 +299,19 @@ def increment_http_requests_total(method, success):
 @bp.before_request
 def start_timer():
     request.start_time = time.time()
+    query_instrumentation.start_request()
 
 @bp.after_request
 def record_request_data(response):
     request_latency = time.time() - request.start_time
-    http_requests_total.labels(request.method, request.path, response.status_code).inc()
-    http_request_duration_seconds.labels(request.method, request.path).observe(request_latency)
-    http_response_size_bytes.labels(request.method, request.path).observe(len(response.data))
+    # labelled /users/<id>, not with the path of every user
+    endpoint = endpoint_labels.label(request.url_rule.rule if request.url_rule else None)
+    http_requests_total.labels(request.method, endpoint, response.status_code).inc()
+    http_request_duration_seconds.labels(request.method, endpoint).observe(request_latency)
+    http_request_db_duration_seconds.labels(request.method, endpoint).observe(query_instrumentation.request_time())
+    # never response.data, which would buffer a streamed body such as /users/export
+    observe_response_size(response, http_response_size_bytes.labels(request.method, endpoint))
+    cache_metrics.sync()
     return response
 
 @bp.errorhandler(Exception)
@@ -0,0 +1,84 @@
+import os
+import math
+from typing import Union
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+# cgroup v1 reports no memory limit as a page aligned LONG_MAX
+UNLIMITED_MEMORY = 1 << 62
+
+
+def read_cgroup_file(*parts: str, root: str = CGROUP_ROOT) -> Union[str, None]:
+    """
+    Reads a cgroup control file
+    :param  - parts: The path of the file below the cgroup root
+            - root: The cgroup mount point
+    :return - The stripped content, None when the file does not exist
+    """
+
+    try:
+        with open(os.path.join(root, *parts)) as file:
+            return file.read().strip()
+    except OSError:
+        return None
+
+
+def cpu_limit(root: str = CGROUP_ROOT) -> float:
+    """
+    Returns the CPUs the container may use: its CFS quota on cgroup v2 (cpu.max) or v1
+    (cpu.cfs_quota_us), else the CPUs the process is allowed to run on
+    :param  - root: The cgroup mount point
+    :return - A number of CPUs, possibly fractional
+    """
+
+    quota, period = None, None
+    cpu_max = read_cgroup_file("cpu.max", root=root)
+    if cpu_max is not None:
+        quota, period = cpu_max.split()
+    else:
+        quota = read_cgroup_file("cpu", "cpu.cfs_quota_us", root=root)
+        period = read_cgroup_file("cpu", "cpu.cfs_period_us", root=root)
+
+    if quota not in (None, "max", "-1") and period:
+        return int(quota) / int(period)
+
+    if hasattr(os, "sched_getaffinity"):
+        return float(len(os.sched_getaffinity(0)))
+    return float(os.cpu_count() or 1)
+
+
+def memory_limit(root: str = CGROUP_ROOT) -> Union[int, None]:
+    """
+    Returns the memory limit of the container from cgroup v2 (memory.max) or v1
+    (memory.limit_in_bytes)
+    :param  - root: The cgroup mount point
+    :return - The limit in bytes, None when unlimited
+    """
+
+    limit = read_cgroup_file("memory.max", root=root)
+    if limit is None:
+        limit = read_cgroup_file("memory", "memory.limit_in_bytes", root=root)
+
+    if limit in (None, "max") or int(limit) >= UNLIMITED_MEMORY:
+        return None
+    return int(limit)
+
+
+def worker_count(
+    cpus: float, memory: Union[int, None], worker_memory: int, asynchronous: bool = False
+) -> int:
+    """
+    Sizes the worker processes: 2 * CPUs + 1 for threaded workers, whose threads block on the
+    database, one per CPU for event loop workers. Either way as many as fit in the memory limit.
+    :param  - cpus: The CPUs available, see cpu_limit
+            - memory: The memory limit in bytes, None when unlimited
+            - worker_memory: The memory budget of one worker in bytes
+            - asynchronous: If workers run an event loop
+    :return - The number of workers, at least 1
+    """
+
+    cores = max(1, math.ceil(cpus))
+    workers = cores if asynchronous else 2 * cores + 1
+    if memory is not None:
+        workers = min(workers, memory // worker_memory)
+
+    return max(1, workers)
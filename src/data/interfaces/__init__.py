@@ -1 +1,2 @@
-from .user_repository_interface import UserRepositoryInterface
\ No newline at end of file
+from .user_repository_interface import UserRepositoryInterface
+from .async_user_repository_interface import AsyncUserRepositoryInterface
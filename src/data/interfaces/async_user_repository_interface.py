@@ -0,0 +1,102 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple, Union
+from src.domain.models import User
+
+
+class AsyncUserRepositoryInterface(ABC):
+    """Interface to asyncio User Repository"""
+
+    @abstractmethod
+    async def create_user(
+        cls,
+        name: str,
+        email: str,
+        last_name: str,
+        cpf: str,
+    ) -> User:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    async def get_user(cls, id: str) -> Union[User, None]:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    async def update_user(
+        cls,
+        id: str,
+        name: str,
+        email: str,
+        last_name: str,
+        cpf: str,
+    ) -> Union[User, None]:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    async def delete_user(self, id: str) -> bool:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    async def delete_user_returning(self, id: str) -> Union[User, None]:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    async def select_users(
+        cls, name: str, email: str, last_name: str, cpf: str, column: str, order: str, page: int, limit: int
+    ) -> List[User]:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    async def select_users_with_total(
+        cls,
+        name: str = "",
+        email: str = "",
+        last_name: str = "",
+        cpf: str = "",
+        column: str = "name",
+        order: str = "asc",
+        page: int = 0,
+        limit: int = 10,
+    ) -> Tuple[List[User], int]:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    async def select_users_by_cursor(
+        cls,
+        name: str = "",
+        email: str = "",
+        last_name: str = "",
+        cpf: str = "",
+        column: str = "name",
+        order: str = "asc",
+        cursor: Union[str, None] = None,
+        limit: int = 10,
+    ) -> Tuple[List[User], Union[str, None]]:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    async def count_users(
+        cls,
+        name: str = "",
+        email: str = "",
+        last_name: str = "",
+        cpf: str = "",
+    ) -> int:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
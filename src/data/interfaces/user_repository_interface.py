@@ -1,7 +1,7 @@
 from datetime import datetime, UTC
 from abc import ABC, abstractmethod
-from typing import List
-from src.domain.models import User
+from typing import Iterable, Iterator, List, Tuple, Union
+from src.domain.models import User, UserBulkResult
 
 
 class UserRepositoryInterface(ABC):
@@ -21,12 +21,30 @@ class UserRepositoryInterface(ABC):
 
         raise Exception("Method not implemented")
 
+    @abstractmethod
+    def create_users(self, users: List[dict]) -> List[UserBulkResult]:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    def import_users(self, users: Iterable[dict], on_conflict: str = "skip") -> dict:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
     @abstractmethod
     def get_user(self, id: str) -> User:
         """abstractmethod"""
 
         raise Exception("Method not implemented")
 
+    @abstractmethod
+    def get_users(self, ids: List[str]) -> List[Union[User, None]]:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
     @abstractmethod
     def update_user(
         cls,
@@ -40,6 +58,38 @@ class UserRepositoryInterface(ABC):
 
         raise Exception("Method not implemented")
 
+    @abstractmethod
+    def patch_user(
+        self, id: str, values: dict, expected: Union[dict, None] = None
+    ) -> Union[User, None]:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    def update_users(self, ids: List[str], values: dict) -> int:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    def update_users_rows(self, users: List[dict]) -> int:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    def delete_users(self, ids: List[str]) -> int:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    def delete_user_returning(self, id: str) -> Union[User, None]:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
     @abstractmethod
     def delete_user(self, id: str) -> bool:
         """abstractmethod"""
@@ -53,3 +103,50 @@ class UserRepositoryInterface(ABC):
         """abstractmethod"""
 
         raise Exception("Method not implemented")
+
+    @abstractmethod
+    def select_users_with_total(
+        cls,
+        name: str = "",
+        email: str = "",
+        last_name: str = "",
+        cpf: str = "",
+        column: str = "name",
+        order: str = "desc",
+        page: int = 0,
+        limit: int = 10,
+    ) -> Tuple[List[User], int]:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    def select_users_by_cursor(
+        cls,
+        name: str = "",
+        email: str = "",
+        last_name: str = "",
+        cpf: str = "",
+        column: str = "name",
+        order: str = "desc",
+        cursor: Union[str, None] = None,
+        limit: int = 10,
+    ) -> Tuple[List[User], Union[str, None]]:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    def stream_users(
+        cls,
+        name: str = "",
+        email: str = "",
+        last_name: str = "",
+        cpf: str = "",
+        column: str = "name",
+        order: str = "asc",
+        batch_size: int = 1000,
+    ) -> Iterator[User]:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
@@ -1 +1,2 @@
 from .use_case import CreateUserParameter, CreateUserUseCase
+from .async_use_case import AsyncCreateUserUseCase
@@ -0,0 +1,37 @@
+from src.domain.use_cases import AsyncCreateUserUseCaseInterface
+from src.domain.schemas import USER_SCHEMA
+from src.infra.repo import AsyncUserRepository
+from .use_case import CreateUserParameter
+
+
+class AsyncCreateUserUseCase(AsyncCreateUserUseCaseInterface):
+    """
+    Use case gateway for create a new User entity on the asyncio repository
+    """
+
+    repository = AsyncUserRepository()
+
+    async def proceed(self, parameter: CreateUserParameter) -> dict:
+        """
+        Proceed the execution of use case by awaiting database to create a new single entity with parameters
+        :param  - parameter: An Interfaced object with required data
+        :return - A Dictionary with formated response of the request having 'success' and 'data' objects
+        """
+
+        validation = self.validate_schema("User", parameter._asdict(), USER_SCHEMA)
+        if not validation.success:
+            return self._render_response(False, None, errors=validation.errors)
+
+        try:
+            record = await self.repository.create_user(
+                name=parameter.name,
+                email=parameter.email,
+                cpf=parameter.cpf,
+                last_name=parameter.last_name,
+            )
+
+            serialized_record = record._asdict()
+            return self._render_response(True, serialized_record)
+        except:
+            self._print_exception()
+            return self._render_response(False, None)
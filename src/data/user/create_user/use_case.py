@@ -1,5 +1,6 @@
 from typing import NamedTuple
 from src.domain.use_cases import CreateUserUseCaseInterface
+from src.domain.schemas import USER_SCHEMA
 from src.infra.repo import UserRepository
 
 class CreateUserParameter(NamedTuple):
@@ -24,6 +25,10 @@ class CreateUserUseCase(CreateUserUseCaseInterface):
         :return - A Dictionary with formated response of the request having 'success' and 'data' objects
         """
 
+        validation = self.validate_schema("User", parameter._asdict(), USER_SCHEMA)
+        if not validation.success:
+            return self._render_response(False, None, errors=validation.errors)
+
         try:
             record = self.repository.create_user(
                 name=parameter.name,
@@ -0,0 +1,92 @@
+from itertools import islice
+from typing import Iterable, Iterator, List, NamedTuple
+from src.domain.schemas import USER_SCHEMA
+from src.domain.use_cases import CreateUsersUseCaseInterface
+from src.infra.repo import UserRepository
+
+USER_FIELDS = ("name", "email", "last_name", "cpf")
+
+
+class CreateUsersParameter(NamedTuple):
+    users: Iterable[dict]
+    batch_size: int = 1000
+
+
+class CreateUsersUseCase(CreateUsersUseCaseInterface):
+    """
+    Use case gateway for create many User entities in batches
+    """
+
+    repository = UserRepository()
+
+    def proceed(self, parameter: CreateUsersParameter) -> dict:
+        """
+        Proceed the execution of use case by validating every user and calling database to create
+        the valid ones, one transaction per batch
+        :param  - parameter: An Interfaced object with required data
+        :return - A Dictionary with formated response of the request having 'success' and 'data' objects,
+                  'data' having one result per user in the request order
+        """
+
+        try:
+            results = []
+            for batch in self.__batches(parameter.users, parameter.batch_size):
+                results.extend(self.__create_batch(batch, offset=len(results)))
+
+            created = sum(1 for result in results if result["success"])
+            return self._render_response(
+                True, results, created=created, failed=len(results) - created
+            )
+        except:
+            self._print_exception()
+            return self._render_response(False, None)
+
+    def __create_batch(self, batch: List[dict], offset: int) -> List[dict]:
+        """
+        Validates a batch and creates its valid users in one repository call
+        :param  - batch: A list of user dictionaries
+                - offset: The index of the first user of the batch in the request
+        :return - A list of per user result dictionaries
+        """
+
+        results = [None] * len(batch)
+        valid_users = []
+        valid_positions = []
+
+        for position, user in enumerate(batch):
+            validation = self.validate_schema("User", user, USER_SCHEMA)
+            if validation.success:
+                valid_users.append({field: user[field] for field in USER_FIELDS})
+                valid_positions.append(position)
+            else:
+                results[position] = self.__render_item(offset + position, False, None, validation.errors)
+
+        created = self.repository.create_users(valid_users)
+        for position, result in zip(valid_positions, created):
+            if result.success:
+                results[position] = self.__render_item(offset + position, True, result.data._asdict(), [])
+            else:
+                errors = [{"entity": "User", "type": "conflict", "msg": result.error}]
+                results[position] = self.__render_item(offset + position, False, None, errors)
+
+        return results
+
+    def __render_item(self, index: int, success: bool, data, errors: list) -> dict:
+        """
+        Generate the result dictionary of a single user of the request
+        """
+
+        return {"index": index, "success": success, "data": data, "errors": errors}
+
+    def __batches(self, users: Iterable[dict], batch_size: int) -> Iterator[List[dict]]:
+        """
+        Split users in lists of batch_size, consuming the iterable lazily so streamed requests
+        are never fully held in memory
+        """
+
+        iterator = iter(users)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if len(batch) == 0:
+                return
+            yield batch
@@ -1 +1,2 @@
 from .use_case import DeleteUserParameter, DeleteUserUseCase
+from .async_use_case import AsyncDeleteUserUseCase
@@ -0,0 +1,29 @@
+from src.domain.use_cases import AsyncDeleteUserUseCaseInterface
+from src.infra.repo import AsyncUserRepository
+from .use_case import DeleteUserParameter
+
+
+class AsyncDeleteUserUseCase(AsyncDeleteUserUseCaseInterface):
+    """
+    Use case gateway for delete an existing User entity on the asyncio repository
+    """
+
+    repository = AsyncUserRepository()
+
+    async def proceed(self, parameter: DeleteUserParameter) -> dict:
+        """
+        Proceed the execution of use case by awaiting database to delete an existing entity by ID
+        :param  - parameter: An Interfaced object with required data
+        :return - A Dictionary with formated response of the request having 'success' and 'data' objects
+        """
+
+        try:
+            record = await self.repository.delete_user_returning(id=parameter.id)
+            if record is None:
+                return self._render_response(False, None)
+
+            serialized_record = record._asdict()
+            return self._render_response(True, serialized_record)
+        except:
+            self._print_exception()
+            return self._render_response(False, None)
@@ -22,16 +22,14 @@ class DeleteUserUseCase(DeleteUserUseCaseInterface):
         """
 
         try:
-
-            record = self.repository.get_user(
+            record = self.repository.delete_user_returning(
                 id=parameter.id
             )
+            if record is None:
+                return self._render_response(False, None)
 
-            success = self.repository.delete_user(
-                id=parameter.id
-            )
             serialized_record = record._asdict()
-            return self._render_response(success, serialized_record)
+            return self._render_response(True, serialized_record)
         except:
             self._print_exception()
             return self._render_response(False, None)
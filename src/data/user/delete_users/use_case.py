@@ -0,0 +1,43 @@
+from typing import List, NamedTuple
+from src.domain.use_cases import DeleteUsersUseCaseInterface
+from src.infra.repo import UserRepository
+
+MAX_IDS = 10000
+
+
+class DeleteUsersParameter(NamedTuple):
+    ids: List[str]
+
+
+class DeleteUsersUseCase(DeleteUsersUseCaseInterface):
+    """
+    Use case gateway for delete many User entities in one transaction
+    """
+
+    repository = UserRepository()
+
+    def proceed(self, parameter: DeleteUsersParameter) -> dict:
+        """
+        Proceed the execution of use case by calling database to delete every entity by ID with
+        set-based statements
+        :param  - parameter: An Interfaced object with required data
+        :return - A Dictionary with formated response of the request having 'success' and 'data' objects,
+                  'data' having the 'deleted' and 'not_found' counts
+        """
+
+        ids = parameter.ids
+        if not isinstance(ids, list) or not all(isinstance(id, str) for id in ids):
+            return self._render_response(False, None, msg="ids must be a list of strings")
+        if len(ids) == 0 or len(ids) > MAX_IDS:
+            return self._render_response(
+                False, None, msg="ids must have between 1 and {} items".format(MAX_IDS)
+            )
+
+        try:
+            deleted = self.repository.delete_users(ids=ids)
+            return self._render_response(
+                True, {"deleted": deleted, "not_found": len(set(ids)) - deleted}
+            )
+        except:
+            self._print_exception()
+            return self._render_response(False, None)
@@ -0,0 +1,90 @@
+import io
+import csv
+import json
+from typing import Iterator, NamedTuple
+from src.domain.models import User
+from src.domain.use_cases import ExportUsersUseCaseInterface
+from src.infra.repo import UserRepository
+
+EXPORT_FORMATS = ("ndjson", "csv")
+ROWS_PER_CHUNK = 500
+
+
+class ExportUsersParameter(NamedTuple):
+    name: str = ""
+    email: str = ""
+    last_name: str = ""
+    cpf: str = ""
+    column: str = "name"
+    order: str = "asc"
+    format: str = "ndjson"
+
+
+class ExportUsersUseCase(ExportUsersUseCaseInterface):
+    """
+    Use case gateway for export every User entity matching a filter
+    """
+
+    repository = UserRepository()
+
+    def proceed(self, parameter: ExportUsersParameter) -> dict:
+        """
+        Proceed the execution of use case by building a lazy stream of encoded users. The database
+        is only queried while the stream is consumed.
+        :param  - parameter: An Interfaced object with required data
+        :return - A Dictionary with formated response of the request having 'success' and 'data' objects,
+                  'data' being an iterator of text chunks
+        """
+
+        if parameter.format not in EXPORT_FORMATS:
+            return self._render_response(False, None)
+
+        try:
+            # an invalid column or order raises here, before the response starts
+            records = self.repository.stream_users(
+                name=parameter.name,
+                email=parameter.email,
+                cpf=parameter.cpf,
+                last_name=parameter.last_name,
+                column=parameter.column,
+                order=parameter.order,
+            )
+        except:
+            self._print_exception()
+            return self._render_response(False, None)
+
+        if parameter.format == "csv":
+            return self._render_response(True, self.__encode_csv(records))
+
+        return self._render_response(True, self.__encode_ndjson(records))
+
+    def __encode_ndjson(self, records: Iterator[User]) -> Iterator[str]:
+        chunk = []
+        for record in records:
+            chunk.append(self.stringify(record._asdict()))
+            if len(chunk) == ROWS_PER_CHUNK:
+                yield "\n".join(chunk) + "\n"
+                chunk = []
+
+        if len(chunk) > 0:
+            yield "\n".join(chunk) + "\n"
+
+    def __encode_csv(self, records: Iterator[User]) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+
+        # the header goes out before the first row is fetched
+        yield ",".join(User._fields) + "\n"
+
+        rows = 0
+        for record in records:
+            writer.writerow(record)
+            rows += 1
+            if rows == ROWS_PER_CHUNK:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                rows = 0
+
+        if rows > 0:
+            yield buffer.getvalue()
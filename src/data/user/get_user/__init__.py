@@ -1 +1,2 @@
 from .use_case import GetUserParameter, GetUserUseCase
+from .async_use_case import AsyncGetUserUseCase
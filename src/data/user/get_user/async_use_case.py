@@ -0,0 +1,34 @@
+from src.domain.use_cases import AsyncGetUserUseCaseInterface
+from src.infra.cache import AsyncSingleFlight
+from src.infra.repo import AsyncUserRepository
+from .use_case import GetUserParameter
+
+
+class AsyncGetUserUseCase(AsyncGetUserUseCaseInterface):
+    """
+    Use case gateway for get single User entity on the asyncio repository
+    """
+
+    repository = AsyncUserRepository()
+    single_flight = AsyncSingleFlight()
+
+    async def proceed(self, parameter: GetUserParameter) -> dict:
+        """
+        Proceed the execution of use case by awaiting database to retrieve single entity by ID,
+        answering 'not_modified' when If-None-Match holds its current ETag
+        :param  - parameter: An Interfaced object with required data
+        :return - A Dictionary with formated response of the request having 'success', 'data' and 'etag' objects
+        """
+
+        try:
+            # concurrent lookups of the same user share one read, from the database on a miss
+            record = await self.single_flight.do(parameter.id, lambda: self.repository.get_user(id=parameter.id))
+            serialized_record = record._asdict()
+            etag = self.etag(serialized_record)
+            if self.etag_matches(parameter.if_none_match, etag):
+                return self._render_response(True, None, not_modified=True, etag=etag)
+
+            return self._render_response(True, serialized_record, etag=etag)
+        except:
+            self._print_exception()
+            return self._render_response(False, None)
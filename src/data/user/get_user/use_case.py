@@ -1,9 +1,11 @@
-from typing import NamedTuple
+from typing import NamedTuple, Union
 from src.domain.use_cases import GetUserUseCaseInterface
+from src.infra.cache import SingleFlight
 from src.infra.repo import UserRepository
 
 class GetUserParameter(NamedTuple):
     id: str
+    if_none_match: Union[str, None] = None
 
 
 class GetUserUseCase(GetUserUseCaseInterface):
@@ -12,21 +14,26 @@ class GetUserUseCase(GetUserUseCaseInterface):
     """
 
     repository = UserRepository()
+    single_flight = SingleFlight()
 
     def proceed(self, parameter: GetUserParameter) -> dict:
         """
-        Proceed the execution of use case by calling database to retrieve single entity by ID
+        Proceed the execution of use case by calling database to retrieve single entity by ID,
+        through the user cache of the repository, answering 'not_modified' when If-None-Match
+        holds its current ETag
         :param  - parameter: An Interfaced object with required data
-        :return - A Dictionary with formated response of the request having 'success' and 'data' objects
+        :return - A Dictionary with formated response of the request having 'success', 'data' and 'etag' objects
         """
 
         try:
-            record = self.repository.get_user(
-                id=parameter.id
-            )
-
+            # concurrent lookups of the same user share one read, from the database on a miss
+            record = self.single_flight.do(parameter.id, lambda: self.repository.get_user(id=parameter.id))
             serialized_record = record._asdict()
-            return self._render_response(True, serialized_record)
+            etag = self.etag(serialized_record)
+            if self.etag_matches(parameter.if_none_match, etag):
+                return self._render_response(True, None, not_modified=True, etag=etag)
+
+            return self._render_response(True, serialized_record, etag=etag)
         except:
             self._print_exception()
             return self._render_response(False, None)
@@ -0,0 +1 @@
+from .use_case import GetUsersParameter, GetUsersUseCase
@@ -0,0 +1,52 @@
+from typing import List, NamedTuple
+from src.domain.use_cases import GetUsersUseCaseInterface
+from src.infra.repo import UserRepository
+
+MAX_IDS = 500
+
+
+class GetUsersParameter(NamedTuple):
+    ids: List[str]
+
+
+class GetUsersUseCase(GetUsersUseCaseInterface):
+    """
+    Use case gateway for get many User entities by ID in one call
+    """
+
+    repository = UserRepository()
+
+    def proceed(self, parameter: GetUsersParameter) -> dict:
+        """
+        Proceed the execution of use case by calling database once to retrieve every requested entity
+        :param  - parameter: An Interfaced object with required data
+        :return - A Dictionary with formated response of the request having 'success' and 'data' objects,
+                  'data' having one item per id in the request order, with 'found' False for unknown ids
+        """
+
+        ids = parameter.ids
+        if not isinstance(ids, list) or not all(isinstance(id, str) for id in ids):
+            return self._render_response(False, None, msg="ids must be a list of strings")
+        if len(ids) == 0 or len(ids) > MAX_IDS:
+            return self._render_response(
+                False, None, msg="ids must have between 1 and {} items".format(MAX_IDS)
+            )
+
+        try:
+            records = self.repository.get_users(ids=ids)
+
+            results = [
+                {
+                    "id": id,
+                    "found": record is not None,
+                    "data": record._asdict() if record is not None else None,
+                }
+                for id, record in zip(ids, records)
+            ]
+            found = sum(1 for result in results if result["found"])
+            return self._render_response(
+                True, results, found=found, missing=len(results) - found
+            )
+        except:
+            self._print_exception()
+            return self._render_response(False, None)
@@ -0,0 +1,79 @@
+import csv
+import json
+from typing import Iterable, Iterator, NamedTuple
+from src.domain.use_cases import ImportUsersUseCaseInterface
+from src.infra.repo import UserRepository
+
+USER_FIELDS = ("name", "email", "last_name", "cpf")
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportUsersParameter(NamedTuple):
+    lines: Iterable[str]
+    format: str = "csv"
+    on_conflict: str = "skip"
+
+
+class ImportUsersUseCase(ImportUsersUseCaseInterface):
+    """
+    Use case gateway for import users from CSV or NDJSON lines
+    """
+
+    repository = UserRepository()
+
+    def proceed(self, parameter: ImportUsersParameter) -> dict:
+        """
+        Proceed the execution of use case by parsing and validating lines lazily while the
+        repository loads them, so memory stays constant whatever the file size
+        :param  - parameter: An Interfaced object with required data
+        :return - A Dictionary with formated response of the request having 'success' and 'data' objects,
+                  'data' having read, inserted, updated, skipped and invalid counts
+        """
+
+        try:
+            if parameter.format == "csv":
+                records = csv.DictReader(parameter.lines)
+            elif parameter.format == "ndjson":
+                records = self.__parse_ndjson(parameter.lines)
+            else:
+                raise Exception("ImportUsers", "format must be 'csv' or 'ndjson'")
+
+            report = {"invalid": 0, "errors": []}
+            stats = self.repository.import_users(
+                self.__valid_users(records, report), on_conflict=parameter.on_conflict
+            )
+            stats["invalid"] = report["invalid"]
+            return self._render_response(True, stats, errors=report["errors"])
+        except:
+            self._print_exception()
+            return self._render_response(False, None)
+
+    def __valid_users(self, records: Iterable[dict], report: dict) -> Iterator[dict]:
+        """
+        Yield the records having every user field filled, counting the others into report and
+        keeping the first MAX_REPORTED_ERRORS of them
+        """
+
+        for record_number, record in enumerate(records, start=1):
+            missing = [
+                field for field in USER_FIELDS
+                if not isinstance(record, dict) or not isinstance(record.get(field), str) or not record[field].strip()
+            ]
+            if len(missing) == 0:
+                yield record
+                continue
+
+            report["invalid"] += 1
+            if len(report["errors"]) < MAX_REPORTED_ERRORS:
+                report["errors"].append(
+                    {"entity": "User", "record": record_number, "type": "invalid", "msg": "missing " + ", ".join(missing)}
+                )
+
+    def __parse_ndjson(self, lines: Iterable[str]) -> Iterator[dict]:
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                yield None
@@ -1 +1,2 @@
 from .use_case import ListUsersParameter, ListUsersUseCase
+from .async_use_case import AsyncListUsersUseCase
@@ -0,0 +1,98 @@
+import json
+from src.domain.use_cases import AsyncListUsersUseCaseInterface
+from src.infra.cache import read_cache, AsyncSingleFlight, USER_LIST_NAMESPACE
+from src.infra.repo import AsyncUserRepository
+from .use_case import ListUsersParameter
+
+
+class AsyncListUsersUseCase(AsyncListUsersUseCaseInterface):
+    """
+    Use case gateway for list User entity on the asyncio repository
+    """
+
+    repository = AsyncUserRepository()
+    cache = read_cache
+    single_flight = AsyncSingleFlight()
+
+    async def proceed(self, parameter: ListUsersParameter) -> dict:
+        """
+        Proceed the execution of use case by awaiting database to retrieve entities, serving
+        pages from the cache ListUsersUseCase fills. The ETag is that ListUsersUseCase computes
+        from the page served.
+        :param  - parameter: An Interfaced object with required data
+        :return - A Dictionary with formated response of the request having 'success', 'data' and 'etag' objects,
+                  and 'msg' when the cursor or sort column is invalid
+        """
+
+        try:
+            if_none_match = parameter.if_none_match
+            parameter = parameter._replace(if_none_match=None)
+            key = json.dumps(list(parameter))
+
+            # concurrent misses for the same page share one database read
+            serialized_records, extra = await self.cache.get_or_load_async(
+                USER_LIST_NAMESPACE,
+                key,
+                lambda: self.single_flight.do(key, lambda: self.__select(parameter)),
+            )
+
+            etag = self.etag(dict(extra, data=serialized_records))
+            if self.etag_matches(if_none_match, etag):
+                return self._render_response(True, None, not_modified=True, etag=etag)
+
+            return self._render_response(True, serialized_records, etag=etag, **extra)
+        except ValueError as e:
+            # an invalid cursor, or a sort column it cannot page by
+            return self._render_response(False, [], msg=str(e))
+        except:
+            self._print_exception()
+            return self._render_response(False, [])
+
+    async def __select(self, parameter: ListUsersParameter) -> tuple:
+        """
+        Select a page of users from the repository
+        :param  - parameter: An Interfaced object with required data
+        :return - A tuple of the serialized records and the extra response fields
+        """
+
+        # keyset pagination: an empty cursor starts at the first page, no total is computed
+        if parameter.cursor is not None:
+            records, next_cursor = await self.repository.select_users_by_cursor(
+                name=parameter.name,
+                email=parameter.email,
+                cpf=parameter.cpf,
+                last_name=parameter.last_name,
+                column=parameter.column,
+                order=parameter.order,
+                cursor=parameter.cursor,
+                limit=parameter.limit,
+            )
+            serialized_records = list(map(lambda item: item._asdict(), records))
+            return serialized_records, dict(next_cursor=next_cursor)
+
+        if not parameter.with_total:
+            records = await self.repository.select_users(
+                name=parameter.name,
+                email=parameter.email,
+                cpf=parameter.cpf,
+                last_name=parameter.last_name,
+                column=parameter.column,
+                order=parameter.order,
+                page=parameter.page,
+                limit=parameter.limit,
+            )
+            serialized_records = list(map(lambda item: item._asdict(), records))
+            return serialized_records, dict()
+
+        records, total_count = await self.repository.select_users_with_total(
+            name=parameter.name,
+            email=parameter.email,
+            cpf=parameter.cpf,
+            last_name=parameter.last_name,
+            column=parameter.column,
+            order=parameter.order,
+            page=parameter.page,
+            limit=parameter.limit,
+        )
+        serialized_records = list(map(lambda item: item._asdict(), records))
+        return serialized_records, dict(total=total_count)
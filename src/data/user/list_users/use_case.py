@@ -1,5 +1,7 @@
-from typing import NamedTuple
+import json
+from typing import NamedTuple, Union
 from src.domain.use_cases import ListUsersUseCaseInterface
+from src.infra.cache import read_cache, SingleFlight, USER_LIST_NAMESPACE
 from src.infra.repo import UserRepository
 
 class ListUsersParameter(NamedTuple):
@@ -11,6 +13,9 @@ class ListUsersParameter(NamedTuple):
     order: str = "asc"
     page: int = 0
     limit: int = 10
+    with_total: bool = True
+    cursor: Union[str, None] = None
+    if_none_match: Union[str, None] = None
 
 class ListUsersUseCase(ListUsersUseCaseInterface):
     """
@@ -18,35 +23,90 @@ class ListUsersUseCase(ListUsersUseCaseInterface):
     """
 
     repository = UserRepository()
+    cache = read_cache
+    single_flight = SingleFlight()
 
     def proceed(self, parameter: ListUsersParameter) -> dict:
         """
-        Proceed the execution of use case by calling database to retrieve entities
+        Proceed the execution of use case by calling database to retrieve entities, serving
+        pages already read with the same parameters from the cache. The ETag is computed from
+        the page served, so no query is run beyond the page read, and a client sending a current
+        If-None-Match gets 'not_modified' without the page being sent again.
         :param  - parameter: An Interfaced object with required data
-        :return - A Dictionary with formated response of the request having 'success' and 'data' objects
+        :return - A Dictionary with formated response of the request having 'success', 'data' and 'etag' objects,
+                  and 'msg' when the cursor or sort column is invalid
         """
 
         try:
-            
-            records = self.repository.select_users(
+            # the header is not part of the page, nor of its cache key
+            if_none_match = parameter.if_none_match
+            parameter = parameter._replace(if_none_match=None)
+            key = json.dumps(list(parameter))
+
+            # concurrent misses for the same page share one database read
+            serialized_records, extra = self.cache.get_or_load(
+                USER_LIST_NAMESPACE,
+                key,
+                lambda: self.single_flight.do(key, lambda: self.__select(parameter)),
+            )
+
+            etag = self.etag(dict(extra, data=serialized_records))
+            if self.etag_matches(if_none_match, etag):
+                return self._render_response(True, None, not_modified=True, etag=etag)
+
+            return self._render_response(True, serialized_records, etag=etag, **extra)
+        except ValueError as e:
+            # an invalid cursor, or a sort column it cannot page by
+            return self._render_response(False, [], msg=str(e))
+        except:
+            self._print_exception()
+            return self._render_response(False, [])
+
+    def __select(self, parameter: ListUsersParameter) -> tuple:
+        """
+        Select a page of users from the repository
+        :param  - parameter: An Interfaced object with required data
+        :return - A tuple of the serialized records and the extra response fields
+        """
+
+        # keyset pagination: an empty cursor starts at the first page, no total is computed
+        if parameter.cursor is not None:
+            records, next_cursor = self.repository.select_users_by_cursor(
                 name=parameter.name,
                 email=parameter.email,
                 cpf=parameter.cpf,
                 last_name=parameter.last_name,
                 column=parameter.column,
                 order=parameter.order,
-                page=parameter.page,
+                cursor=parameter.cursor,
                 limit=parameter.limit,
             )
-            
-            total_count = self.repository.count_users(
+            serialized_records = list(map(lambda item: item._asdict(), records))
+            return serialized_records, dict(next_cursor=next_cursor)
+
+        if not parameter.with_total:
+            records = self.repository.select_users(
                 name=parameter.name,
                 email=parameter.email,
                 cpf=parameter.cpf,
                 last_name=parameter.last_name,
+                column=parameter.column,
+                order=parameter.order,
+                page=parameter.page,
+                limit=parameter.limit,
             )
             serialized_records = list(map(lambda item: item._asdict(), records))
-            return self._render_response(True, serialized_records, total=total_count)
-        except:
-            self._print_exception()
-            return self._render_response(False, [])
+            return serialized_records, dict()
+
+        records, total_count = self.repository.select_users_with_total(
+            name=parameter.name,
+            email=parameter.email,
+            cpf=parameter.cpf,
+            last_name=parameter.last_name,
+            column=parameter.column,
+            order=parameter.order,
+            page=parameter.page,
+            limit=parameter.limit,
+        )
+        serialized_records = list(map(lambda item: item._asdict(), records))
+        return serialized_records, dict(total=total_count)
@@ -0,0 +1,68 @@
+from typing import NamedTuple, Union
+from src.domain.schemas import USER_PATCH_SCHEMA
+from src.domain.use_cases import PatchUserUseCaseInterface
+from src.infra.repo import UserRepository
+
+
+class PatchUserParameter(NamedTuple):
+    id: str
+    values: dict
+    if_match: Union[str, None] = None
+
+
+class PatchUserUseCase(PatchUserUseCaseInterface):
+    """
+    Use case gateway for partially update an existing User entity
+    """
+
+    repository = UserRepository()
+
+    def proceed(self, parameter: PatchUserParameter) -> dict:
+        """
+        Proceed the execution of use case by calling database to write only the supplied values.
+        With if_match, the ETag the client read, only the values that differ from the entity it
+        identifies are written, a payload changing nothing returns it without writing, and the
+        update is refused with 'precondition_failed' when the entity changed since. Without it
+        the supplied values are written, the cached entity may be stale.
+        :param  - parameter: An Interfaced object with required data
+        :return - A Dictionary with formated response of the request having 'success', 'data' and 'etag' objects
+        """
+
+        values = parameter.values if isinstance(parameter.values, dict) else {}
+        validation = self.validate_schema("User", values, USER_PATCH_SCHEMA)
+        if not validation.success:
+            return self._render_response(False, None, errors=validation.errors)
+
+        try:
+            if parameter.if_match in (None, "*") and len(values) > 0:
+                record = self.repository.patch_user(id=parameter.id, values=values)
+                if record is None:
+                    return self._render_response(False, None, not_found=True)
+
+                serialized_record = record._asdict()
+                return self._render_response(True, serialized_record, etag=self.etag(serialized_record))
+
+            record = self.repository.get_user(id=parameter.id)
+            if record is None:
+                return self._render_response(False, None, not_found=True)
+
+            current = record._asdict()
+            if parameter.if_match not in (None, "*") and parameter.if_match != self.etag(current):
+                return self._render_response(False, None, precondition_failed=True)
+
+            changes = {key: value for key, value in values.items() if current[key] != value}
+            if len(changes) == 0:
+                return self._render_response(True, current, etag=self.etag(current))
+
+            # the UPDATE itself checks the row still has the values the ETag was computed from
+            record = self.repository.patch_user(id=parameter.id, values=changes, expected=current)
+            if record is None:
+                if self.repository.get_user(id=parameter.id) is not None:
+                    return self._render_response(False, None, precondition_failed=True)
+                return self._render_response(False, None, not_found=True)
+
+            serialized_record = record._asdict()
+            return self._render_response(True, serialized_record, etag=self.etag(serialized_record))
+        except:
+            self._print_exception()
+            return self._render_response(False, None)
@@ -1 +1,2 @@
 from .use_case import UpdateUserParameter, UpdateUserUseCase
+from .async_use_case import AsyncUpdateUserUseCase
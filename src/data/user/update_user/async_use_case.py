@@ -0,0 +1,42 @@
+from src.domain.use_cases import AsyncUpdateUserUseCaseInterface
+from src.domain.schemas import USER_SCHEMA
+from src.infra.repo import AsyncUserRepository
+from .use_case import UpdateUserParameter
+
+
+class AsyncUpdateUserUseCase(AsyncUpdateUserUseCaseInterface):
+    """
+    Use case gateway for update an existing User entity on the asyncio repository
+    """
+
+    repository = AsyncUserRepository()
+
+    async def proceed(self, parameter: UpdateUserParameter) -> dict:
+        """
+        Proceed the execution of update use case by awaiting database to update a existing entity with parameters
+        :param  - parameter: An Interfaced object with required data
+        :return - A Dictionary with formated response of the request having 'success' and 'data' objects
+        """
+
+        user = parameter._asdict()
+        del user["id"]
+        validation = self.validate_schema("User", user, USER_SCHEMA)
+        if not validation.success:
+            return self._render_response(False, None, errors=validation.errors)
+
+        try:
+            record = await self.repository.update_user(
+                id=parameter.id,
+                name=parameter.name,
+                cpf=parameter.cpf,
+                email=parameter.email,
+                last_name=parameter.last_name,
+            )
+            if record is None:
+                return self._render_response(False, None)
+
+            serialized_record = record._asdict()
+            return self._render_response(True, serialized_record)
+        except:
+            self._print_exception()
+            return self._render_response(False, None)
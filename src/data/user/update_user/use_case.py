@@ -1,5 +1,6 @@
 from typing import NamedTuple
 from src.domain.use_cases import UpdateUserUseCaseInterface
+from src.domain.schemas import USER_SCHEMA
 from src.infra.repo import UserRepository
 
 class UpdateUserParameter(NamedTuple):
@@ -24,6 +25,12 @@ class UpdateUserUseCase(UpdateUserUseCaseInterface):
         :return - A Dictionary with formated response of the request having 'success' and 'data' objects
         """
 
+        user = parameter._asdict()
+        del user["id"]
+        validation = self.validate_schema("User", user, USER_SCHEMA)
+        if not validation.success:
+            return self._render_response(False, None, errors=validation.errors)
+
         try:
 
             record = self.repository.update_user(
@@ -33,6 +40,9 @@ class UpdateUserUseCase(UpdateUserUseCaseInterface):
                 email=parameter.email,
                 last_name=parameter.last_name,
             )
+            if record is None:
+                return self._render_response(False, None)
+
             serialized_record = record._asdict()
             return self._render_response(True, serialized_record)
         except:
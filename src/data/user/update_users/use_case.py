@@ -0,0 +1,94 @@
+from typing import List, NamedTuple, Union
+from src.domain.schemas import USER_PATCH_SCHEMA
+from src.domain.use_cases import UpdateUsersUseCaseInterface
+from src.infra.repo import UserRepository
+
+MAX_USERS = 10000
+
+
+class UpdateUsersParameter(NamedTuple):
+    users: Union[List[dict], None] = None
+    ids: Union[List[str], None] = None
+    values: Union[dict, None] = None
+
+
+class UpdateUsersUseCase(UpdateUsersUseCaseInterface):
+    """
+    Use case gateway for update many User entities in one transaction
+    """
+
+    repository = UserRepository()
+
+    def proceed(self, parameter: UpdateUsersParameter) -> dict:
+        """
+        Proceed the execution of use case by validating every change and calling database to apply
+        them all with set-based statements. Either 'ids' and 'values', setting the same values on
+        every user, or 'users', a list of dictionaries having the id and the values of each user.
+        :param  - parameter: An Interfaced object with required data
+        :return - A Dictionary with formated response of the request having 'success' and 'data' objects,
+                  'data' having the 'updated' and 'not_found' counts
+        """
+
+        if parameter.users is not None:
+            errors = self.__validate_users(parameter.users)
+            ids = [user.get("id") for user in parameter.users if isinstance(user, dict)]
+        else:
+            errors = self.__validate_ids(parameter.ids)
+            if len(errors) == 0:
+                values = parameter.values if isinstance(parameter.values, dict) else {}
+                errors = self.validate_schema("User", values, USER_PATCH_SCHEMA).errors
+            ids = parameter.ids
+        if len(errors) > 0:
+            return self._render_response(False, None, errors=errors)
+
+        try:
+            if parameter.users is not None:
+                updated = self.repository.update_users_rows(users=parameter.users)
+            else:
+                updated = self.repository.update_users(ids=ids, values=parameter.values)
+
+            not_found = len(set(ids)) - updated
+            return self._render_response(True, {"updated": updated, "not_found": not_found})
+        except ValueError as e:
+            return self._render_response(False, None, conflict=str(e))
+        except:
+            self._print_exception()
+            return self._render_response(False, None)
+
+    def __validate_ids(self, ids) -> list:
+        """
+        Validates the list of ids to update
+        :param  - ids: The ids of the request
+        :return - A list of errors, empty when valid
+        """
+
+        if not isinstance(ids, list) or not all(isinstance(id, str) for id in ids):
+            return [{"entity": "User", "field": "ids", "type": "invalid", "msg": "ids must be a list of strings"}]
+        if len(ids) == 0 or len(ids) > MAX_USERS:
+            msg = "ids must have between 1 and {} items".format(MAX_USERS)
+            return [{"entity": "User", "field": "ids", "type": "invalid", "msg": msg}]
+
+        return []
+
+    def __validate_users(self, users) -> list:
+        """
+        Validates every user change, reporting errors with the index of the user
+        :param  - users: The list of user changes of the request
+        :return - A list of errors, empty when valid
+        """
+
+        if not isinstance(users, list) or len(users) == 0 or len(users) > MAX_USERS:
+            msg = "users must be a list with between 1 and {} items".format(MAX_USERS)
+            return [{"entity": "User", "field": "users", "type": "invalid", "msg": msg}]
+
+        errors = []
+        for index, user in enumerate(users):
+            if not isinstance(user, dict) or not isinstance(user.get("id"), str):
+                errors.append({"index": index, "entity": "User", "field": "id", "type": "invalid", "msg": "id is required"})
+                continue
+
+            values = {key: value for key, value in user.items() if key != "id"}
+            for error in self.validate_schema("User", values, USER_PATCH_SCHEMA).errors:
+                errors.append(dict(error, index=index))
+
+        return errors
@@ -0,0 +1,7 @@
+from typing import NamedTuple, Union
+from .user import User
+
+class UserBulkResult(NamedTuple):
+    success: bool
+    data: Union[User, None] = None
+    error: Union[str, None] = None
@@ -0,0 +1,2 @@
+"""Namespace de schemas de validacao."""
+from .user_schema import USER_SCHEMA, USER_PATCH_SCHEMA
@@ -0,0 +1,18 @@
+USER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "last_name": {"type": "string", "minLength": 1},
+        "email": {"type": "string", "minLength": 3, "maxLength": 100, "pattern": "^[^@\\s]+@[^@\\s]+$"},
+        "cpf": {"type": "string", "minLength": 1},
+    },
+    "required": ["name", "last_name", "email", "cpf"],
+}
+
+# partial update: any non empty subset of the user fields, nothing else
+USER_PATCH_SCHEMA = {
+    "type": "object",
+    "properties": USER_SCHEMA["properties"],
+    "additionalProperties": False,
+    "minProperties": 1,
+}
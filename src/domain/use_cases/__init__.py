@@ -2,8 +2,20 @@
 from .base_use_case import BaseUseCaseInterface
 from .user_interfaces import (
     CreateUserUseCaseInterface,
+    CreateUsersUseCaseInterface,
+    ExportUsersUseCaseInterface,
+    ImportUsersUseCaseInterface,
     ListUsersUseCaseInterface,
     GetUserUseCaseInterface,
+    GetUsersUseCaseInterface,
     UpdateUserUseCaseInterface,
+    PatchUserUseCaseInterface,
+    UpdateUsersUseCaseInterface,
     DeleteUserUseCaseInterface,
+    DeleteUsersUseCaseInterface,
+    AsyncCreateUserUseCaseInterface,
+    AsyncListUsersUseCaseInterface,
+    AsyncGetUserUseCaseInterface,
+    AsyncUpdateUserUseCaseInterface,
+    AsyncDeleteUserUseCaseInterface,
 )
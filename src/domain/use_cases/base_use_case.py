@@ -3,10 +3,21 @@ import traceback
 import json
 import datetime
 import decimal
+import hashlib
 import jsonschema
-from typing import List
+from typing import Dict, List
 from abc import ABC, abstractmethod
 
+try:
+    import orjson
+except ImportError:  # optional, the standard json module is used without it
+    orjson = None
+
+
+# compiled validators keyed by schema identity, schemas are module constants
+MAX_CACHED_VALIDATORS = 128
+_validators: Dict[int, tuple] = {}
+
 
 class ValidateResponse:
     def __init__(self, success: bool, errors: List[str] = []) -> None:
@@ -80,12 +91,66 @@ class BaseUseCaseInterface(ABC):
 
         return json.dumps(data, cls=SerializableEncoder)
 
+    def dumps(self, data: dict) -> bytes:
+        """
+        Encodes a response straight to JSON bytes in a single pass, with orjson when installed.
+        Non serializable values like datetime and decimal are converted by SerializableEncoder,
+        exactly as serialize does, and keys are sorted like jsonify does.
+        :param  - data: A Dictionary with values
+        :return - The UTF-8 JSON document
+        """
+
+        if orjson is not None:
+            return orjson.dumps(
+                data,
+                default=_serializable_encoder.default,
+                option=orjson.OPT_SORT_KEYS
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+
+        return _compact_encoder.encode(data).encode("utf-8")
+
+    def etag(self, data: dict) -> str:
+        """
+        Builds a strong entity tag from the content of a serialized entity
+        :param  - data: A Dictionary with values
+        :return - A quoted ETag value
+        """
+
+        return '"{}"'.format(hashlib.blake2b(self.dumps(data), digest_size=16).hexdigest())
+
+    def etag_matches(self, if_none_match: str, etag: str) -> bool:
+        """
+        Checks an If-None-Match header against an entity tag, with the weak comparison the
+        header calls for
+        :param  - if_none_match: The header value, a list of ETags or '*'
+                - etag: The current ETag of the resource
+        :return - If the client copy is current and a 304 can be answered
+        """
+
+        if not if_none_match:
+            return False
+
+        opaque = etag[2:] if etag.startswith("W/") else etag
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate == "*":
+                return True
+            if candidate.startswith("W/"):
+                candidate = candidate[2:]
+            if candidate == opaque:
+                return True
+
+        return False
+
     @classmethod
     def validate_schema(
         cls, type_name: str, instance_data: dict, schema: dict
     ) -> ValidateResponse:
         """
-        Validates schema attributes for a given dictionary using jsonschema
+        Validates schema attributes for a given dictionary using jsonschema, in a single pass
+        with the compiled validator of the schema
         :param  - type_name: The name of validated instance
                 - instance_data: A dictionary data with attibutes to validate
                 - schema: A dictionary with json schema of desired attributes format of instance_data
@@ -95,11 +160,15 @@ class BaseUseCaseInterface(ABC):
         if schema is None:
             raise Exception("EntityValidate", "<schema> not implemented")
 
-        response = cls.__validate_with_draft(type_name, instance_data, schema)
-        if response.success:
-            return cls.__default_validate(type_name, instance_data, schema)
+        try:
+            validator = cls.__get_validator(schema)
+        except jsonschema.SchemaError as e:
+            return ValidateResponse(
+                success=False,
+                errors=[{"entity": type_name, "type": "invalid", "msg": str(e)}],
+            )
 
-        return response
+        return cls.__validate_with_draft(type_name, instance_data, validator)
 
     def convert_date_string_to_seconds(cls, date_string: str) -> int:
 
@@ -111,27 +180,46 @@ class BaseUseCaseInterface(ABC):
         )
         return int((date - datetime.datetime(1970, 1, 1)).total_seconds())
 
+    @classmethod
+    def __get_validator(cls, schema: dict) -> jsonschema.Draft7Validator:
+        """
+        Returns the compiled validator of a schema, checking the schema itself only once
+        :param  - schema: A dictionary with json schema, cached by identity
+        :return - A Draft7Validator
+        """
+
+        entry = _validators.get(id(schema))
+        if entry is None or entry[0] is not schema:
+            jsonschema.Draft7Validator.check_schema(schema)
+            if len(_validators) >= MAX_CACHED_VALIDATORS:
+                _validators.clear()
+            entry = (schema, jsonschema.Draft7Validator(schema))
+            _validators[id(schema)] = entry
+
+        return entry[1]
+
     @classmethod
     def __validate_with_draft(
-        cls, type_name: str, instance_data: dict, schema: dict
+        cls, type_name: str, instance_data: dict, validator: jsonschema.Draft7Validator
     ) -> ValidateResponse:
         """
         Validates schema attributes for a given dictionary using jsonschema draft validation
         :param  - type_name: The name of validated instance
                 - instance_data: A dictionary data with attibutes to validate
-                - schema: A dictionary with json schema of desired attributes format of instance_data
+                - validator: The compiled validator of the desired attributes format of instance_data
         :return - A response object having operation result and possible erros found
         """
 
         errors = []
-        draft = jsonschema.Draft7Validator(schema)
-        for error in sorted(draft.iter_errors(instance_data), key=str):
+        for error in sorted(validator.iter_errors(instance_data), key=str):
             errors.append(
                 {
                     "entity": type_name,
                     "field": error.path.pop()
                     if len(error.path) > 0
-                    else error.message.split("'")[1].split("'")[0],
+                    else error.message.split("'")[1].split("'")[0]
+                    if "'" in error.message
+                    else None,
                     "type": "invalid",
                     "msg": error.message,
                 }
@@ -139,27 +227,6 @@ class BaseUseCaseInterface(ABC):
 
         return ValidateResponse(success=(len(errors) == 0), errors=errors)
 
-    @classmethod
-    def __default_validate(
-        cls, type_name: str, instance_data: dict, schema: dict
-    ) -> ValidateResponse:
-        """
-        Validates schema attributes for a given dictionary using jsonschema default validation
-        :param  - type_name: The name of validated instance
-                - instance_data: A dictionary data with attibutes to validate
-                - schema: A dictionary with json schema of desired attributes format of instance_data
-        :return - A response object having operation result and possible erros found
-        """
-
-        try:
-            jsonschema.validate(instance_data, schema)
-            return ValidateResponse(success=True, errors=[])
-        except Exception as e:
-            return ValidateResponse(
-                success=False,
-                errors=[{"entity": type_name, "type": "invalid", "msg": str(e)}],
-            )
-
 
 class SerializableEncoder(json.JSONEncoder):
     """An encoder to serialize values for a valid json format"""
@@ -246,3 +313,7 @@ class SerializableEncoder(json.JSONEncoder):
                 return int(instance)
 
         return super(SerializableEncoder, self).default(instance)
+
+
+_serializable_encoder = SerializableEncoder()
+_compact_encoder = SerializableEncoder(sort_keys=True, separators=(",", ":"))
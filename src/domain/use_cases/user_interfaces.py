@@ -7,6 +7,24 @@ class CreateUserUseCaseInterface(BaseUseCaseInterface):
     pass
 
 
+class CreateUsersUseCaseInterface(BaseUseCaseInterface):
+    """Interface to CreateUsersUseCase use case"""
+
+    pass
+
+
+class ExportUsersUseCaseInterface(BaseUseCaseInterface):
+    """Interface to ExportUsersUseCase use case"""
+
+    pass
+
+
+class ImportUsersUseCaseInterface(BaseUseCaseInterface):
+    """Interface to ImportUsersUseCase use case"""
+
+    pass
+
+
 class ListUsersUseCaseInterface(BaseUseCaseInterface):
     """Interface to ListUsersUseCase use case"""
 
@@ -19,13 +37,67 @@ class GetUserUseCaseInterface(BaseUseCaseInterface):
     pass
 
 
+class GetUsersUseCaseInterface(BaseUseCaseInterface):
+    """Interface to GetUsersUseCase use case"""
+
+    pass
+
+
 class UpdateUserUseCaseInterface(BaseUseCaseInterface):
     """Interface to UpdateUserUseCase use case"""
 
     pass
 
 
+class PatchUserUseCaseInterface(BaseUseCaseInterface):
+    """Interface to PatchUserUseCase use case"""
+
+    pass
+
+
+class UpdateUsersUseCaseInterface(BaseUseCaseInterface):
+    """Interface to UpdateUsersUseCase use case"""
+
+    pass
+
+
 class DeleteUserUseCaseInterface(BaseUseCaseInterface):
     """Interface to DeleteUserUseCase use case"""
 
     pass
+
+
+class DeleteUsersUseCaseInterface(BaseUseCaseInterface):
+    """Interface to DeleteUsersUseCase use case"""
+
+    pass
+
+
+class AsyncCreateUserUseCaseInterface(BaseUseCaseInterface):
+    """Interface to AsyncCreateUserUseCase use case"""
+
+    pass
+
+
+class AsyncListUsersUseCaseInterface(BaseUseCaseInterface):
+    """Interface to AsyncListUsersUseCase use case"""
+
+    pass
+
+
+class AsyncGetUserUseCaseInterface(BaseUseCaseInterface):
+    """Interface to AsyncGetUserUseCase use case"""
+
+    pass
+
+
+class AsyncUpdateUserUseCaseInterface(BaseUseCaseInterface):
+    """Interface to AsyncUpdateUserUseCase use case"""
+
+    pass
+
+
+class AsyncDeleteUserUseCaseInterface(BaseUseCaseInterface):
+    """Interface to AsyncDeleteUserUseCase use case"""
+
+    pass
@@ -0,0 +1,30 @@
+"""Namespace de caches de leitura."""
+import os
+from src.infra.config import engine_registry
+from .lru_cache import CacheStats, TTLLRUCache
+from .backends import (
+    CacheBackend,
+    NullCacheBackend,
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    FileCacheBackend,
+    build_cache_backend,
+)
+from .namespaced_cache import NamespacedCache
+from .single_flight import SingleFlight, AsyncSingleFlight
+from .invalidation import CacheInvalidationListener, USER_NAMESPACE, USER_LIST_NAMESPACE
+
+user_cache = TTLLRUCache(
+    "user",
+    maxsize=int(os.getenv("USER_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("USER_CACHE_TTL", "60")),
+)
+
+# users and list pages, shared by the replicas on the redis and file backends; its backend is
+# configured by create_app from setup/config.py
+read_cache = NamespacedCache(InMemoryCacheBackend())
+
+user_cache_invalidation = CacheInvalidationListener([user_cache], read_cache)
+
+# registered after engine_registry.after_fork, so the child listener connects through a fresh pool
+os.register_at_fork(after_in_child=user_cache_invalidation.after_fork)
@@ -0,0 +1,301 @@
+import os
+import mmap
+import time
+import fcntl
+import struct
+import hashlib
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Union
+
+EXPIRES_AT = struct.Struct("<d")
+
+
+class CacheBackend(ABC):
+    """Byte store with per key TTLs used by NamespacedCache"""
+
+    @abstractmethod
+    def get(self, key: str) -> Union[bytes, None]:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+    @abstractmethod
+    def counter(self, key: str) -> int:
+        """abstractmethod"""
+
+        raise Exception("Method not implemented")
+
+
+class NullCacheBackend(CacheBackend):
+    """Backend that stores nothing, every read is a miss"""
+
+    def get(self, key: str) -> Union[bytes, None]:
+        return None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        pass
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        return False
+
+    def delete(self, *keys: str) -> None:
+        pass
+
+    def incr(self, key: str) -> int:
+        return 0
+
+    def counter(self, key: str) -> int:
+        return 0
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Bounded LRU store private to the process, kept coherent across replicas by LISTEN/NOTIFY"""
+
+    def __init__(self, maxsize: int = 10000) -> None:
+        self.maxsize = maxsize
+        self.__entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.__counters: dict = {}
+        self.__lock = threading.Lock()
+
+    def get(self, key: str) -> Union[bytes, None]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self.__entries[key]
+                return None
+            self.__entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self.__lock:
+            self.__set(key, value, ttl)
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                return False
+            self.__set(key, value, ttl)
+            return True
+
+    def delete(self, *keys: str) -> None:
+        with self.__lock:
+            for key in keys:
+                self.__entries.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self.__lock:
+            self.__counters[key] = self.__counters.get(key, 0) + 1
+            return self.__counters[key]
+
+    def counter(self, key: str) -> int:
+        return self.__counters.get(key, 0)
+
+    def __set(self, key: str, value: bytes, ttl: float) -> None:
+        self.__entries[key] = (value, time.monotonic() + ttl)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.maxsize:
+            self.__entries.popitem(last=False)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Store shared by every replica on a Redis protocol server (Redis, KeyDB, Valkey...)"""
+
+    def __init__(self, url: str) -> None:
+        # optional dependency, only needed when this backend is configured
+        import redis
+
+        self.client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+    def get(self, key: str) -> Union[bytes, None]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.client.set(key, value, px=max(1, int(ttl * 1000)))
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        return bool(self.client.set(key, value, px=max(1, int(ttl * 1000)), nx=True))
+
+    def delete(self, *keys: str) -> None:
+        if len(keys) > 0:
+            self.client.delete(*keys)
+
+    def incr(self, key: str) -> int:
+        return self.client.incr(key)
+
+    def counter(self, key: str) -> int:
+        return int(self.client.get(key) or 0)
+
+
+class FileCacheBackend(CacheBackend):
+    """
+    Store shared by the worker processes of a single node. Each entry is a file holding its
+    expiry time followed by the value, replaced atomically on write and read through mmap.
+    """
+
+    PURGE_EVERY = 1000
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.__writes = 0
+
+    def get(self, key: str) -> Union[bytes, None]:
+        path = self.__path(key)
+        try:
+            with open(path, "rb") as file:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    (expires_at,) = EXPIRES_AT.unpack_from(data)
+                    if expires_at > time.time():
+                        return data[EXPIRES_AT.size:]
+        except (FileNotFoundError, ValueError, struct.error):
+            return None
+
+        self.__unlink(path)
+        return None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.__write(self.__path(key), value, ttl)
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        with self.__locked():
+            if self.get(key) is not None:
+                return False
+            self.__write(self.__path(key), value, ttl)
+            return True
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.__unlink(self.__path(key))
+
+    def incr(self, key: str) -> int:
+        with self.__locked():
+            value = self.counter(key) + 1
+            self.__replace(self.__path(key, ".counter"), str(value).encode())
+            return value
+
+    def counter(self, key: str) -> int:
+        try:
+            with open(self.__path(key, ".counter"), "rb") as file:
+                return int(file.read() or b"0")
+        except FileNotFoundError:
+            return 0
+
+    def purge_expired(self) -> None:
+        """
+        Removes expired entries, including the ones left behind by namespace invalidations
+        :param  - None
+        :return - None
+        """
+
+        now = time.time()
+        for name in os.listdir(self.directory):
+            if not name.endswith(".entry"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, "rb") as file:
+                    (expires_at,) = EXPIRES_AT.unpack(file.read(EXPIRES_AT.size))
+            except (FileNotFoundError, struct.error):
+                continue
+            if expires_at <= now:
+                self.__unlink(path)
+
+    def __write(self, path: str, value: bytes, ttl: float) -> None:
+        self.__replace(path, EXPIRES_AT.pack(time.time() + ttl) + value)
+
+        self.__writes += 1
+        if self.__writes % self.PURGE_EVERY == 0:
+            self.purge_expired()
+
+    def __replace(self, path: str, data: bytes) -> None:
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temporary_path, path)
+        except:
+            self.__unlink(temporary_path)
+            raise
+
+    def __path(self, key: str, suffix: str = ".entry") -> str:
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + suffix)
+
+    def __locked(self):
+        # one lock for the directory, only add and incr take it
+        return _FileLock(os.path.join(self.directory, "cache.lock"))
+
+    @staticmethod
+    def __unlink(path: str) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+class _FileLock:
+    """Exclusive flock held for the duration of a with block, across processes"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.file = None
+
+    def __enter__(self):
+        self.file = open(self.path, "a")
+        fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        self.file.close()
+
+
+def build_cache_backend(name: str, url: Union[str, None] = None, maxsize: int = 10000) -> CacheBackend:
+    """
+    Builds the backend selected by configuration
+    :param  - name: memory, redis, file or none
+            - url: The Redis URL, or the directory of the file backend
+            - maxsize: Entry bound of the memory backend
+    :return - A CacheBackend
+    """
+
+    if name == "memory":
+        return InMemoryCacheBackend(maxsize=maxsize)
+    if name == "redis":
+        return RedisCacheBackend(url or "redis://localhost:6379/0")
+    if name == "file":
+        return FileCacheBackend(url or os.path.join(tempfile.gettempdir(), "users-cache"))
+    if name == "none":
+        return NullCacheBackend()
+
+    raise ValueError("Unknown cache backend: {}".format(name))
@@ -0,0 +1,114 @@
+import threading
+from typing import List, Union
+from sqlalchemy.engine import Engine
+from src.infra.notifications import (
+    ALL_USERS,
+    USERS_CHANGED_CHANNEL,
+    PostgresNotificationListener,
+    in_process_bus,
+)
+from .lru_cache import TTLLRUCache
+from .namespaced_cache import NamespacedCache
+
+USER_NAMESPACE = "user"
+USER_LIST_NAMESPACE = "user_list"
+
+
+class CacheInvalidationListener:
+    """
+    Evicts users changed by any replica from the local caches. On PostgreSQL each worker
+    process keeps one LISTEN connection; other databases use the in-process bus stand-in.
+    The read cache has its user keys deleted and its list pages invalidated.
+    """
+
+    def __init__(
+        self, caches: List[TTLLRUCache], read_cache: Union[NamespacedCache, None] = None
+    ) -> None:
+        self.caches = caches
+        self.read_cache = read_cache
+        self.__lock = threading.Lock()
+        self.__engine: Union[Engine, None] = None
+        self.__listener: Union[PostgresNotificationListener, None] = None
+        self.__subscribed = False
+
+    def start(self, engine: Engine) -> None:
+        """
+        Starts listening for user changes, once per process
+        :param  - engine: The sqlalchemy Engine of the users database
+        :return - None
+        """
+
+        with self.__lock:
+            self.__engine = engine
+            if engine.dialect.name == "postgresql":
+                if self.__listener is None:
+                    self.__listener = PostgresNotificationListener(
+                        engine,
+                        USERS_CHANGED_CHANNEL,
+                        self.handle_notification,
+                        # notifications sent while disconnected are lost
+                        on_reconnect=self.clear,
+                    )
+                self.__listener.start()
+            elif not self.__subscribed:
+                in_process_bus.subscribe(self.handle_notification)
+                self.__subscribed = True
+
+    def stop(self) -> None:
+        with self.__lock:
+            if self.__listener is not None:
+                self.__listener.stop()
+                self.__listener = None
+            if self.__subscribed:
+                in_process_bus.unsubscribe(self.handle_notification)
+                self.__subscribed = False
+
+    def after_fork(self) -> None:
+        """
+        Restarts the listener thread in a forked child, threads are not inherited
+        :param  - None
+        :return - None
+        """
+
+        self.__lock = threading.Lock()
+        if self.__listener is not None:
+            self.__listener = None
+            self.start(self.__engine)
+
+    def handle_notification(self, channel: str, payload: str) -> None:
+        """
+        Evicts the users of a notification payload from every cache
+        :param  - channel: The notification channel
+                - payload: Comma separated user ids, or ALL_USERS
+        :return - None
+        """
+
+        if channel != USERS_CHANGED_CHANNEL:
+            return
+        if payload == ALL_USERS:
+            self.clear()
+            return
+
+        self.evict([id for id in payload.split(",") if id])
+
+    def evict(self, ids: List[str]) -> None:
+        """
+        Evicts changed users from every cache and invalidates the cached list pages
+        :param  - ids: The changed user ids, may be empty when only lists are affected
+        :return - None
+        """
+
+        # the read cache first: the user caches load from it, a read racing with the eviction of
+        # a user cache is discarded by its invalidation check
+        if self.read_cache is not None:
+            self.read_cache.delete(USER_NAMESPACE, *ids)
+            self.read_cache.invalidate(USER_LIST_NAMESPACE)
+        for cache in self.caches:
+            cache.delete(*ids)
+
+    def clear(self) -> None:
+        if self.read_cache is not None:
+            self.read_cache.invalidate(USER_NAMESPACE)
+            self.read_cache.invalidate(USER_LIST_NAMESPACE)
+        for cache in self.caches:
+            cache.clear()
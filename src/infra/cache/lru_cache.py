@@ -0,0 +1,141 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable, NamedTuple
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class TTLLRUCache:
+    """Bounded, thread safe in-process LRU cache whose entries expire after ttl seconds"""
+
+    def __init__(self, name: str, maxsize: int = 10000, ttl: float = 60.0) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.__entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__invalidations = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def get(self, key: Hashable, default=None):
+        """
+        Returns a fresh cached value, moving it to the most recently used position
+        :param  - key: The cache key
+                - default: Value returned when the key is missing or expired
+        :return - The cached value or default
+        """
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+                return entry[0]
+
+            if entry is not None:
+                del self.__entries[key]
+            self.__misses += 1
+            return default
+
+    def set(self, key: Hashable, value) -> None:
+        """
+        Stores a value, evicting the least recently used entries beyond maxsize
+        :param  - key: The cache key
+                - value: The value to cache
+        :return - None
+        """
+
+        with self.__lock:
+            self.__set(key, value)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], any]):
+        """
+        Read-through lookup. A value loaded while an invalidation happened is returned but not
+        cached, so a read racing with a write never stores the stale row.
+        :param  - key: The cache key
+                - loader: Callable returning the value on a miss, None results are not cached
+        :return - The cached or loaded value
+        """
+
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+
+        invalidations = self.__invalidations
+        value = loader()
+        if value is not None:
+            with self.__lock:
+                if invalidations == self.__invalidations:
+                    self.__set(key, value)
+
+        return value
+
+    async def get_or_load_async(self, key: Hashable, loader: Callable[[], Awaitable[any]]):
+        """
+        Read-through lookup awaiting the loader, with the invalidation check of get_or_load
+        :param  - key: The cache key
+                - loader: Callable returning an awaitable of the value on a miss, None results are not cached
+        :return - The cached or loaded value
+        """
+
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+
+        invalidations = self.__invalidations
+        value = await loader()
+        if value is not None:
+            with self.__lock:
+                if invalidations == self.__invalidations:
+                    self.__set(key, value)
+
+        return value
+
+    def delete(self, *keys: Hashable) -> None:
+        """
+        Invalidates keys
+        :param  - keys: The cache keys to remove
+        :return - None
+        """
+
+        with self.__lock:
+            self.__invalidations += 1
+            for key in keys:
+                self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Invalidates every key
+        :param  - None
+        :return - None
+        """
+
+        with self.__lock:
+            self.__invalidations += 1
+            self.__entries.clear()
+
+    def stats(self) -> CacheStats:
+        """
+        Returns the hit, miss and eviction counters and the current size
+        :param  - None
+        :return - A CacheStats
+        """
+
+        return CacheStats(self.__hits, self.__misses, self.__evictions, len(self.__entries))
+
+    def __set(self, key: Hashable, value) -> None:
+        self.__entries[key] = (value, time.monotonic() + self.ttl)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.maxsize:
+            self.__entries.popitem(last=False)
+            self.__evictions += 1
@@ -0,0 +1,209 @@
+import json
+import pickle
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Union
+from .backends import CacheBackend
+
+try:
+    import orjson
+except ImportError:  # optional, the standard json module is used without it
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# stored by delete so a value loaded before the write cannot be cached right after it
+TOMBSTONE = b"\x00tombstone"
+TOMBSTONE_TTL = 5.0
+
+# json is the default: the cached pages are plain lists and dicts, and loading a pickle from a
+# shared backend runs whatever code its writer put there, so pickle is opt-in
+SERIALIZERS = {
+    "json": (
+        (orjson.dumps, orjson.loads)
+        if orjson is not None
+        else (lambda value: json.dumps(value).encode("utf-8"), json.loads)
+    ),
+    "pickle": (lambda value: pickle.dumps(value, pickle.HIGHEST_PROTOCOL), pickle.loads),
+}
+
+
+class NamespacedCache:
+    """
+    Read cache storing serialized values on a pluggable CacheBackend. Keys live in namespaces
+    whose generation is part of every key, so a namespace is invalidated in one increment and
+    its old entries are left to expire. Backend errors are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttls: Union[Dict[str, float], None] = None,
+        default_ttl: float = 60.0,
+        serializer: str = "json",
+        prefix: str = "users",
+    ) -> None:
+        self.prefix = prefix
+        self.configure(backend, ttls, default_ttl, serializer)
+
+    def configure(
+        self,
+        backend: CacheBackend,
+        ttls: Union[Dict[str, float], None] = None,
+        default_ttl: float = 60.0,
+        serializer: str = "json",
+    ) -> None:
+        """
+        Replaces the backend and the expiration settings
+        :param  - backend: The CacheBackend storing the values
+                - ttls: Seconds to live by namespace
+                - default_ttl: Seconds to live of namespaces missing from ttls
+                - serializer: json or pickle
+        :return - None
+        """
+
+        if serializer not in SERIALIZERS:
+            raise ValueError("Unknown cache serializer: {}".format(serializer))
+
+        self.backend = backend
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.__dumps, self.__loads = SERIALIZERS[serializer]
+
+    def get(self, namespace: str, key: str, default=None):
+        """
+        Returns a cached value
+        :param  - namespace: The namespace of the key
+                - key: The cache key
+                - default: Value returned on a miss
+        :return - The cached value or default
+        """
+
+        try:
+            data = self.backend.get(self.__key(namespace, self.__generation(namespace), key))
+        except Exception:
+            logger.exception("Cache backend read failed")
+            return default
+
+        if data is None or data == TOMBSTONE:
+            return default
+        return self.__loads(data)
+
+    def set(self, namespace: str, key: str, value, ttl: Union[float, None] = None) -> None:
+        """
+        Stores a value
+        :param  - namespace: The namespace of the key
+                - key: The cache key
+                - value: A serializable value
+                - ttl: Seconds to live, the namespace ttl by default
+        :return - None
+        """
+
+        try:
+            self.backend.set(
+                self.__key(namespace, self.__generation(namespace), key),
+                self.__dumps(value),
+                ttl or self.ttl(namespace),
+            )
+        except Exception:
+            logger.exception("Cache backend write failed")
+
+    def get_or_load(self, namespace: str, key: str, loader: Callable[[], any]):
+        """
+        Read-through lookup. The loaded value is stored under the generation read before loading
+        and only if no delete happened meanwhile, so a read racing with a write never caches
+        the stale value.
+        :param  - namespace: The namespace of the key
+                - key: The cache key
+                - loader: Callable returning the value on a miss, None results are not cached
+        :return - The cached or loaded value
+        """
+
+        try:
+            cache_key = self.__key(namespace, self.__generation(namespace), key)
+            data = self.backend.get(cache_key)
+        except Exception:
+            logger.exception("Cache backend read failed")
+            return loader()
+
+        if data is not None and data != TOMBSTONE:
+            return self.__loads(data)
+
+        value = loader()
+        if value is not None and data is None:
+            try:
+                self.backend.add(cache_key, self.__dumps(value), self.ttl(namespace))
+            except Exception:
+                logger.exception("Cache backend write failed")
+
+        return value
+
+    async def get_or_load_async(self, namespace: str, key: str, loader: Callable[[], Awaitable[any]]):
+        """
+        Read-through lookup awaiting the loader, with the race check of get_or_load. The backend
+        calls run in a thread, the redis and file backends block.
+        :param  - namespace: The namespace of the key
+                - key: The cache key
+                - loader: Callable returning an awaitable of the value on a miss, None results are not cached
+        :return - The cached or loaded value
+        """
+
+        try:
+            cache_key = await asyncio.to_thread(
+                lambda: self.__key(namespace, self.__generation(namespace), key)
+            )
+            data = await asyncio.to_thread(self.backend.get, cache_key)
+        except Exception:
+            logger.exception("Cache backend read failed")
+            return await loader()
+
+        if data is not None and data != TOMBSTONE:
+            return self.__loads(data)
+
+        value = await loader()
+        if value is not None and data is None:
+            try:
+                await asyncio.to_thread(self.backend.add, cache_key, self.__dumps(value), self.ttl(namespace))
+            except Exception:
+                logger.exception("Cache backend write failed")
+
+        return value
+
+    def delete(self, namespace: str, *keys: str) -> None:
+        """
+        Invalidates keys of a namespace
+        :param  - namespace: The namespace of the keys
+                - keys: The cache keys
+        :return - None
+        """
+
+        try:
+            generation = self.__generation(namespace)
+            for key in keys:
+                self.backend.set(self.__key(namespace, generation, key), TOMBSTONE, TOMBSTONE_TTL)
+        except Exception:
+            logger.exception("Cache backend delete failed")
+
+    def invalidate(self, namespace: str) -> None:
+        """
+        Invalidates every key of a namespace at once
+        :param  - namespace: The namespace to invalidate
+        :return - None
+        """
+
+        try:
+            self.backend.incr(self.__generation_key(namespace))
+        except Exception:
+            logger.exception("Cache backend invalidation failed")
+
+    def ttl(self, namespace: str) -> float:
+        return self.ttls.get(namespace, self.default_ttl)
+
+    def __generation(self, namespace: str) -> int:
+        return self.backend.counter(self.__generation_key(namespace))
+
+    def __generation_key(self, namespace: str) -> str:
+        return "{}:{}:generation".format(self.prefix, namespace)
+
+    def __key(self, namespace: str, generation: int, key: str) -> str:
+        return "{}:{}:{}:{}".format(self.prefix, namespace, generation, key)
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls sharing a key: the first caller runs the function and the
+    callers arriving while it runs wait for and share its result or exception
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, function: Callable[[], any]):
+        """
+        Runs function once for all the concurrent callers of key
+        :param  - key: Identifies identical calls
+                - function: Callable producing the result, treat the result as read only
+        :return - The result of function
+        """
+
+        with self.__lock:
+            call = self.__calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.__calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        return len(self.__calls)
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight for coroutines on one event loop: the first caller starts a task running the
+    function and the callers arriving while it runs await the same task
+    """
+
+    def __init__(self) -> None:
+        self.__calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[any]]):
+        """
+        Awaits function once for all the concurrent callers of key
+        :param  - key: Identifies identical calls
+                - function: Callable returning an awaitable of the result, treat the result as read only
+        :return - The result of function
+        """
+
+        call = self.__calls.get(key)
+        if call is None:
+            call = self.__calls[key] = asyncio.ensure_future(function())
+            call.add_done_callback(lambda _: self.__calls.pop(key, None))
+
+        # a cancelled caller does not cancel the call the others are awaiting
+        return await asyncio.shield(call)
+
+    def in_flight(self) -> int:
+        return len(self.__calls)
@@ -1,2 +1,9 @@
 from .db_base import Base
-from .db_config import DBConnectionHandler
+from .db_config import DBConnectionHandler, default_connection_string
+from .db_async_config import AsyncDBConnectionHandler
+from .db_engines import EngineRegistry, TimedQueuePool, engine_registry, async_connection_string
+from .db_instrumentation import (
+    FINGERPRINT_OPTION,
+    QueryInstrumentation,
+    query_instrumentation,
+)
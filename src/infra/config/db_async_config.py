@@ -0,0 +1,33 @@
+from typing import Union
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from .db_config import default_connection_string
+from .db_engines import engine_registry
+
+
+class AsyncDBConnectionHandler:
+    """Sqlalchemy asyncio database connection, the awaitable counterpart of DBConnectionHandler"""
+
+    def __init__(self, connection_string: Union[str, None] = None):
+
+        self.__connection_string = default_connection_string()
+        if connection_string is not None:
+            self.__connection_string = connection_string
+
+        self.engine = self.get_engine()
+        # rows stay readable after commit without another round trip
+        self.session = AsyncSession(bind=self.engine, expire_on_commit=False)
+
+    def get_engine(self) -> AsyncEngine:
+        """Return asyncio connection Engine, shared by every handler with the same connection string
+        :parram - None
+        :return - asyncio engine connection to Database
+        """
+
+        return engine_registry.get_async_engine(self.__connection_string)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.session is not None:
+            await self.session.close()
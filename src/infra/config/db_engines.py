@@ -0,0 +1,196 @@
+import os
+import time
+import atexit
+import threading
+from typing import Callable, Dict, List
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import QueuePool
+
+# asyncio drivers used for the synchronous drivers of the application URLs
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_connection_string(connection_string: str) -> str:
+    """
+    Converts a database URL to the asyncio driver of its backend, postgresql to asyncpg and
+    sqlite to aiosqlite. URLs already naming an asyncio driver are returned unchanged.
+    :param  - connection_string: The database URL
+    :return - The database URL for create_async_engine
+    """
+
+    url = make_url(connection_string)
+    if url.get_driver_name() in ("asyncpg", "aiosqlite"):
+        return connection_string
+
+    return str(url.set(drivername=ASYNC_DRIVERS[url.get_backend_name()]))
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that stores on each connection record how long its checkout waited"""
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        record = super()._do_get()
+        record.info["checkout_wait"] = time.perf_counter() - started_at
+        return record
+
+
+class EngineRegistry:
+    """Process-wide registry of pooled sqlalchemy engines keyed by connection string"""
+
+    def __init__(self) -> None:
+        self.__lock = threading.RLock()
+        self.__engines: Dict[str, Engine] = {}
+        self.__async_engines: Dict[str, AsyncEngine] = {}
+        self.__hooks: List[Callable[[Engine], None]] = []
+        self.__orphaned_pools: list = []
+
+    def get_engine(self, connection_string: str, echo: bool = False) -> Engine:
+        """
+        Returns the shared engine for a connection string, creating it on first use
+        :param  - connection_string: The database URL
+                - echo: Whether the engine logs every statement (only honoured on creation)
+        :return - A pooled sqlalchemy Engine
+        """
+
+        engine = self.__engines.get(connection_string)
+        if engine is not None:
+            return engine
+
+        with self.__lock:
+            engine = self.__engines.get(connection_string)
+            if engine is None:
+                engine = create_engine(
+                    connection_string,
+                    echo=echo,
+                    **self.pool_options(connection_string),
+                )
+                for hook in self.__hooks:
+                    hook(engine)
+                self.__engines[connection_string] = engine
+
+        return engine
+
+    def get_async_engine(self, connection_string: str) -> AsyncEngine:
+        """
+        Returns the shared asyncio engine for a connection string, creating it on first use.
+        Hooks receive its synchronous facade, where event listeners are attached.
+        :param  - connection_string: The database URL, converted to the asyncio driver of its backend
+        :return - A pooled sqlalchemy AsyncEngine
+        """
+
+        engine = self.__async_engines.get(connection_string)
+        if engine is not None:
+            return engine
+
+        with self.__lock:
+            engine = self.__async_engines.get(connection_string)
+            if engine is None:
+                options = self.pool_options(connection_string)
+                # the asyncio engine needs the async adapted pool, which keeps the same sizing
+                options.pop("poolclass", None)
+                engine = create_async_engine(async_connection_string(connection_string), **options)
+                for hook in self.__hooks:
+                    hook(engine.sync_engine)
+                self.__async_engines[connection_string] = engine
+
+        return engine
+
+    def register_hook(self, hook: Callable[[Engine], None]) -> None:
+        """
+        Registers a callable invoked with every engine of the registry, existing and future
+        :param  - hook: A callable receiving the engine, e.g. to attach event listeners
+        :return - None
+        """
+
+        with self.__lock:
+            self.__hooks.append(hook)
+            for engine in self.__engines.values():
+                hook(engine)
+            for engine in self.__async_engines.values():
+                hook(engine.sync_engine)
+
+    def engines(self) -> List[Engine]:
+        """
+        Returns the engines currently held by the registry
+        :param  - None
+        :return - A list of sqlalchemy Engine
+        """
+
+        return list(self.__engines.values())
+
+    def dispose(self) -> None:
+        """
+        Closes every pooled connection and forgets all engines
+        :param  - None
+        :return - None
+        """
+
+        with self.__lock:
+            for engine in self.__engines.values():
+                engine.dispose()
+            self.__engines.clear()
+            # their connections belong to an event loop, closed by dispose_async while it runs
+            self.__async_engines.clear()
+
+    async def dispose_async(self) -> None:
+        """
+        Closes every pooled connection of the asyncio engines and forgets them, from the event
+        loop that used them, e.g. on ASGI lifespan shutdown
+        :param  - None
+        :return - None
+        """
+
+        engines = list(self.__async_engines.values())
+        self.__async_engines.clear()
+        for engine in engines:
+            await engine.dispose()
+
+    def after_fork(self) -> None:
+        """
+        Gives every engine a fresh pool in a forked child process. The inherited pools are kept
+        referenced so their sockets, still owned by the parent, are never closed from the child.
+        :param  - None
+        :return - None
+        """
+
+        self.__lock = threading.RLock()
+        for engine in self.__engines.values():
+            self.__orphaned_pools.append(engine.pool)
+            engine.pool = engine.pool.recreate()
+        for engine in self.__async_engines.values():
+            self.__orphaned_pools.append(engine.sync_engine.pool)
+            engine.sync_engine.pool = engine.sync_engine.pool.recreate()
+
+    @staticmethod
+    def pool_options(connection_string: str) -> dict:
+        """
+        Builds pool arguments for create_engine from DB_POOL_* environment variables
+        :param  - connection_string: The database URL
+        :return - A dictionary of pool keyword arguments accepted by the dialect pool
+        """
+
+        options = dict(
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+            pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "ENABLED") == "ENABLED",
+        )
+
+        # sqlite uses NullPool/SingletonThreadPool, which have no size or overflow
+        if make_url(connection_string).get_backend_name() != "sqlite":
+            options["poolclass"] = TimedQueuePool
+            options["pool_size"] = int(os.getenv("DB_POOL_SIZE", "5"))
+            options["max_overflow"] = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+        return options
+
+
+engine_registry = EngineRegistry()
+
+atexit.register(engine_registry.dispose)
+os.register_at_fork(after_in_child=engine_registry.after_fork)
@@ -0,0 +1,150 @@
+import os
+import json
+import time
+import logging
+import functools
+import contextvars
+from typing import Callable, List, Union
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from .db_engines import engine_registry
+
+FINGERPRINT_OPTION = "fingerprint"
+
+slow_query_logger = logging.getLogger("db.slow_query")
+
+
+@functools.lru_cache(maxsize=512)
+def fingerprint_statement(statement: str) -> str:
+    """
+    Normalizes a SQL statement into a small, bounded set of names usable as metric labels
+    :param  - statement: The SQL sent to the cursor
+    :return - One of select_users, count_users, get_user, select, insert, update, delete or other
+    """
+
+    normalized = " ".join(statement.split()).lower()
+    verb = normalized.split(" ", 1)[0]
+
+    if verb in ("insert", "update", "delete"):
+        return verb
+    if verb != "select" and verb != "with":
+        return "other"
+    if " from users" not in normalized:
+        return "select"
+    if normalized.startswith("select count("):
+        return "count_users"
+    if "where users.id = " in normalized and " order by " not in normalized:
+        return "get_user"
+
+    return "select_users"
+
+
+def parameter_shape(parameters: any, executemany: bool = False) -> Union[dict, list, str]:
+    """
+    Describes bound parameters by type only, so logs never carry user data such as cpf or email
+    :param  - parameters: The parameters sent to the cursor
+            - executemany: If parameters is a list of parameter sets
+    :return - A JSON serializable description of the parameters
+    """
+
+    if executemany:
+        first = parameters[0] if len(parameters) > 0 else None
+        return {"rows": len(parameters), "row": parameter_shape(first)}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+
+    return type(parameters).__name__
+
+
+class QueryInstrumentation:
+    """Times every statement executed by the shared engines"""
+
+    def __init__(self) -> None:
+        self.slow_query_seconds = float(os.getenv("DB_SLOW_QUERY_MS", "500")) / 1000
+
+        # LOG_AURORA used to turn on echo; it now logs every statement through the slow query log
+        if os.getenv("LOG_AURORA") == "ENABLED":
+            self.slow_query_seconds = 0.0
+
+        self.__observers: List[Callable[[str, float], None]] = []
+        self.__request_time = contextvars.ContextVar("db_request_time", default=None)
+
+    def instrument(self, engine: Engine) -> None:
+        """
+        Attach cursor execution listeners to an engine
+        :param  - engine: A sqlalchemy Engine
+        :return - None
+        """
+
+        event.listen(engine, "before_cursor_execute", self.__before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self.__after_cursor_execute)
+
+    def add_observer(self, observer: Callable[[str, float], None]) -> None:
+        """
+        Registers a callable receiving the fingerprint and duration in seconds of every statement
+        :param  - observer: A callable(fingerprint, seconds)
+        :return - None
+        """
+
+        self.__observers.append(observer)
+
+    def start_request(self) -> None:
+        """
+        Starts accumulating database time for the current request context
+        :param  - None
+        :return - None
+        """
+
+        self.__request_time.set([0.0])
+
+    def request_time(self) -> float:
+        """
+        Returns the database time accumulated since start_request in the current context
+        :param  - None
+        :return - Seconds spent executing statements
+        """
+
+        accumulated = self.__request_time.get()
+        return accumulated[0] if accumulated is not None else 0.0
+
+    def __before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # kept on the execution context, which a failed statement drops with its start time
+        if context is not None:
+            context._query_start = time.perf_counter()
+
+    def __after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started_at = getattr(context, "_query_start", None)
+        if started_at is None:
+            return
+        elapsed = time.perf_counter() - started_at
+
+        fingerprint = context.execution_options.get(FINGERPRINT_OPTION)
+        if fingerprint is None:
+            fingerprint = fingerprint_statement(statement)
+
+        accumulated = self.__request_time.get()
+        if accumulated is not None:
+            accumulated[0] += elapsed
+
+        for observer in self.__observers:
+            observer(fingerprint, elapsed)
+
+        if elapsed >= self.slow_query_seconds:
+            slow_query_logger.warning(
+                json.dumps(
+                    {
+                        "event": "slow_query",
+                        "fingerprint": fingerprint,
+                        "duration_ms": round(elapsed * 1000, 3),
+                        "statement": " ".join(statement.split()),
+                        "parameters": parameter_shape(parameters, executemany),
+                    }
+                )
+            )
+
+
+query_instrumentation = QueryInstrumentation()
+
+engine_registry.register_hook(query_instrumentation.instrument)
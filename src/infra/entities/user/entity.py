@@ -1,15 +1,28 @@
 from datetime import datetime, timedelta, timezone
-from sqlalchemy import Column, String, DateTime, cast
+from sqlalchemy import Column, String, DateTime, Index, cast
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import relationship, foreign
 from sqlalchemy.sql.functions import func
 from sqlalchemy.sql.sqltypes import JSON, BigInteger, Boolean
 from src.infra.config import Base
 
+
+def local_now() -> datetime:
+    """Current time in the -03:00 offset used by created_at, without tzinfo"""
+
+    return datetime.now(timezone(timedelta(hours=-3))).replace(tzinfo=None)
+
+
 class User(Base):
     """Users Entity"""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # keyset pagination sorts on (column, id); cpf and email are covered by their unique indexes
+        Index("ix_users_name_id", "name", "id"),
+        Index("ix_users_last_name_id", "last_name", "id"),
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     id = Column(String(36), primary_key=True)
     name = Column(String(), nullable=False)
@@ -17,7 +30,10 @@ class User(Base):
     cpf = Column(String(), nullable=False, unique=True)
     email = Column(String(), nullable=False, unique=True)
     created_at = Column(
-        DateTime, default=datetime.now(timezone(timedelta(hours=-3))), nullable=True
+        DateTime,
+        default=datetime.now(timezone(timedelta(hours=-3))),
+        server_default=func.now(),
+        nullable=False,
     )
     
 
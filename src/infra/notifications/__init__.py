@@ -0,0 +1,10 @@
+"""Namespace de notificacoes de alteracoes entre replicas."""
+from .notifier import (
+    USERS_CHANGED_CHANNEL,
+    ALL_USERS,
+    InProcessNotificationBus,
+    UserChangeNotifier,
+    in_process_bus,
+    user_change_notifier,
+)
+from .listener import PostgresNotificationListener
@@ -0,0 +1,87 @@
+import time
+import select
+import logging
+import threading
+from typing import Callable, Union
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresNotificationListener:
+    """
+    Background thread holding one dedicated connection in LISTEN mode and handing every
+    notification to a callback. When the connection drops, on_reconnect is called before
+    listening again, since notifications sent meanwhile are lost.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        channel: str,
+        callback: Callable[[str, str], None],
+        on_reconnect: Union[Callable[[], None], None] = None,
+        poll_interval: float = 5.0,
+    ) -> None:
+        self.engine = engine
+        self.channel = channel
+        self.callback = callback
+        self.on_reconnect = on_reconnect
+        self.poll_interval = poll_interval
+        self.__stopped = threading.Event()
+        self.__thread: Union[threading.Thread, None] = None
+
+    def start(self) -> None:
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+
+        self.__stopped.clear()
+        self.__thread = threading.Thread(
+            target=self.__run, name="listen-{}".format(self.channel), daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self) -> None:
+        self.__stopped.set()
+        if self.__thread is not None:
+            self.__thread.join(self.poll_interval + 1)
+            self.__thread = None
+
+    def __run(self) -> None:
+        connected_before = False
+        while not self.__stopped.is_set():
+            connection = None
+            try:
+                # detached from the pool so it does not count against pool_size
+                connection = self.engine.raw_connection()
+                connection.detach()
+                dbapi_connection = connection.connection
+                dbapi_connection.autocommit = True
+                with dbapi_connection.cursor() as cursor:
+                    cursor.execute("LISTEN {}".format(self.channel))
+
+                if connected_before and self.on_reconnect is not None:
+                    self.on_reconnect()
+                connected_before = True
+
+                self.__listen(dbapi_connection)
+            except Exception:
+                logger.exception("Notification listener on %s failed, reconnecting", self.channel)
+                self.__stopped.wait(1)
+            finally:
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+
+    def __listen(self, dbapi_connection) -> None:
+        while not self.__stopped.is_set():
+            readable, _, _ = select.select([dbapi_connection], [], [], self.poll_interval)
+            if not readable:
+                continue
+
+            dbapi_connection.poll()
+            while dbapi_connection.notifies:
+                notification = dbapi_connection.notifies.pop(0)
+                self.callback(notification.channel, notification.payload)
@@ -0,0 +1,112 @@
+import threading
+from typing import Callable, Iterable, List
+from sqlalchemy import event, func, select
+
+USERS_CHANGED_CHANNEL = "users_changed"
+ALL_USERS = "*"
+PENDING_PAYLOADS = "pending_user_changes"
+
+# NOTIFY payloads are limited to 8000 bytes, about 200 comma separated uuids
+IDS_PER_NOTIFICATION = 200
+MAX_IDS_NOTIFIED = 2000
+
+
+class InProcessNotificationBus:
+    """Stand-in for LISTEN/NOTIFY delivering payloads to subscribers of the same process"""
+
+    def __init__(self) -> None:
+        self.__subscribers: List[Callable[[str, str], None]] = []
+        self.__lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[str, str], None]) -> None:
+        """
+        Registers a callable receiving the channel and payload of every notification
+        :param  - callback: A callable(channel, payload)
+        :return - None
+        """
+
+        with self.__lock:
+            self.__subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, str], None]) -> None:
+        with self.__lock:
+            if callback in self.__subscribers:
+                self.__subscribers.remove(callback)
+
+    def publish(self, channel: str, payload: str) -> None:
+        for callback in list(self.__subscribers):
+            callback(channel, payload)
+
+
+class UserChangeNotifier:
+    """Publishes the ids of created, updated or deleted users when their transaction commits"""
+
+    def __init__(self, bus: InProcessNotificationBus) -> None:
+        self.bus = bus
+
+    def notify(self, db_connection, ids: Iterable[str]) -> None:
+        """
+        Queues change notifications in the transaction of db_connection. PostgreSQL delivers
+        pg_notify on commit to every listening replica; other databases publish on the
+        in-process bus after commit. Nothing is sent if the transaction rolls back.
+        :param  - db_connection: A DBConnectionHandler with an open transaction
+                - ids: The changed user ids, or [ALL_USERS]
+        :return - None
+        """
+
+        self.notify_session(db_connection.session, ids)
+
+    def notify_session(self, session, ids: Iterable[str]) -> None:
+        """
+        Queues change notifications in the transaction of a session, as notify does. An
+        AsyncSession calls it through run_sync with its synchronous session.
+        :param  - session: A sqlalchemy Session with an open transaction
+                - ids: The changed user ids, or [ALL_USERS]
+        :return - None
+        """
+
+        payloads = self.build_payloads(list(ids))
+        if len(payloads) == 0:
+            return
+
+        if session.get_bind().dialect.name == "postgresql":
+            for payload in payloads:
+                session.execute(select(func.pg_notify(USERS_CHANGED_CHANNEL, payload)))
+            return
+
+        if PENDING_PAYLOADS not in session.info:
+            session.info[PENDING_PAYLOADS] = []
+            event.listen(session, "after_commit", self.__publish_pending)
+            event.listen(session, "after_rollback", self.__discard_pending)
+        session.info[PENDING_PAYLOADS].extend(payloads)
+
+    def __publish_pending(self, session) -> None:
+        payloads = session.info[PENDING_PAYLOADS]
+        session.info[PENDING_PAYLOADS] = []
+        for payload in payloads:
+            self.bus.publish(USERS_CHANGED_CHANNEL, payload)
+
+    def __discard_pending(self, session) -> None:
+        session.info[PENDING_PAYLOADS] = []
+
+    @staticmethod
+    def build_payloads(ids: List[str]) -> List[str]:
+        """
+        Splits ids into payloads fitting a NOTIFY, falling back to ALL_USERS for large changes
+        :param  - ids: The changed user ids
+        :return - A list of comma separated payloads
+        """
+
+        if len(ids) == 0:
+            return []
+        if ALL_USERS in ids or len(ids) > MAX_IDS_NOTIFIED:
+            return [ALL_USERS]
+
+        return [
+            ",".join(ids[start:start + IDS_PER_NOTIFICATION])
+            for start in range(0, len(ids), IDS_PER_NOTIFICATION)
+        ]
+
+
+in_process_bus = InProcessNotificationBus()
+user_change_notifier = UserChangeNotifier(in_process_bus)
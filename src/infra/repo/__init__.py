@@ -1 +1 @@
-from .user_repository import UserRepository
\ No newline at end of file
+from .user_repository import UserRepository, AsyncUserRepository
@@ -1 +1,3 @@
 from .repository import UserRepository
+from .async_repository import AsyncUserRepository
+from .cursor import encode_cursor, decode_cursor
@@ -0,0 +1,468 @@
+# pylint: disable=E1101
+
+import uuid
+import asyncio
+from datetime import datetime
+from typing import List, Tuple, Union
+from sqlalchemy import func, select, tuple_
+from src.data.interfaces import AsyncUserRepositoryInterface
+from src.domain.models import User
+from src.infra.cache import read_cache, user_cache, user_cache_invalidation, USER_NAMESPACE
+from src.infra.config import AsyncDBConnectionHandler, FINGERPRINT_OPTION
+from src.infra.entities import User as UserModel
+from src.infra.entities.user.entity import local_now
+from src.infra.notifications import user_change_notifier
+from .cursor import KEYSET_COLUMNS, encode_cursor, decode_cursor
+from .repository import RETURNING_COLUMNS
+from .search import get_search_backend
+
+
+class AsyncUserRepository(AsyncUserRepositoryInterface):
+    """
+    Class to manage User Repository on the asyncio engine. Statements, caches and change
+    notifications are those of UserRepository, awaited instead of blocking the worker.
+    """
+
+    def __build_row_to_domain_interface(self, row) -> User:
+        """
+        Transform a users table row into named tuple domain model User
+        :param  - row: A row mapping with the users table columns
+        :return - A domain User
+        """
+
+        return User(
+            id=row["id"],
+            name=row["name"],
+            last_name=row["last_name"],
+            email=row["email"],
+            cpf=row["cpf"],
+        )
+
+    async def __build_search_filters(
+        self, db_connection: AsyncDBConnectionHandler, name: str, email: str, last_name: str, cpf: str
+    ) -> list:
+        """
+        Build the search criteria shared by the select and count queries, from the search
+        backend of the connection engine.
+
+        :param db_connection: The connection handler the query will run on.
+        :param name: Substring to search on the user's first name.
+        :param email: Substring to search on the user's email.
+        :param last_name: Substring to search on the user's last name.
+        :param cpf: Substring to search on the user's CPF.
+        :return: A list of sqlalchemy filter expressions.
+        """
+
+        # choosing the backend may inspect the schema, which needs the synchronous facade
+        search_backend = await db_connection.session.run_sync(
+            lambda session: get_search_backend(session.get_bind())
+        )
+        return search_backend.build_filters(
+            name=name, email=email, last_name=last_name, cpf=cpf
+        )
+
+    @staticmethod
+    def __supports_returning(db_connection: AsyncDBConnectionHandler) -> bool:
+        """
+        Tells whether UPDATE and DELETE statements can return rows on the connection dialect.
+
+        :param db_connection: The connection handler the statement will run on.
+        :return: True if RETURNING can be used.
+        """
+
+        return bool(getattr(db_connection.engine.dialect, "full_returning", False))
+
+    async def create_user(
+        self,
+        name: str,
+        email: str,
+        last_name: str,
+        cpf: str,
+        created_at: Union[datetime, None] = None,
+    ) -> User:
+        """
+        Create a new user in the database.
+
+        :param name: The first name of the user.
+        :param email: The email address of the user.
+        :param last_name: The last name of the user.
+        :param cpf: The CPF (Cadastro de Pessoas Físicas) of the user.
+        :param created_at: The datetime when the user was created. Defaults to the current time.
+        :return: The created User domain model.
+        """
+
+        async with AsyncDBConnectionHandler() as db_connection:
+            try:
+                id = str(uuid.uuid4())
+                entity_instance = UserModel(
+                    id=id,
+                    created_at=created_at or local_now(),
+                    cpf=cpf,
+                    email=email,
+                    last_name=last_name,
+                    name=name,
+                )
+
+                db_connection.session.add(entity_instance)
+                await db_connection.session.run_sync(user_change_notifier.notify_session, [id])
+                await db_connection.session.commit()
+                # the read cache backend may block on redis or a file
+                await asyncio.to_thread(user_cache_invalidation.evict, [id])
+
+                return User(id=id, name=name, last_name=last_name, email=email, cpf=cpf)
+            except:
+                await db_connection.session.rollback()
+                raise
+
+    async def get_user(self, id: str) -> Union[User, None]:
+        """
+        Retrieve a user by their unique identifier, from the in-process user cache when it
+        holds a fresh copy, from the read cache next, from the database otherwise.
+
+        :param id: The unique identifier of the user to retrieve.
+        :return: The User domain model if found, None otherwise.
+        """
+
+        return await user_cache.get_or_load_async(id, lambda: self.__load_user(id))
+
+    async def __load_user(self, id: str) -> Union[User, None]:
+        """
+        Retrieve a user from the read cache, shared by the replicas on the redis and file backends,
+        filling it from the database on a miss.
+
+        :param id: The unique identifier of the user to retrieve.
+        :return: The User domain model if found, None otherwise.
+        """
+
+        async def fetch():
+            user = await self.__fetch_user(id)
+            return user._asdict() if user is not None else None
+
+        data = await read_cache.get_or_load_async(USER_NAMESPACE, id, fetch)
+        return User(**data) if data is not None else None
+
+    async def __fetch_user(self, id: str) -> Union[User, None]:
+        """
+        Retrieve a user from the database by their unique identifier.
+
+        :param id: The unique identifier of the user to retrieve.
+        :return: The User domain model if found, None otherwise.
+        """
+
+        async with AsyncDBConnectionHandler() as db_connection:
+            row = (
+                await db_connection.session.execute(
+                    select(*RETURNING_COLUMNS)
+                    .where(UserModel.id == id)
+                    .execution_options(**{FINGERPRINT_OPTION: "get_user"})
+                )
+            ).first()
+
+        return self.__build_row_to_domain_interface(row._mapping) if row else None
+
+    async def update_user(
+        self,
+        id: str,
+        name: str,
+        email: str,
+        last_name: str,
+        cpf: str,
+    ) -> Union[User, None]:
+        """
+        Update an existing user in the database with a single UPDATE statement.
+
+        :param id: The unique identifier of the user to update.
+        :param name: The new first name of the user.
+        :param email: The new email address of the user.
+        :param last_name: The new last name of the user.
+        :param cpf: The new CPF of the user.
+        :return: The updated User domain model, None if no user has the id.
+        """
+
+        values = dict(name=name, email=email, last_name=last_name, cpf=cpf)
+        table = UserModel.__table__
+        statement = (
+            table.update()
+            .where(table.c.id == id)
+            .values(**values)
+            .execution_options(**{FINGERPRINT_OPTION: "update_user"})
+        )
+
+        async with AsyncDBConnectionHandler() as db_connection:
+            try:
+                if self.__supports_returning(db_connection):
+                    row = (
+                        await db_connection.session.execute(statement.returning(*RETURNING_COLUMNS))
+                    ).first()
+                    record = self.__build_row_to_domain_interface(row._mapping) if row else None
+                else:
+                    # every column is written, so the row is known without reading it back
+                    updated = (await db_connection.session.execute(statement)).rowcount
+                    record = User(id=id, **values) if updated > 0 else None
+
+                if record is None:
+                    await db_connection.session.rollback()
+                    return None
+
+                await db_connection.session.run_sync(user_change_notifier.notify_session, [id])
+                await db_connection.session.commit()
+                await asyncio.to_thread(user_cache_invalidation.evict, [id])
+
+                return record
+            except:
+                await db_connection.session.rollback()
+                raise
+
+    async def delete_user(self, id: str) -> bool:
+        """
+        Delete a user from the database by their unique identifier with a single DELETE statement.
+
+        :param id: The unique identifier of the user to delete.
+        :return: True if the user was deleted, False if no user has the id.
+        """
+
+        table = UserModel.__table__
+        async with AsyncDBConnectionHandler() as db_connection:
+            try:
+                deleted = (
+                    await db_connection.session.execute(
+                        table.delete()
+                        .where(table.c.id == id)
+                        .execution_options(**{FINGERPRINT_OPTION: "delete_user"})
+                    )
+                ).rowcount
+                if deleted == 0:
+                    await db_connection.session.rollback()
+                    return False
+
+                await db_connection.session.run_sync(user_change_notifier.notify_session, [id])
+                await db_connection.session.commit()
+                await asyncio.to_thread(user_cache_invalidation.evict, [id])
+                return True
+            except:
+                await db_connection.session.rollback()
+                raise
+
+    async def delete_user_returning(self, id: str) -> Union[User, None]:
+        """
+        Delete a user and return the deleted row. Dialects supporting RETURNING do it in a single
+        DELETE statement, others read the user, from the user cache when possible, then delete it.
+
+        :param id: The unique identifier of the user to delete.
+        :return: The deleted User domain model, None if no user has the id.
+        """
+
+        table = UserModel.__table__
+        # the session connects on its first statement, get_user and delete_user open their own
+        db_connection = AsyncDBConnectionHandler()
+        if not self.__supports_returning(db_connection):
+            record = await self.get_user(id)
+            if record is None or not await self.delete_user(id):
+                return None
+            return record
+
+        async with db_connection:
+            try:
+                row = (
+                    await db_connection.session.execute(
+                        table.delete()
+                        .where(table.c.id == id)
+                        .returning(*RETURNING_COLUMNS)
+                        .execution_options(**{FINGERPRINT_OPTION: "delete_user"})
+                    )
+                ).first()
+                if row is None:
+                    await db_connection.session.rollback()
+                    return None
+
+                await db_connection.session.run_sync(user_change_notifier.notify_session, [id])
+                await db_connection.session.commit()
+                await asyncio.to_thread(user_cache_invalidation.evict, [id])
+                return self.__build_row_to_domain_interface(row._mapping)
+            except:
+                await db_connection.session.rollback()
+                raise
+
+    async def select_users(
+        self,
+        name: str = "",
+        email: str = "",
+        last_name: str = "",
+        cpf: str = "",
+        column: str = "name",
+        order: str = "desc",
+        page: int = 0,
+        limit: int = 10,
+    ) -> List[User]:
+        """
+        Select users from the database based on search criteria.
+
+        :param name: Filter by the user's first name. Defaults to empty string (no filter).
+        :param email: Filter by the user's email. Defaults to empty string (no filter).
+        :param last_name: Filter by the user's last name. Defaults to empty string (no filter).
+        :param cpf: Filter by the user's CPF. Defaults to empty string (no filter).
+        :param column: The column to sort the results by. Defaults to 'name'.
+        :param order: The order of sorting ('asc' for ascending, 'desc' for descending). Defaults to 'desc'.
+        :param page: The page number for pagination. Defaults to 0.
+        :param limit: The number of results to return per page. Defaults to 10.
+        :return: A list of User domain models that match the search criteria.
+        """
+
+        attribute = getattr(UserModel, column)
+        order_by_attribute = attribute.desc() if order == "desc" else attribute.asc()
+
+        async with AsyncDBConnectionHandler() as db_connection:
+            filters = await self.__build_search_filters(db_connection, name, email, last_name, cpf)
+            result = await db_connection.session.execute(
+                select(*RETURNING_COLUMNS)
+                .where(*filters)
+                .order_by(order_by_attribute)
+                .limit(limit)
+                .offset(page)
+                .execution_options(**{FINGERPRINT_OPTION: "select_users"})
+            )
+
+            return [self.__build_row_to_domain_interface(row._mapping) for row in result]
+
+    async def select_users_by_cursor(
+        self,
+        name: str = "",
+        email: str = "",
+        last_name: str = "",
+        cpf: str = "",
+        column: str = "name",
+        order: str = "desc",
+        cursor: Union[str, None] = None,
+        limit: int = 10,
+    ) -> Tuple[List[User], Union[str, None]]:
+        """
+        Select users with keyset pagination on (column, id), as UserRepository.select_users_by_cursor.
+
+        :param name: Filter by the user's first name. Defaults to empty string (no filter).
+        :param email: Filter by the user's email. Defaults to empty string (no filter).
+        :param last_name: Filter by the user's last name. Defaults to empty string (no filter).
+        :param cpf: Filter by the user's CPF. Defaults to empty string (no filter).
+        :param column: The column to sort the results by, one of KEYSET_COLUMNS. Defaults to 'name'.
+        :param order: The order of sorting ('asc' for ascending, 'desc' for descending). Defaults to 'desc'.
+        :param cursor: The next_cursor of the previous page. Defaults to None (first page).
+        :param limit: The number of results to return per page. Defaults to 10.
+        :return: A tuple with the list of User domain models and the cursor of the next page, None on the last page.
+        """
+
+        if column not in KEYSET_COLUMNS:
+            raise ValueError("Invalid cursor sort column: {}".format(column))
+
+        attribute = getattr(UserModel, column)
+        if order == "desc":
+            order_by_attributes = [attribute.desc(), UserModel.id.desc()]
+        else:
+            order_by_attributes = [attribute.asc(), UserModel.id.asc()]
+
+        seek_filters = []
+        if cursor:
+            value, last_id = decode_cursor(cursor, column, order)
+            if order == "desc":
+                seek_filters.append(tuple_(attribute, UserModel.id) < tuple_(value, last_id))
+            else:
+                seek_filters.append(tuple_(attribute, UserModel.id) > tuple_(value, last_id))
+
+        async with AsyncDBConnectionHandler() as db_connection:
+            filters = await self.__build_search_filters(db_connection, name, email, last_name, cpf)
+            filters.extend(seek_filters)
+
+            # one extra row tells whether a next page exists
+            rows = (
+                await db_connection.session.execute(
+                    select(*RETURNING_COLUMNS, attribute.label("sort_value"))
+                    .where(*filters)
+                    .order_by(*order_by_attributes)
+                    .limit(limit + 1)
+                    .execution_options(**{FINGERPRINT_OPTION: "select_users"})
+                )
+            ).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(column, order, last.sort_value, last.id)
+
+        records = [self.__build_row_to_domain_interface(row._mapping) for row in rows]
+        return records, next_cursor
+
+    async def select_users_with_total(
+        self,
+        name: str = "",
+        email: str = "",
+        last_name: str = "",
+        cpf: str = "",
+        column: str = "name",
+        order: str = "desc",
+        page: int = 0,
+        limit: int = 10,
+    ) -> Tuple[List[User], int]:
+        """
+        Select a page of users and the total of users matching the search criteria in a single
+        query, the total being read from a count(*) OVER () window.
+
+        :param name: Filter by the user's first name. Defaults to empty string (no filter).
+        :param email: Filter by the user's email. Defaults to empty string (no filter).
+        :param last_name: Filter by the user's last name. Defaults to empty string (no filter).
+        :param cpf: Filter by the user's CPF. Defaults to empty string (no filter).
+        :param column: The column to sort the results by. Defaults to 'name'.
+        :param order: The order of sorting ('asc' for ascending, 'desc' for descending). Defaults to 'desc'.
+        :param page: The page number for pagination. Defaults to 0.
+        :param limit: The number of results to return per page. Defaults to 10.
+        :return: A tuple with the list of User domain models and the total count.
+        """
+
+        attribute = getattr(UserModel, column)
+        order_by_attribute = attribute.desc() if order == "desc" else attribute.asc()
+
+        async with AsyncDBConnectionHandler() as db_connection:
+            filters = await self.__build_search_filters(db_connection, name, email, last_name, cpf)
+            rows = (
+                await db_connection.session.execute(
+                    select(*RETURNING_COLUMNS, func.count().over().label("total"))
+                    .where(*filters)
+                    .order_by(order_by_attribute)
+                    .limit(limit)
+                    .offset(page)
+                    .execution_options(**{FINGERPRINT_OPTION: "select_users_with_total"})
+                )
+            ).all()
+
+        # An offset past the last row returns no rows, and so no window value to read
+        if len(rows) == 0:
+            total = 0 if page == 0 else await self.count_users(name, email, last_name, cpf)
+            return [], total
+
+        records = [self.__build_row_to_domain_interface(row._mapping) for row in rows]
+        return records, rows[0].total
+
+    async def count_users(
+        self,
+        name: str = "",
+        email: str = "",
+        last_name: str = "",
+        cpf: str = "",
+    ) -> int:
+        """
+        Count the number of users in the database that match the given search criteria.
+
+        :param name: Filter by the user's first name. Defaults to empty string (no filter).
+        :param email: Filter by the user's email. Defaults to empty string (no filter).
+        :param last_name: Filter by the user's last name. Defaults to empty string (no filter).
+        :param cpf: Filter by the user's CPF. Defaults to empty string (no filter).
+        :return: The count of users that match the search criteria.
+        """
+
+        async with AsyncDBConnectionHandler() as db_connection:
+            filters = await self.__build_search_filters(db_connection, name, email, last_name, cpf)
+            return (
+                await db_connection.session.execute(
+                    select(func.count(UserModel.id))
+                    .where(*filters)
+                    .execution_options(**{FINGERPRINT_OPTION: "count_users"})
+                )
+            ).scalar()
@@ -0,0 +1,50 @@
+import json
+import base64
+from datetime import datetime
+from typing import Tuple
+
+# non null columns having a (column, id) or unique index: a NULL sort value would be skipped by
+# the row comparison and could never be continued after
+KEYSET_COLUMNS = ("name", "last_name", "email", "cpf", "created_at", "id")
+
+
+def encode_cursor(column: str, order: str, value: any, id: str) -> str:
+    """
+    Builds an opaque keyset pagination cursor pointing after a row
+    :param  - column: The sort column of the listing
+            - order: The sort order of the listing ('asc' or 'desc')
+            - value: The sort column value of the last returned row
+            - id: The id of the last returned row, used as tie breaker
+    :return - An url safe string
+    """
+
+    if isinstance(value, datetime):
+        value = {"$datetime": value.isoformat()}
+
+    payload = json.dumps({"c": column, "o": order, "v": value, "id": id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, column: str, order: str) -> Tuple[any, str]:
+    """
+    Reads a cursor built by encode_cursor for the same listing
+    :param  - cursor: The opaque cursor
+            - column: The sort column of the listing
+            - order: The sort order of the listing
+    :return - A tuple with the sort value and the id of the row to continue after
+    """
+
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        value = payload["v"]
+        if isinstance(value, dict):
+            value = datetime.fromisoformat(value["$datetime"])
+        id = payload["id"]
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+    if payload.get("c") != column or payload.get("o") != order:
+        raise ValueError("Cursor does not match the requested sort column and order")
+
+    return value, id
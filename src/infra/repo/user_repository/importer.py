@@ -0,0 +1,207 @@
+import io
+import csv
+import uuid
+from datetime import datetime, timezone, timedelta
+from itertools import islice
+from typing import Iterable, Iterator, List
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from src.infra.config import DBConnectionHandler
+from src.infra.entities import User as UserModel
+
+IMPORT_COLUMNS = ("id", "name", "last_name", "cpf", "email", "created_at")
+ON_CONFLICT_SKIP = "skip"
+ON_CONFLICT_UPDATE = "update"
+
+POSTGRESQL_STAGING_TABLE = """
+CREATE TEMP TABLE users_import (
+    id VARCHAR(36), name TEXT, last_name TEXT, cpf TEXT, email TEXT, created_at TIMESTAMP
+) ON COMMIT DROP
+"""
+
+POSTGRESQL_COPY = "COPY users_import ({}) FROM STDIN WITH (FORMAT csv)".format(
+    ", ".join(IMPORT_COLUMNS)
+)
+
+POSTGRESQL_MERGE = {
+    ON_CONFLICT_SKIP: """
+        WITH merged AS (
+            INSERT INTO users (id, name, last_name, cpf, email, created_at)
+            SELECT id, name, last_name, cpf, email, created_at FROM users_import
+            ON CONFLICT DO NOTHING
+            RETURNING 1
+        )
+        SELECT count(*), 0 FROM merged
+    """,
+    # rows whose email belongs to another cpf, in users or in the file, are skipped
+    ON_CONFLICT_UPDATE: """
+        WITH candidates AS (
+            SELECT DISTINCT ON (s.cpf) s.* FROM users_import s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM users u WHERE u.email = s.email AND u.cpf <> s.cpf
+            )
+            AND s.email NOT IN (
+                SELECT email FROM users_import GROUP BY email HAVING count(DISTINCT cpf) > 1
+            )
+            ORDER BY s.cpf
+        ), merged AS (
+            INSERT INTO users (id, name, last_name, cpf, email, created_at)
+            SELECT id, name, last_name, cpf, email, created_at FROM candidates
+            ON CONFLICT (cpf) DO UPDATE
+            SET name = EXCLUDED.name, last_name = EXCLUDED.last_name, email = EXCLUDED.email
+            RETURNING (xmax = 0) AS inserted
+        )
+        SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM merged
+    """,
+}
+
+
+class CsvRowStream(io.RawIOBase):
+    """Read-only file object producing CSV bytes from rows on demand, as psycopg2 copy_expert reads it"""
+
+    def __init__(self, rows: Iterable[dict]) -> None:
+        self.__rows = iter(rows)
+        self.__line = io.StringIO()
+        self.__writer = csv.writer(self.__line, lineterminator="\n")
+        self.__pending = b""
+        self.rows_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while len(self.__pending) < len(buffer):
+            row = next(self.__rows, None)
+            if row is None:
+                break
+            self.rows_read += 1
+            self.__line.seek(0)
+            self.__line.truncate()
+            self.__writer.writerow([row[column] for column in IMPORT_COLUMNS])
+            self.__pending += self.__line.getvalue().encode("utf-8")
+
+        size = min(len(buffer), len(self.__pending))
+        buffer[:size] = self.__pending[:size]
+        self.__pending = self.__pending[size:]
+        return size
+
+
+class UserImporter:
+    """Loads large amounts of users keeping memory constant"""
+
+    def __init__(self, batch_size: int = 10000) -> None:
+        self.batch_size = batch_size
+
+    def import_users(self, users: Iterable[dict], on_conflict: str = ON_CONFLICT_SKIP) -> dict:
+        """
+        Imports users, resolving existing cpf/email by skipping or updating them
+        :param  - users: An iterable of dictionaries having name, last_name, email and cpf
+                - on_conflict: 'skip' keeps the existing user, 'update' overwrites it by cpf
+        :return - A dictionary with read, inserted, updated and skipped counts
+        """
+
+        if on_conflict not in POSTGRESQL_MERGE:
+            raise ValueError("on_conflict must be 'skip' or 'update'")
+
+        rows = self.__build_rows(users)
+        with DBConnectionHandler() as db_connection:
+            try:
+                if db_connection.engine.dialect.name == "postgresql":
+                    stats = self.__copy_postgresql(db_connection, rows, on_conflict)
+                else:
+                    stats = self.__executemany(db_connection, rows, on_conflict)
+            except:
+                db_connection.session.rollback()
+                raise
+            finally:
+                db_connection.session.close()
+
+        stats["skipped"] = stats["read"] - stats["inserted"] - stats["updated"]
+        return stats
+
+    def __build_rows(self, users: Iterable[dict]) -> Iterator[dict]:
+        created_at = datetime.now(timezone(timedelta(hours=-3))).replace(tzinfo=None)
+        for user in users:
+            yield dict(
+                id=str(uuid.uuid4()),
+                name=user["name"],
+                last_name=user["last_name"],
+                cpf=user["cpf"],
+                email=user["email"],
+                created_at=created_at,
+            )
+
+    def __copy_postgresql(self, db_connection: DBConnectionHandler, rows: Iterator[dict], on_conflict: str) -> dict:
+        """
+        Streams rows with COPY FROM STDIN into a temp table, then merges it into users in one statement
+        """
+
+        cursor = db_connection.session.connection().connection.cursor()
+        try:
+            cursor.execute(POSTGRESQL_STAGING_TABLE)
+            stream = CsvRowStream(rows)
+            cursor.copy_expert(POSTGRESQL_COPY, stream, size=1 << 16)
+            cursor.execute("ANALYZE users_import")
+            cursor.execute(POSTGRESQL_MERGE[on_conflict])
+            inserted, updated = cursor.fetchone()
+        finally:
+            cursor.close()
+
+        db_connection.session.commit()
+        return {"read": stream.rows_read, "inserted": inserted, "updated": updated}
+
+    def __executemany(self, db_connection: DBConnectionHandler, rows: Iterator[dict], on_conflict: str) -> dict:
+        """
+        Inserts rows with executemany, one transaction per batch
+        """
+
+        table = UserModel.__table__
+        if on_conflict == ON_CONFLICT_SKIP:
+            statement = table.insert().prefix_with("OR IGNORE")
+        else:
+            statement = sqlite_insert(table)
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.cpf],
+                set_=dict(
+                    name=statement.excluded.name,
+                    last_name=statement.excluded.last_name,
+                    email=statement.excluded.email,
+                ),
+            )
+
+        stats = {"read": 0, "inserted": 0, "updated": 0}
+        while True:
+            batch = list(islice(rows, self.batch_size))
+            if len(batch) == 0:
+                return stats
+
+            stats["read"] += len(batch)
+            existing = 0
+            if on_conflict == ON_CONFLICT_UPDATE:
+                existing = (
+                    db_connection.session.query(UserModel.cpf)
+                    .filter(UserModel.cpf.in_({row["cpf"] for row in batch}))
+                    .count()
+                )
+
+            try:
+                changed = db_connection.session.execute(statement, batch).rowcount
+                db_connection.session.commit()
+            except IntegrityError:
+                # an email owned by another cpf, fall back to the rows that can be written
+                db_connection.session.rollback()
+                changed = self.__execute_rows(db_connection, statement, batch)
+
+            updated = min(existing, changed)
+            stats["updated"] += updated
+            stats["inserted"] += changed - updated
+
+    def __execute_rows(self, db_connection: DBConnectionHandler, statement, batch: List[dict]) -> int:
+        changed = 0
+        for row in batch:
+            try:
+                changed += db_connection.session.execute(statement, row).rowcount
+                db_connection.session.commit()
+            except IntegrityError:
+                db_connection.session.rollback()
+        return changed
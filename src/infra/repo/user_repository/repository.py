@@ -2,12 +2,28 @@
 
 import uuid
 from datetime import datetime, timezone, timedelta
-from typing import List
+from typing import Iterable, Iterator, List, Tuple, Union
+from sqlalchemy import bindparam, func, select, tuple_, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.exc import NoResultFound
 from src.data.interfaces import UserRepositoryInterface
-from src.domain.models import User
-from src.infra.config import DBConnectionHandler
+from src.domain.models import User, UserBulkResult
+from src.infra.cache import read_cache, user_cache, user_cache_invalidation, USER_NAMESPACE
+from src.infra.config import DBConnectionHandler, FINGERPRINT_OPTION
 from src.infra.entities import User as UserModel
+from src.infra.notifications import user_change_notifier, ALL_USERS
+from .cursor import KEYSET_COLUMNS, encode_cursor, decode_cursor
+from .search import get_search_backend
+from .importer import UserImporter, ON_CONFLICT_SKIP
+
+IN_CHUNK_SIZE = 1000
+RETURNING_COLUMNS = [
+    UserModel.id,
+    UserModel.name,
+    UserModel.last_name,
+    UserModel.email,
+    UserModel.cpf,
+]
 
 
 class UserRepository(UserRepositoryInterface):
@@ -29,6 +45,26 @@ class UserRepository(UserRepositoryInterface):
         )
         return domain_entity
 
+    def __build_search_filters(
+        self, db_connection: DBConnectionHandler, name: str, email: str, last_name: str, cpf: str
+    ) -> list:
+        """
+        Build the search criteria shared by the select and count queries. Empty filters add no
+        predicate, and the predicates come from the search backend of the connection engine.
+
+        :param db_connection: The connection handler the query will run on.
+        :param name: Substring to search on the user's first name.
+        :param email: Substring to search on the user's email.
+        :param last_name: Substring to search on the user's last name.
+        :param cpf: Substring to search on the user's CPF.
+        :return: A list of sqlalchemy filter expressions.
+        """
+
+        search_backend = get_search_backend(db_connection.engine)
+        return search_backend.build_filters(
+            name=name, email=email, last_name=last_name, cpf=cpf
+        )
+
     def create_user(
         self,
         name: str,
@@ -61,7 +97,9 @@ class UserRepository(UserRepositoryInterface):
                 )
                 
                 db_connection.session.add(entity_instance)
+                user_change_notifier.notify(db_connection, [id])
                 db_connection.session.commit()
+                user_cache_invalidation.evict([id])
 
                 return self.__build_entity_to_domain_interface(entity_instance)
 
@@ -73,6 +111,147 @@ class UserRepository(UserRepositoryInterface):
 
         return None
 
+    def create_users(self, users: List[dict]) -> List[UserBulkResult]:
+        """
+        Create many users in a single transaction with one multi-row INSERT. Rows whose cpf or
+        email already exists, in the database or earlier in the batch, are reported as conflicts
+        instead of failing the whole batch.
+
+        :param users: A list of dictionaries having name, email, last_name and cpf.
+        :return: A list of UserBulkResult in the same order as users.
+        """
+
+        results: List[UserBulkResult] = [None] * len(users)
+        if len(users) == 0:
+            return results
+
+        created_at = datetime.now(timezone(timedelta(hours=-3)))
+        rows = []
+        row_indexes = []
+
+        with DBConnectionHandler() as db_connection:
+            try:
+                existing = (
+                    db_connection.session.query(UserModel.cpf, UserModel.email)
+                    .filter(
+                        or_(
+                            UserModel.cpf.in_({user["cpf"] for user in users}),
+                            UserModel.email.in_({user["email"] for user in users}),
+                        )
+                    )
+                    .all()
+                )
+                taken_cpfs = {item.cpf for item in existing}
+                taken_emails = {item.email for item in existing}
+
+                for index, user in enumerate(users):
+                    if user["cpf"] in taken_cpfs:
+                        results[index] = UserBulkResult(False, error="cpf already exists")
+                        continue
+                    if user["email"] in taken_emails:
+                        results[index] = UserBulkResult(False, error="email already exists")
+                        continue
+
+                    taken_cpfs.add(user["cpf"])
+                    taken_emails.add(user["email"])
+                    rows.append(
+                        dict(
+                            id=str(uuid.uuid4()),
+                            created_at=created_at,
+                            cpf=user["cpf"],
+                            email=user["email"],
+                            last_name=user["last_name"],
+                            name=user["name"],
+                        )
+                    )
+                    row_indexes.append(index)
+
+                if len(rows) > 0:
+                    db_connection.session.execute(UserModel.__table__.insert(), rows)
+                    user_change_notifier.notify(db_connection, [row["id"] for row in rows])
+                db_connection.session.commit()
+            except IntegrityError:
+                # a concurrent writer took a cpf or email after the check, retry row by row
+                db_connection.session.rollback()
+                for index, row in zip(row_indexes, rows):
+                    results[index] = self.__insert_single_row(db_connection, row)
+                user_cache_invalidation.evict([row["id"] for row in rows])
+                return results
+            except:
+                db_connection.session.rollback()
+                raise
+            finally:
+                db_connection.session.close()
+
+        if len(rows) > 0:
+            user_cache_invalidation.evict([row["id"] for row in rows])
+        for index, row in zip(row_indexes, rows):
+            results[index] = UserBulkResult(True, data=self.__build_row_to_domain_interface(row))
+
+        return results
+
+    def import_users(
+        self, users: Iterable[dict], on_conflict: str = ON_CONFLICT_SKIP
+    ) -> dict:
+        """
+        Import a stream of users with constant memory. PostgreSQL loads them with COPY FROM STDIN
+        into a temp table merged into users in one statement, other databases use executemany
+        in large batches.
+
+        :param users: An iterable of dictionaries having name, email, last_name and cpf.
+        :param on_conflict: 'skip' keeps users whose cpf or email exists, 'update' overwrites them by cpf.
+        :return: A dictionary with read, inserted, updated and skipped counts.
+        """
+
+        stats = UserImporter().import_users(users, on_conflict=on_conflict)
+        if stats["updated"] > 0:
+            # updated users are matched by cpf, their ids are unknown here
+            user_cache_invalidation.clear()
+        elif stats["inserted"] > 0:
+            user_cache_invalidation.evict([])
+        if stats["inserted"] > 0 or stats["updated"] > 0:
+            with DBConnectionHandler() as db_connection:
+                try:
+                    user_change_notifier.notify(db_connection, [ALL_USERS])
+                    db_connection.session.commit()
+                finally:
+                    db_connection.session.close()
+
+        return stats
+
+    def __insert_single_row(self, db_connection: DBConnectionHandler, row: dict) -> UserBulkResult:
+        """
+        Insert one user row in its own transaction, reporting a unique conflict as a failure.
+
+        :param db_connection: The connection handler to insert with.
+        :param row: A dictionary with the users table columns.
+        :return: The UserBulkResult of the row.
+        """
+
+        try:
+            db_connection.session.execute(UserModel.__table__.insert(), row)
+            user_change_notifier.notify(db_connection, [row["id"]])
+            db_connection.session.commit()
+            return UserBulkResult(True, data=self.__build_row_to_domain_interface(row))
+        except IntegrityError:
+            db_connection.session.rollback()
+            return UserBulkResult(False, error="cpf or email already exists")
+
+    def __build_row_to_domain_interface(self, row: dict) -> User:
+        """
+        Transform a users table row dictionary into named tuple domain model User
+        :param  - row: A dictionary with the users table columns
+        :return - A domain User
+        """
+
+        return User(
+            id=row["id"],
+            name=row["name"],
+            last_name=row["last_name"],
+            email=row["email"],
+            cpf=row["cpf"],
+        )
+
     def update_user(
         self,
         id: str,
@@ -82,52 +261,131 @@ class UserRepository(UserRepositoryInterface):
         cpf: str,
     ) -> User:
         """
-        Update an existing user in the database.
+        Update an existing user in the database with a single UPDATE statement, returning the
+        written row where the dialect supports RETURNING.
 
         :param id: The unique identifier of the user to update.
         :param name: The new first name of the user.
         :param email: The new email address of the user.
         :param last_name: The new last name of the user.
         :param cpf: The new CPF of the user.
-        :return: The updated User domain model.
+        :return: The updated User domain model, None if no user has the id.
         """
 
+        values = dict(name=name, email=email, last_name=last_name, cpf=cpf)
+        table = UserModel.__table__
+        statement = (
+            table.update()
+            .where(table.c.id == id)
+            .values(**values)
+            .execution_options(**{FINGERPRINT_OPTION: "update_user"})
+        )
+
         with DBConnectionHandler() as db_connection:
             try:
-                entity_instance = db_connection.session.get(UserModel, id)
-                entity_instance.name = name
-                entity_instance.cpf = cpf
-                entity_instance.email = email
-                entity_instance.last_name = last_name
-
-                db_connection.session.merge(entity_instance)
+                if self.__supports_returning(db_connection):
+                    row = db_connection.session.execute(
+                        statement.returning(*RETURNING_COLUMNS)
+                    ).first()
+                    record = self.__build_row_to_domain_interface(row._mapping) if row else None
+                else:
+                    # every column is written, so the row is known without reading it back
+                    updated = db_connection.session.execute(statement).rowcount
+                    record = User(id=id, **values) if updated > 0 else None
+
+                if record is None:
+                    db_connection.session.rollback()
+                    return None
+
+                user_change_notifier.notify(db_connection, [id])
                 db_connection.session.commit()
+                user_cache_invalidation.evict([id])
 
-                return self.__build_entity_to_domain_interface(entity_instance)
+                return record
             except:
                 db_connection.session.rollback()
                 raise
             finally:
                 db_connection.session.close()
 
+    def patch_user(
+        self, id: str, values: dict, expected: Union[dict, None] = None
+    ) -> Union[User, None]:
+        """
+        Update only the supplied columns of a user, so unchanged cpf and email keep their unique
+        index entries untouched. With expected, the update only applies while the row still has
+        those values, an optimistic concurrency check done by the UPDATE itself.
+
+        :param id: The unique identifier of the user to update.
+        :param values: The columns to write, a non empty subset of name, last_name, email and cpf.
+        :param expected: The column values the row must still have. Defaults to None (no check).
+        :return: The updated User domain model, None if no user has the id or expected did not match.
+        """
+
+        table = UserModel.__table__
+        conditions = [table.c.id == id]
+        for column, value in (expected or {}).items():
+            if column != "id":
+                conditions.append(table.c[column] == value)
+
+        statement = (
+            table.update()
+            .where(*conditions)
+            .values(**values)
+            .execution_options(**{FINGERPRINT_OPTION: "update_user"})
+        )
+
+        with DBConnectionHandler() as db_connection:
+            try:
+                if self.__supports_returning(db_connection):
+                    row = db_connection.session.execute(
+                        statement.returning(*RETURNING_COLUMNS)
+                    ).first()
+                elif db_connection.session.execute(statement).rowcount > 0:
+                    row = db_connection.session.execute(
+                        select(*RETURNING_COLUMNS).where(table.c.id == id)
+                    ).first()
+                else:
+                    row = None
+
+                if row is None:
+                    db_connection.session.rollback()
+                    return None
+
+                user_change_notifier.notify(db_connection, [id])
+                db_connection.session.commit()
+                user_cache_invalidation.evict([id])
+
+                return self.__build_row_to_domain_interface(row._mapping)
+            except:
+                db_connection.session.rollback()
+                raise
+            finally:
+                db_connection.session.close()
 
     def delete_user(self, id: str) -> bool:
         """
-        Delete a user from the database by their unique identifier.
+        Delete a user from the database by their unique identifier with a single DELETE statement.
 
         :param id: The unique identifier of the user to delete.
-        :return: True if the deletion was successful, False otherwise.
+        :return: True if the user was deleted, False if no user has the id.
         """
 
+        table = UserModel.__table__
         with DBConnectionHandler() as db_connection:
             try:
-                entity_instance = (
-                    db_connection.session.query(UserModel)
-                    .filter(UserModel.id == id)
-                    .first()
-                )
-                db_connection.session.delete(entity_instance)
+                deleted = db_connection.session.execute(
+                    table.delete()
+                    .where(table.c.id == id)
+                    .execution_options(**{FINGERPRINT_OPTION: "delete_user"})
+                ).rowcount
+                if deleted == 0:
+                    db_connection.session.rollback()
+                    return False
+
+                user_change_notifier.notify(db_connection, [id])
                 db_connection.session.commit()
+                user_cache_invalidation.evict([id])
                 return True
             except:
                 db_connection.session.rollback()
@@ -135,6 +393,182 @@ class UserRepository(UserRepositoryInterface):
             finally:
                 db_connection.session.close()
 
+    def delete_user_returning(self, id: str) -> Union[User, None]:
+        """
+        Delete a user and return the deleted row. Dialects supporting RETURNING do it in a single
+        DELETE statement, others read the user, from the user cache when possible, then delete it.
+
+        :param id: The unique identifier of the user to delete.
+        :return: The deleted User domain model, None if no user has the id.
+        """
+
+        table = UserModel.__table__
+        with DBConnectionHandler() as db_connection:
+            if not self.__supports_returning(db_connection):
+                record = self.get_user(id)
+                if record is None or not self.delete_user(id):
+                    return None
+                return record
+
+            try:
+                row = db_connection.session.execute(
+                    table.delete()
+                    .where(table.c.id == id)
+                    .returning(*RETURNING_COLUMNS)
+                    .execution_options(**{FINGERPRINT_OPTION: "delete_user"})
+                ).first()
+                if row is None:
+                    db_connection.session.rollback()
+                    return None
+
+                user_change_notifier.notify(db_connection, [id])
+                db_connection.session.commit()
+                user_cache_invalidation.evict([id])
+                return self.__build_row_to_domain_interface(row._mapping)
+            except:
+                db_connection.session.rollback()
+                raise
+            finally:
+                db_connection.session.close()
+
+    @staticmethod
+    def __supports_returning(db_connection: DBConnectionHandler) -> bool:
+        """
+        Tells whether UPDATE and DELETE statements can return rows on the connection dialect.
+        SQLite has RETURNING since 3.35, but the SQLAlchemy 1.4 compiler does not emit it.
+
+        :param db_connection: The connection handler the statement will run on.
+        :return: True if RETURNING can be used.
+        """
+
+        return bool(getattr(db_connection.engine.dialect, "full_returning", False))
+
+    def update_users(self, ids: List[str], values: dict) -> int:
+        """
+        Set the same values on many users with set-based UPDATE ... WHERE id IN statements, in one
+        transaction. A cpf or email taken by another user rolls back every change.
+
+        :param ids: The unique identifiers of the users to update.
+        :param values: The new column values, a subset of name, last_name, email and cpf.
+        :return: The number of users updated.
+        """
+
+        unique_ids = list(dict.fromkeys(ids))
+        table = UserModel.__table__
+
+        with DBConnectionHandler() as db_connection:
+            try:
+                updated = 0
+                for chunk in self.__chunks(unique_ids):
+                    updated += db_connection.session.execute(
+                        table.update().where(table.c.id.in_(chunk)).values(**values),
+                        execution_options={FINGERPRINT_OPTION: "update_users"},
+                    ).rowcount
+                user_change_notifier.notify(db_connection, unique_ids)
+                db_connection.session.commit()
+            except IntegrityError:
+                db_connection.session.rollback()
+                raise ValueError("cpf or email already exists")
+            except:
+                db_connection.session.rollback()
+                raise
+            finally:
+                db_connection.session.close()
+
+        user_cache_invalidation.evict(unique_ids)
+        return updated
+
+    def update_users_rows(self, users: List[dict]) -> int:
+        """
+        Set per user values with one executemany UPDATE for each set of changed columns, in one
+        transaction. A cpf or email taken by another user rolls back every change.
+
+        :param users: A list of dictionaries having id and a subset of name, last_name, email and cpf.
+            The changes of a repeated id are merged in order, later values winning.
+        :return: The number of users updated.
+        """
+
+        # one row per user, so the rowcount never counts a user twice
+        merged = {}
+        for user in users:
+            merged.setdefault(user["id"], {}).update(user)
+
+        groups = {}
+        for user in merged.values():
+            columns = tuple(sorted(column for column in user if column != "id"))
+            row = {"b_" + column: value for column, value in user.items()}
+            groups.setdefault(columns, []).append(row)
+
+        table = UserModel.__table__
+        ids = list(merged)
+
+        with DBConnectionHandler() as db_connection:
+            try:
+                updated = 0
+                for columns, rows in groups.items():
+                    statement = (
+                        table.update()
+                        .where(table.c.id == bindparam("b_id"))
+                        .values({column: bindparam("b_" + column) for column in columns})
+                    )
+                    updated += db_connection.session.execute(
+                        statement, rows, execution_options={FINGERPRINT_OPTION: "update_users"}
+                    ).rowcount
+                user_change_notifier.notify(db_connection, ids)
+                db_connection.session.commit()
+            except IntegrityError:
+                db_connection.session.rollback()
+                raise ValueError("cpf or email already exists")
+            except:
+                db_connection.session.rollback()
+                raise
+            finally:
+                db_connection.session.close()
+
+        user_cache_invalidation.evict(ids)
+        return updated
+
+    def delete_users(self, ids: List[str]) -> int:
+        """
+        Delete many users with set-based DELETE ... WHERE id IN statements, in one transaction.
+
+        :param ids: The unique identifiers of the users to delete.
+        :return: The number of users deleted.
+        """
+
+        unique_ids = list(dict.fromkeys(ids))
+        table = UserModel.__table__
+
+        with DBConnectionHandler() as db_connection:
+            try:
+                deleted = 0
+                for chunk in self.__chunks(unique_ids):
+                    deleted += db_connection.session.execute(
+                        table.delete().where(table.c.id.in_(chunk)),
+                        execution_options={FINGERPRINT_OPTION: "delete_users"},
+                    ).rowcount
+                user_change_notifier.notify(db_connection, unique_ids)
+                db_connection.session.commit()
+            except:
+                db_connection.session.rollback()
+                raise
+            finally:
+                db_connection.session.close()
+
+        user_cache_invalidation.evict(unique_ids)
+        return deleted
+
+    @staticmethod
+    def __chunks(ids: List[str]) -> Iterator[List[str]]:
+        """
+        Split ids into chunks small enough for the bound parameter limit of every database
+        :param  - ids: A list of ids
+        :return - An iterator of lists of at most IN_CHUNK_SIZE ids
+        """
+
+        for start in range(0, len(ids), IN_CHUNK_SIZE):
+            yield ids[start:start + IN_CHUNK_SIZE]
+
     def select_users(
         self,
         name: str = "",
@@ -170,15 +604,13 @@ class UserRepository(UserRepositoryInterface):
                     (
                         db_connection.session.query(UserModel)
                         .filter(
-                            UserModel.name.ilike("%" + name + "%"),
-                            UserModel.email.ilike("%" + email + "%"),
-                            UserModel.last_name.ilike("%" + last_name + "%"),
-                            UserModel.cpf.ilike("%" + cpf + "%"),
+                            *self.__build_search_filters(db_connection, name, email, last_name, cpf)
                         )
                     )
                     .order_by(order_by_attribute)
                     .limit(limit)
                     .offset(page)
+                    .execution_options(**{FINGERPRINT_OPTION: "select_users"})
                 )
                 
                 return list(
@@ -197,6 +629,211 @@ class UserRepository(UserRepositoryInterface):
             finally:
                 db_connection.session.close()
 
+    def select_users_by_cursor(
+        self,
+        name: str = "",
+        email: str = "",
+        last_name: str = "",
+        cpf: str = "",
+        column: str = "name",
+        order: str = "desc",
+        cursor: Union[str, None] = None,
+        limit: int = 10,
+    ) -> Tuple[List[User], Union[str, None]]:
+        """
+        Select users with keyset pagination on (column, id), so each page is an index range scan
+        starting right after the previous one instead of an offset that skips every earlier row.
+
+        :param name: Filter by the user's first name. Defaults to empty string (no filter).
+        :param email: Filter by the user's email. Defaults to empty string (no filter).
+        :param last_name: Filter by the user's last name. Defaults to empty string (no filter).
+        :param cpf: Filter by the user's CPF. Defaults to empty string (no filter).
+        :param column: The column to sort the results by, one of KEYSET_COLUMNS. Defaults to 'name'.
+        :param order: The order of sorting ('asc' for ascending, 'desc' for descending). Defaults to 'desc'.
+        :param cursor: The next_cursor of the previous page. Defaults to None (first page).
+        :param limit: The number of results to return per page. Defaults to 10.
+        :return: A tuple with the list of User domain models and the cursor of the next page, None on the last page.
+        """
+
+        if column not in KEYSET_COLUMNS:
+            raise ValueError("Invalid cursor sort column: {}".format(column))
+
+        attribute = getattr(UserModel, column)
+        if order == "desc":
+            order_by_attributes = [attribute.desc(), UserModel.id.desc()]
+        else:
+            order_by_attributes = [attribute.asc(), UserModel.id.asc()]
+
+        seek_filters = []
+        if cursor:
+            value, last_id = decode_cursor(cursor, column, order)
+            if order == "desc":
+                seek_filters.append(tuple_(attribute, UserModel.id) < tuple_(value, last_id))
+            else:
+                seek_filters.append(tuple_(attribute, UserModel.id) > tuple_(value, last_id))
+
+        with DBConnectionHandler() as db_connection:
+            try:
+                filters = self.__build_search_filters(db_connection, name, email, last_name, cpf)
+                filters.extend(seek_filters)
+
+                # one extra row tells whether a next page exists
+                query_data = (
+                    db_connection.session.query(UserModel)
+                    .filter(*filters)
+                    .order_by(*order_by_attributes)
+                    .limit(limit + 1)
+                    .execution_options(**{FINGERPRINT_OPTION: "select_users"})
+                    .all()
+                )
+
+                next_cursor = None
+                if len(query_data) > limit:
+                    query_data = query_data[:limit]
+                    last = query_data[-1]
+                    next_cursor = encode_cursor(column, order, getattr(last, column), last.id)
+
+                records = [
+                    self.__build_entity_to_domain_interface(instance)
+                    for instance in query_data
+                ]
+                return records, next_cursor
+            except:
+                db_connection.session.rollback()
+                raise
+            finally:
+                db_connection.session.close()
+
+    def stream_users(
+        self,
+        name: str = "",
+        email: str = "",
+        last_name: str = "",
+        cpf: str = "",
+        column: str = "name",
+        order: str = "asc",
+        batch_size: int = 1000,
+    ) -> Iterator[User]:
+        """
+        Stream every user matching the search criteria through a server-side cursor, fetching
+        batch_size rows at a time so memory stays flat whatever the number of rows. The
+        connection is held until the iterator is exhausted or closed.
+
+        :param name: Filter by the user's first name. Defaults to empty string (no filter).
+        :param email: Filter by the user's email. Defaults to empty string (no filter).
+        :param last_name: Filter by the user's last name. Defaults to empty string (no filter).
+        :param cpf: Filter by the user's CPF. Defaults to empty string (no filter).
+        :param column: The column to sort the results by. Defaults to 'name'.
+        :param order: The order of sorting ('asc' for ascending, 'desc' for descending). Defaults to 'asc'.
+        :param batch_size: The number of rows fetched per round trip. Defaults to 1000.
+        :return: An iterator of User domain models.
+        :raises ValueError: On an invalid column or order, before the iterator is returned.
+        """
+
+        # checked here, a generator would only raise once the response has started
+        if column not in UserModel.__table__.columns:
+            raise ValueError("Invalid sort column: {}".format(column))
+        if order not in ("asc", "desc"):
+            raise ValueError("Invalid sort order: {}".format(order))
+
+        attribute = getattr(UserModel, column)
+        order_by_attribute = attribute.desc() if order == "desc" else attribute.asc()
+
+        return self.__stream_users(name, email, last_name, cpf, order_by_attribute, batch_size)
+
+    def __stream_users(
+        self, name: str, email: str, last_name: str, cpf: str, order_by_attribute, batch_size: int
+    ) -> Iterator[User]:
+        """
+        Generator behind stream_users, opening the connection on the first row requested
+        :return: An iterator of User domain models.
+        """
+
+        with DBConnectionHandler() as db_connection:
+            try:
+                # plain columns instead of entities keep rows out of the identity map
+                query_data = (
+                    db_connection.session.query(
+                        UserModel.id,
+                        UserModel.name,
+                        UserModel.email,
+                        UserModel.last_name,
+                        UserModel.cpf,
+                    )
+                    .filter(*self.__build_search_filters(db_connection, name, email, last_name, cpf))
+                    .order_by(order_by_attribute)
+                    .yield_per(batch_size)
+                    .execution_options(
+                        stream_results=True, **{FINGERPRINT_OPTION: "select_users"}
+                    )
+                )
+
+                for row in query_data:
+                    yield User(*row)
+            except:
+                db_connection.session.rollback()
+                raise
+            finally:
+                db_connection.session.close()
+
+    def select_users_with_total(
+        self,
+        name: str = "",
+        email: str = "",
+        last_name: str = "",
+        cpf: str = "",
+        column: str = "name",
+        order: str = "desc",
+        page: int = 0,
+        limit: int = 10,
+    ) -> Tuple[List[User], int]:
+        """
+        Select a page of users and the total of users matching the search criteria in a single
+        statement, using a count(*) OVER () window computed before LIMIT/OFFSET.
+
+        :param name: Filter by the user's first name. Defaults to empty string (no filter).
+        :param email: Filter by the user's email. Defaults to empty string (no filter).
+        :param last_name: Filter by the user's last name. Defaults to empty string (no filter).
+        :param cpf: Filter by the user's CPF. Defaults to empty string (no filter).
+        :param column: The column to sort the results by. Defaults to 'name'.
+        :param order: The order of sorting ('asc' for ascending, 'desc' for descending). Defaults to 'desc'.
+        :param page: The page number for pagination. Defaults to 0.
+        :param limit: The number of results to return per page. Defaults to 10.
+        :return: A tuple with the list of User domain models of the page and the total count.
+        """
+
+        attribute = getattr(UserModel, column)
+        order_by_attribute = attribute.desc() if order == "desc" else attribute.asc()
+
+        with DBConnectionHandler() as db_connection:
+            try:
+                query_data = (
+                    db_connection.session.query(
+                        UserModel, func.count().over().label("total")
+                    )
+                    .filter(*self.__build_search_filters(db_connection, name, email, last_name, cpf))
+                    .order_by(order_by_attribute)
+                    .limit(limit)
+                    .offset(page)
+                    .execution_options(**{FINGERPRINT_OPTION: "select_users_with_total"})
+                    .all()
+                )
+            except:
+                db_connection.session.rollback()
+                raise
+            finally:
+                db_connection.session.close()
+
+        # An offset past the last row returns no rows, and so no window value to read
+        if len(query_data) == 0:
+            total = 0 if page == 0 else self.count_users(name, email, last_name, cpf)
+            return [], total
+
+        records = [
+            self.__build_entity_to_domain_interface(instance)
+            for instance, _ in query_data
+        ]
+        return records, query_data[0].total
 
     def count_users(
         self,
@@ -219,12 +856,8 @@ class UserRepository(UserRepositoryInterface):
             try:
                 count = (
                     db_connection.session.query(UserModel)
-                    .filter(
-                        UserModel.name.ilike("%" + name + "%"),
-                        UserModel.email.ilike("%" + email + "%"),
-                        UserModel.last_name.ilike("%" + last_name + "%"),
-                        UserModel.cpf.ilike("%" + cpf + "%"),
-                    )
+                    .filter(*self.__build_search_filters(db_connection, name, email, last_name, cpf))
+                    .execution_options(**{FINGERPRINT_OPTION: "count_users"})
                     .count()
                 )
                 return count
@@ -238,6 +871,74 @@ class UserRepository(UserRepositoryInterface):
 
 
     def get_user(cls, id: str) -> User:
+        """
+        Retrieve a user by their unique identifier, from the in-process user cache when it
+        holds a fresh copy, from the read cache next, from the database otherwise.
+
+        :param id: The unique identifier of the user to retrieve.
+        :return: The User domain model if found, None otherwise.
+        """
+
+        return user_cache.get_or_load(id, lambda: cls.__load_user(id))
+
+    def __load_user(cls, id: str) -> Union[User, None]:
+        """
+        Retrieve a user from the read cache, shared by the replicas on the redis and file backends,
+        filling it from the database on a miss.
+
+        :param id: The unique identifier of the user to retrieve.
+        :return: The User domain model if found, None otherwise.
+        """
+
+        def fetch():
+            user = cls.__fetch_user(id)
+            return user._asdict() if user is not None else None
+
+        data = read_cache.get_or_load(USER_NAMESPACE, id, fetch)
+        return User(**data) if data is not None else None
+
+    def get_users(self, ids: List[str]) -> List[Union[User, None]]:
+        """
+        Retrieve many users by their unique identifiers. Users held by the in-process user cache
+        or the read cache are served from them and the others are read with a single IN query.
+
+        :param ids: The unique identifiers of the users to retrieve.
+        :return: A list in the order of ids, having the User domain model or None when not found.
+        """
+
+        found = {}
+        missing = set()
+        for id in ids:
+            user = user_cache.get(id)
+            if user is None:
+                data = read_cache.get(USER_NAMESPACE, id)
+                user = User(**data) if data is not None else None
+            if user is not None:
+                found[id] = user
+            else:
+                missing.add(id)
+
+        if len(missing) > 0:
+            with DBConnectionHandler() as db_connection:
+                try:
+                    query_data = (
+                        db_connection.session.query(UserModel)
+                        .filter(UserModel.id.in_(missing))
+                        .execution_options(**{FINGERPRINT_OPTION: "get_users"})
+                        .all()
+                    )
+                    for instance in query_data:
+                        user = self.__build_entity_to_domain_interface(instance)
+                        found[user.id] = user
+                except:
+                    db_connection.session.rollback()
+                    raise
+                finally:
+                    db_connection.session.close()
+
+        return [found.get(id) for id in ids]
+
+    def __fetch_user(cls, id: str) -> User:
         """
         Retrieve a user from the database by their unique identifier.
 
@@ -252,7 +953,7 @@ class UserRepository(UserRepositoryInterface):
                 if query_data is not None:
                     return cls.__build_entity_to_domain_interface(query_data)
             except NoResultFound:
-                return []
+                return None
             except:
                 db_connection.session.rollback()
                 raise
@@ -0,0 +1,91 @@
+from typing import Dict
+from sqlalchemy import text, inspect
+from sqlalchemy.engine import Engine
+from src.infra.entities import User as UserModel
+
+SEARCHABLE_COLUMNS = ("name", "last_name", "email", "cpf")
+SQLITE_SEARCH_TABLE = "users_search"
+
+
+class IlikeSearchBackend:
+    """
+    Substring search with ILIKE predicates. On PostgreSQL the pg_trgm GIN indexes created by
+    the migrations serve these predicates, leading wildcard included.
+    """
+
+    def build_filters(self, **terms: str) -> list:
+        """
+        Build filter expressions for the non empty search terms
+        :param  - terms: Substrings to search keyed by column name
+        :return - A list of sqlalchemy filter expressions
+        """
+
+        return [
+            getattr(UserModel, column).ilike("%" + value + "%")
+            for column, value in terms.items()
+            if value
+        ]
+
+
+class SqliteTrigramSearchBackend:
+    """
+    Substring search on SQLite through the users_search FTS5 table with the trigram
+    tokenizer, which answers LIKE '%term%' from its index for terms of 3 or more characters.
+    """
+
+    def build_filters(self, **terms: str) -> list:
+        """
+        Build a single id filter on the FTS5 table for the non empty search terms
+        :param  - terms: Substrings to search keyed by column name
+        :return - A list of sqlalchemy filter expressions
+        """
+
+        predicates = []
+        params = {}
+        for column, value in terms.items():
+            if value:
+                predicates.append("{0} LIKE :search_{0}".format(column))
+                params["search_" + column] = "%" + value + "%"
+
+        if len(predicates) == 0:
+            return []
+
+        subquery = text(
+            "users.id IN (SELECT id FROM {} WHERE {})".format(
+                SQLITE_SEARCH_TABLE, " AND ".join(predicates)
+            )
+        ).bindparams(**params)
+        return [subquery]
+
+
+ilike_search_backend = IlikeSearchBackend()
+sqlite_trigram_search_backend = SqliteTrigramSearchBackend()
+_search_backends: Dict[str, object] = {}
+
+
+def get_search_backend(engine: Engine):
+    """
+    Returns the search backend for an engine, checking once whether the SQLite FTS5 table exists
+    :param  - engine: The sqlalchemy Engine the query will run on
+    :return - A search backend having build_filters
+    """
+
+    key = str(engine.url)
+    backend = _search_backends.get(key)
+    if backend is None:
+        backend = ilike_search_backend
+        if engine.dialect.name == "sqlite" and inspect(engine).has_table(SQLITE_SEARCH_TABLE):
+            backend = sqlite_trigram_search_backend
+        _search_backends[key] = backend
+
+    return backend
+
+
+def reset_search_backends() -> None:
+    """
+    Forgets the backend chosen for each engine, e.g. after migrating a SQLite database
+    :param  - None
+    :return - None
+    """
+
+    _search_backends.clear()
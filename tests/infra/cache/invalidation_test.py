@@ -0,0 +1,70 @@
+import os
+import uuid
+from unittest import mock
+from faker import Faker
+from src.infra.cache import TTLLRUCache, CacheInvalidationListener
+from src.infra.config import DBConnectionHandler
+from src.infra.notifications import UserChangeNotifier, ALL_USERS, in_process_bus
+from src.infra.repo import UserRepository
+
+fake = Faker()
+MOCK_DB_PATH = "sqlite:///mock_data.db"
+
+
+def test_build_payloads():
+    """
+    Test that ids are split into NOTIFY sized payloads
+    :param - None
+    :return - None
+    """
+
+    ids = [str(uuid.uuid4()) for _ in range(250)]
+    payloads = UserChangeNotifier.build_payloads(ids)
+    assert len(payloads) == 2
+    assert payloads[0].split(",") + payloads[1].split(",") == ids
+    assert all(len(payload) < 8000 for payload in payloads)
+
+    assert UserChangeNotifier.build_payloads([]) == []
+    assert UserChangeNotifier.build_payloads(["x"] * 2001) == [ALL_USERS]
+
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_writes_evict_other_replica_caches():
+    """
+    Test that writes evict the user from the caches of every listener, standing in for
+    replicas with the in-process bus, and only once the transaction commits
+    :param - None
+    :return - None
+    """
+
+    engine = DBConnectionHandler().engine
+    replica_cache = TTLLRUCache("replica", maxsize=10, ttl=60)
+    listener = CacheInvalidationListener([replica_cache])
+    listener.start(engine)
+
+    repository = UserRepository()
+    user = repository.create_user(
+        name=fake.name(),
+        email=fake.email(),
+        last_name=fake.last_name(),
+        cpf=fake.pystr(min_chars=11, max_chars=11),
+    )
+
+    try:
+        replica_cache.set(user.id, user)
+        repository.update_user(
+            id=user.id, name="Changed", email=user.email, last_name=user.last_name, cpf=user.cpf
+        )
+        assert replica_cache.get(user.id) is None
+
+        replica_cache.set(user.id, user)
+        with DBConnectionHandler() as db_connection:
+            UserChangeNotifier(in_process_bus).notify(db_connection, [user.id])
+            db_connection.session.rollback()
+        assert replica_cache.get(user.id) == user
+
+        repository.delete_user(user.id)
+        assert replica_cache.get(user.id) is None
+    finally:
+        listener.stop()
+        engine.execute("DELETE FROM users WHERE id = '{}'".format(user.id))
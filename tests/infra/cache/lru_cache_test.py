@@ -0,0 +1,61 @@
+import time
+from src.infra.cache import TTLLRUCache
+
+
+def test_lru_eviction_and_stats():
+    """
+    Test the size bound, the LRU order and the counters of the cache
+    :param - None
+    :return - None
+    """
+
+    cache = TTLLRUCache("test", maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    stats = cache.stats()
+    assert stats.hits == 3
+    assert stats.misses == 1
+    assert stats.evictions == 1
+    assert stats.size == 2
+
+
+def test_ttl_expiration():
+    """
+    Test that expired entries are not returned
+    :param - None
+    :return - None
+    """
+
+    cache = TTLLRUCache("test", maxsize=10, ttl=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+
+
+def test_read_through_skips_stale_loads():
+    """
+    Test that a value loaded while the key is invalidated is not cached
+    :param - None
+    :return - None
+    """
+
+    cache = TTLLRUCache("test", maxsize=10, ttl=60)
+
+    def load_while_writing():
+        cache.delete("a")
+        return "stale"
+
+    assert cache.get_or_load("a", load_while_writing) == "stale"
+    assert cache.get("a") is None
+
+    assert cache.get_or_load("a", lambda: "fresh") == "fresh"
+    assert cache.get_or_load("a", lambda: "other") == "fresh"
+    assert cache.get_or_load("missing", lambda: None) is None
+    assert cache.stats().size == 1
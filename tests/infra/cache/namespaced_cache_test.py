@@ -0,0 +1,132 @@
+import time
+import asyncio
+import pytest
+from src.infra.cache import (
+    NamespacedCache,
+    InMemoryCacheBackend,
+    FileCacheBackend,
+    build_cache_backend,
+)
+
+
+@pytest.fixture(params=["memory", "file"])
+def backend(request, tmp_path):
+    if request.param == "file":
+        return FileCacheBackend(str(tmp_path))
+    return InMemoryCacheBackend(maxsize=100)
+
+
+def test_get_set_and_ttl(backend):
+    """
+    Test that values round trip through serialization and expire after their ttl
+    :param - None
+    :return - None
+    """
+
+    cache = NamespacedCache(backend, ttls={"short": 0.05})
+    cache.set("user", "1", {"id": "1", "name": "Ana"})
+    assert cache.get("user", "1") == {"id": "1", "name": "Ana"}
+    assert cache.get("user", "2") is None
+
+    cache.set("short", "1", [1, 2])
+    assert cache.get("short", "1") == [1, 2]
+    time.sleep(0.06)
+    assert cache.get("short", "1") is None
+
+
+def test_namespace_invalidation(backend):
+    """
+    Test that invalidating a namespace drops all of its keys and only them
+    :param - None
+    :return - None
+    """
+
+    cache = NamespacedCache(backend, serializer="json")
+    cache.set("user_list", "page-0", [{"id": "1"}])
+    cache.set("user_list", "page-1", [{"id": "2"}])
+    cache.set("user", "1", {"id": "1"})
+
+    cache.invalidate("user_list")
+    assert cache.get("user_list", "page-0") is None
+    assert cache.get("user_list", "page-1") is None
+    assert cache.get("user", "1") == {"id": "1"}
+
+
+def test_delete_during_load_is_not_cached(backend):
+    """
+    Test that a value loaded while the key is deleted is returned but not cached
+    :param - None
+    :return - None
+    """
+
+    cache = NamespacedCache(backend)
+
+    def stale_loader():
+        cache.delete("user", "1")
+        return {"id": "1", "name": "stale"}
+
+    assert cache.get_or_load("user", "1", stale_loader) == {"id": "1", "name": "stale"}
+    assert cache.get("user", "1") is None
+
+    assert cache.get_or_load("user", "2", lambda: {"id": "2"}) == {"id": "2"}
+    assert cache.get_or_load("user", "2", lambda: None) == {"id": "2"}
+
+
+def test_get_or_load_async(backend):
+    """
+    Test that the async read-through caches loaded values, but not one loaded while its key is deleted
+    :param - None
+    :return - None
+    """
+
+    cache = NamespacedCache(backend)
+
+    async def stale_loader():
+        cache.delete("user", "1")
+        return {"id": "1", "name": "stale"}
+
+    async def loader():
+        return {"id": "2"}
+
+    async def no_loader():
+        return None
+
+    async def proceed():
+        assert await cache.get_or_load_async("user", "1", stale_loader) == {"id": "1", "name": "stale"}
+        assert cache.get("user", "1") is None
+
+        assert await cache.get_or_load_async("user", "2", loader) == {"id": "2"}
+        assert await cache.get_or_load_async("user", "2", no_loader) == {"id": "2"}
+
+    asyncio.run(proceed())
+
+
+def test_json_is_the_default_serializer(backend):
+    """
+    Test that values are stored as JSON unless pickle is asked for
+    :param - None
+    :return - None
+    """
+
+    cache = NamespacedCache(backend)
+    cache.set("user_list", "page-0", ([{"id": "1"}], {"total": 1}))
+    assert cache.get("user_list", "page-0") == [[{"id": "1"}], {"total": 1}]
+
+    # only pickle could store a set
+    cache.set("user_list", "page-1", {"1"})
+    assert cache.get("user_list", "page-1") is None
+
+    cache = NamespacedCache(backend, serializer="pickle")
+    cache.set("user_list", "page-1", {"1"})
+    assert cache.get("user_list", "page-1") == {"1"}
+
+
+def test_unknown_backend():
+    """
+    Test that an unknown backend name is rejected
+    :param - None
+    :return - None
+    """
+
+    with pytest.raises(ValueError):
+        build_cache_backend("memcached")
@@ -0,0 +1,105 @@
+import time
+import asyncio
+import threading
+import pytest
+from src.infra.cache import SingleFlight, AsyncSingleFlight
+
+
+def run_concurrently(count, target):
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(index):
+        barrier.wait()
+        try:
+            results[index] = target()
+        except Exception as error:
+            results[index] = error
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_calls_share_one_execution():
+    """
+    Test that concurrent calls with the same key run the function once and share its result
+    :param - None
+    :return - None
+    """
+
+    single_flight = SingleFlight()
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"id": "1"}
+
+    results = run_concurrently(8, lambda: single_flight.do("1", load))
+    assert len(calls) == 1
+    assert all(result == {"id": "1"} for result in results)
+    assert single_flight.in_flight() == 0
+
+    single_flight.do("1", load)
+    assert len(calls) == 2
+
+
+def test_errors_are_shared():
+    """
+    Test that waiting callers receive the exception of the shared call
+    :param - None
+    :return - None
+    """
+
+    single_flight = SingleFlight()
+
+    def fail():
+        time.sleep(0.05)
+        raise ValueError("database unavailable")
+
+    results = run_concurrently(4, lambda: single_flight.do("1", fail))
+    assert all(isinstance(result, ValueError) for result in results)
+
+    with pytest.raises(ValueError):
+        single_flight.do("1", fail)
+
+
+def test_concurrent_coroutines_share_one_execution():
+    """
+    Test that concurrent coroutines with the same key await one execution and share its result or error
+    :param - None
+    :return - None
+    """
+
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"id": "1"}
+
+    async def fail():
+        await asyncio.sleep(0.05)
+        raise ValueError("database unavailable")
+
+    async def proceed():
+        results = await asyncio.gather(*[single_flight.do("1", load) for _ in range(8)])
+        assert len(calls) == 1
+        assert all(result == {"id": "1"} for result in results)
+        assert single_flight.in_flight() == 0
+
+        await single_flight.do("1", load)
+        assert len(calls) == 2
+
+        results = await asyncio.gather(
+            *[single_flight.do("2", fail) for _ in range(4)], return_exceptions=True
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+        assert single_flight.in_flight() == 0
+
+    asyncio.run(proceed())
@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from src.infra.config.db_instrumentation import (
+    QueryInstrumentation,
+    fingerprint_statement,
+    parameter_shape,
+)
+
+
+def test_fingerprint_statement():
+    """
+    Test the normalization of SQL statements into metric labels
+    :param - None
+    :return - None
+    """
+
+    assert fingerprint_statement("INSERT INTO users (id) VALUES (?)") == "insert"
+    assert fingerprint_statement("UPDATE users SET email=? WHERE users.id = ?") == "update"
+    assert fingerprint_statement("DELETE FROM users WHERE users.id = ?") == "delete"
+    assert fingerprint_statement(
+        "SELECT users.id AS users_id FROM users WHERE users.id = ?"
+    ) == "get_user"
+    assert fingerprint_statement(
+        "SELECT count(*) AS count_1 FROM (SELECT users.id FROM users) AS anon_1"
+    ) == "count_users"
+    assert fingerprint_statement(
+        "SELECT users.id FROM users WHERE lower(users.name) LIKE lower(?) ORDER BY users.name ASC"
+    ) == "select_users"
+    assert fingerprint_statement("SELECT 1") == "select"
+    assert fingerprint_statement("PRAGMA table_info(users)") == "other"
+
+
+def test_parameter_shape():
+    """
+    Test that only parameter types are kept for the slow query log
+    :param - None
+    :return - None
+    """
+
+    assert parameter_shape(("a", 1)) == ["str", "int"]
+    assert parameter_shape({"cpf": "123", "limit": 10}) == {"cpf": "str", "limit": "int"}
+    assert parameter_shape([("a",), ("b",)], executemany=True) == {"rows": 2, "row": ["str"]}
+
+
+
+def test_failed_statement_is_not_timed():
+    """
+    Test a statement failing in the cursor leaves no start time behind for the next one
+    :param - None
+    :return - None
+    """
+
+    observed = []
+    instrumentation = QueryInstrumentation()
+    instrumentation.add_observer(lambda fingerprint, seconds: observed.append(fingerprint))
+    engine = create_engine("sqlite://")
+    instrumentation.instrument(engine)
+
+    with engine.connect() as connection:
+        with pytest.raises(OperationalError):
+            connection.exec_driver_sql("SELECT * FROM missing_table")
+        connection.exec_driver_sql("SELECT 1")
+
+        assert observed == ["select"]
+        assert "query_started_at" not in connection.connection.info
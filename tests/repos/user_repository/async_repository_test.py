@@ -0,0 +1,67 @@
+import os
+import asyncio
+import pytest
+from unittest import mock
+from faker import Faker
+from src.infra.repo import AsyncUserRepository
+from src.infra.config import DBConnectionHandler
+
+fake = Faker()
+MOCK_DB_PATH = "sqlite:///mock_data.db"
+
+
+@pytest.fixture(scope="session")
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def db_connection_handler():
+    return DBConnectionHandler()
+
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_async_user_repository_crud(db_connection_handler):
+    """
+    Test the create, select, update and delete actions of the asyncio Repository
+    :param - None
+    :return - None
+    """
+
+    user_repository = AsyncUserRepository()
+    engine = db_connection_handler.get_engine()
+
+    async def proceed():
+        data = await user_repository.create_user(
+            name=fake.name(),
+            email=fake.email(),
+            last_name=fake.last_name(),
+            cpf=fake.pystr(min_chars=11, max_chars=11),
+        )
+        query_entity = engine.execute(
+            "SELECT * FROM users WHERE id='{}'".format(data.id)
+        ).fetchone()
+        assert data.name == query_entity.name
+        assert query_entity.created_at is not None
+
+        assert await user_repository.get_user(data.id) == data
+
+        records, total = await user_repository.select_users_with_total(cpf=data.cpf)
+        assert records == [data]
+        assert total == 1
+        assert await user_repository.count_users(cpf=data.cpf) == 1
+
+        # many statements in flight on the same event loop
+        results = await asyncio.gather(*[user_repository.get_user(data.id) for _ in range(20)])
+        assert results == [data] * 20
+
+        updated = await user_repository.update_user(
+            id=data.id, name="changed", email=data.email, last_name=data.last_name, cpf=data.cpf
+        )
+        assert updated.name == "changed"
+        assert (await user_repository.get_user(data.id)).name == "changed"
+        assert await user_repository.update_user(
+            id="missing", name="x", email="x", last_name="x", cpf="x"
+        ) is None
+
+        assert await user_repository.delete_user_returning(data.id) == updated
+        assert await user_repository.get_user(data.id) is None
+        assert await user_repository.delete_user(data.id) is False
+
+    asyncio.run(proceed())
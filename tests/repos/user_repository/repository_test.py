@@ -87,6 +87,42 @@ def test_user_repository_get(mock_entity, db_connection_handler):
         "DELETE FROM users WHERE id='{}'".format(mock_entity["id"])
     )
 
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_user_repository_get_from_read_cache(db_connection_handler):
+    """
+    Test get reads through the read cache shared by the replicas behind the in-process user cache
+    :param - None
+    :return - None
+    """
+
+    from src.infra.cache import user_cache, user_cache_invalidation
+
+    engine = db_connection_handler.get_engine()
+    entity = {
+        "id": str(uuid.uuid4()),
+        "cpf": fake.pystr(min_chars=11, max_chars=11),
+        "name": fake.name(),
+        "last_name": fake.last_name(),
+        "email": fake.email(),
+    }
+    engine.execute(MockUtil.build_insert_sql("users", entity))
+
+    user_repository = UserRepository()
+    data = user_repository.get_user(id=entity["id"])
+
+    # another replica: an empty user cache, the row changed without its notification
+    user_cache.clear()
+    engine.execute("UPDATE users SET name='Changed' WHERE id='{}'".format(entity["id"]))
+
+    assert user_repository.get_user(id=entity["id"]) == data
+    assert user_repository.get_users([entity["id"]]) == [data]
+
+    user_cache_invalidation.evict([entity["id"]])
+
+    assert user_repository.get_user(id=entity["id"]).name == "Changed"
+
+    engine.execute("DELETE FROM users WHERE id='{}'".format(entity["id"]))
+
 @mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
 def test_user_repository_list(mock_entity, db_connection_handler):
     """
@@ -113,6 +149,35 @@ def test_user_repository_list(mock_entity, db_connection_handler):
         "DELETE FROM users WHERE id='{}'".format(mock_entity["id"])
     )
 
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_user_repository_list_with_total(mock_entity, db_connection_handler):
+    """
+    Test list query with total count in a single statement into Repository
+    :param - None
+    :return - None
+    """
+
+    engine = db_connection_handler.get_engine()
+    engine.execute(MockUtil.build_insert_sql("users", mock_entity))
+    user_repository = UserRepository()
+
+    data, total = user_repository.select_users_with_total(
+        cpf=mock_entity["cpf"]
+    )
+    assert total == 1
+    assert len(data) == 1
+    assert data[0].id == mock_entity["id"]
+
+    data, total = user_repository.select_users_with_total(
+        cpf=mock_entity["cpf"], page=5
+    )
+    assert total == 1
+    assert data == []
+
+    engine.execute(
+        "DELETE FROM users WHERE id='{}'".format(mock_entity["id"])
+    )
+
 @mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
 def test_user_repository_update(mock_entity, db_connection_handler):
     """
@@ -183,4 +248,181 @@ def test_user_repository_delete(mock_entity, db_connection_handler):
         )
         assert False
     except:
-        assert True
\ No newline at end of file
+        assert True
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_user_repository_list_by_cursor(db_connection_handler):
+    """
+    Test keyset pagination query action into Repository
+    :param - None
+    :return - None
+    """
+
+    engine = db_connection_handler.get_engine()
+    last_name = fake.pystr(min_chars=20, max_chars=20)
+    entities = [
+        {
+            "id": generate_uuid(),
+            "cpf": fake.pystr(min_chars=11, max_chars=11),
+            "name": "Same Name",
+            "last_name": last_name,
+            "email": fake.email(),
+            "created_at": "2024-01-01 00:00:00.000000",
+        }
+        for _ in range(5)
+    ]
+    for entity in entities:
+        engine.execute(MockUtil.build_insert_sql("users", entity))
+
+    user_repository = UserRepository()
+    for column in ("name", "created_at"):
+        for order in ("asc", "desc"):
+            ids = []
+            cursor = None
+            while True:
+                data, cursor = user_repository.select_users_by_cursor(
+                    last_name=last_name, column=column, order=order, cursor=cursor, limit=2
+                )
+                ids.extend(item.id for item in data)
+                if cursor is None:
+                    break
+
+            expected = sorted(entity["id"] for entity in entities)
+            assert ids == (expected if order == "asc" else expected[::-1])
+
+    with pytest.raises(ValueError):
+        user_repository.select_users_by_cursor(column="name", order="asc", cursor="invalid")
+
+    with pytest.raises(ValueError):
+        user_repository.select_users_by_cursor(column="password", order="desc")
+
+    for entity in entities:
+        engine.execute("DELETE FROM users WHERE id='{}'".format(entity["id"]))
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_user_repository_get_many(db_connection_handler):
+    """
+    Test get many INSTANCES by id action into Repository
+    :param - None
+    :return - None
+    """
+
+    engine = db_connection_handler.get_engine()
+    entities = [
+        {
+            "id": generate_uuid(),
+            "cpf": fake.pystr(min_chars=11, max_chars=11),
+            "name": fake.name(),
+            "last_name": fake.last_name(),
+            "email": fake.email(),
+        }
+        for _ in range(3)
+    ]
+    for entity in entities:
+        engine.execute(MockUtil.build_insert_sql("users", entity))
+
+    user_repository = UserRepository()
+    user_repository.get_user(id=entities[1]["id"])
+
+    ids = [entities[2]["id"], generate_uuid(), entities[0]["id"], entities[1]["id"], entities[2]["id"]]
+    data = user_repository.get_users(ids=ids)
+
+    assert [item.id if item is not None else None for item in data] == [
+        ids[0], None, ids[2], ids[3], ids[4]
+    ]
+    assert data[2].email == entities[0]["email"]
+
+    for entity in entities:
+        engine.execute("DELETE FROM users WHERE id='{}'".format(entity["id"]))
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_user_repository_bulk_update_and_delete(db_connection_handler):
+    """
+    Test set-based update and delete of many INSTANCES into Repository
+    :param - None
+    :return - None
+    """
+
+    engine = db_connection_handler.get_engine()
+    entities = [
+        {
+            "id": generate_uuid(),
+            "cpf": fake.pystr(min_chars=11, max_chars=11),
+            "name": fake.name(),
+            "last_name": fake.last_name(),
+            "email": fake.email(),
+        }
+        for _ in range(3)
+    ]
+    for entity in entities:
+        engine.execute(MockUtil.build_insert_sql("users", entity))
+    ids = [entity["id"] for entity in entities]
+
+    user_repository = UserRepository()
+    assert user_repository.update_users(ids + [generate_uuid()], {"last_name": "Bulk"}) == 3
+    assert user_repository.get_user(id=ids[0]).last_name == "Bulk"
+
+    updated = user_repository.update_users_rows(
+        [{"id": ids[0], "name": "First"}, {"id": ids[1], "name": "Second", "last_name": "Other"}]
+    )
+    assert updated == 2
+    assert user_repository.get_user(id=ids[1]).last_name == "Other"
+
+    with pytest.raises(ValueError):
+        user_repository.update_users(ids[:2], {"cpf": entities[2]["cpf"]})
+    assert user_repository.get_user(id=ids[0]).cpf == entities[0]["cpf"]
+
+    assert user_repository.delete_users(ids + [generate_uuid()]) == 3
+    assert user_repository.get_users(ids=ids) == [None, None, None]
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_user_repository_single_statement_writes(mock_entity, db_connection_handler):
+    """
+    Test that update and delete detect missing ids from the affected rows into Repository
+    :param - None
+    :return - None
+    """
+
+    engine = db_connection_handler.get_engine()
+    engine.execute(MockUtil.build_insert_sql("users", mock_entity))
+
+    user_repository = UserRepository()
+    missing = user_repository.update_user(
+        id=generate_uuid(), name="Name", email=fake.email(), last_name="Last", cpf="00000000000"
+    )
+    assert missing is None
+    assert user_repository.delete_user(id=generate_uuid()) is False
+    assert user_repository.delete_user_returning(id=generate_uuid()) is None
+
+    data = user_repository.delete_user_returning(id=mock_entity["id"])
+    assert data.id == mock_entity["id"]
+    assert data.email == mock_entity["email"]
+
+    query_entity = engine.execute(
+        "SELECT * FROM users WHERE id='{}'".format(mock_entity["id"])
+    ).fetchone()
+    assert query_entity is None
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_user_repository_patch(mock_entity, db_connection_handler):
+    """
+    Test partial update with an expected row precondition into Repository
+    :param - None
+    :return - None
+    """
+
+    engine = db_connection_handler.get_engine()
+    engine.execute(MockUtil.build_insert_sql("users", mock_entity))
+
+    user_repository = UserRepository()
+    stale = dict(mock_entity, name="Someone Else")
+    assert user_repository.patch_user(mock_entity["id"], {"last_name": "New"}, expected=stale) is None
+
+    data = user_repository.patch_user(mock_entity["id"], {"last_name": "New"}, expected=mock_entity)
+    assert data.last_name == "New"
+    assert data.name == mock_entity["name"]
+    assert data.cpf == mock_entity["cpf"]
+
+    assert user_repository.patch_user(generate_uuid(), {"last_name": "New"}) is None
+
+    engine.execute("DELETE FROM users WHERE id='{}'".format(mock_entity["id"]))
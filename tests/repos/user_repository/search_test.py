@@ -0,0 +1,87 @@
+import os
+import importlib.util
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, select
+from src.infra.config import Base
+from src.infra.entities import User as UserModel
+from src.infra.repo.user_repository.search import (
+    IlikeSearchBackend,
+    SqliteTrigramSearchBackend,
+    get_search_backend,
+    reset_search_backends,
+)
+
+MIGRATIONS_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "..", "migrations", "versions")
+
+
+def test_empty_filters_add_no_predicate():
+    """
+    Test that empty search terms do not produce predicates
+    :param - None
+    :return - None
+    """
+
+    terms = {"name": "", "email": "", "last_name": "", "cpf": ""}
+    assert IlikeSearchBackend().build_filters(**terms) == []
+    assert SqliteTrigramSearchBackend().build_filters(**terms) == []
+
+    filters = IlikeSearchBackend().build_filters(**dict(terms, name="ana"))
+    assert len(filters) == 1
+
+
+def test_sqlite_backend_selection():
+    """
+    Test that the FTS5 trigram backend is used only when its table exists
+    :param - None
+    :return - None
+    """
+
+    reset_search_backends()
+    engine = create_engine("sqlite://")
+    assert isinstance(get_search_backend(engine), IlikeSearchBackend)
+
+    reset_search_backends()
+    engine.execute(
+        "CREATE VIRTUAL TABLE users_search USING fts5(id UNINDEXED, name, last_name, email, cpf, tokenize='trigram')"
+    )
+    assert isinstance(get_search_backend(engine), SqliteTrigramSearchBackend)
+    reset_search_backends()
+
+
+def test_sqlite_search_follows_writes(tmp_path):
+    """
+    Test that the FTS5 table created by migration 0002 follows inserts, updates and deletes by users.id
+    :param - None
+    :return - None
+    """
+
+    engine = create_engine("sqlite:///{}".format(tmp_path / "search.db"))
+    Base.metadata.create_all(engine)
+
+    path = os.path.join(MIGRATIONS_PATH, "0002_user_search_indexes.py")
+    spec = importlib.util.spec_from_file_location("user_search_indexes", path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    with engine.begin() as connection:
+        with Operations.context(MigrationContext.configure(connection)):
+            migration.upgrade()
+
+    users = UserModel.__table__
+    with engine.begin() as connection:
+        for index, name in enumerate(["Ana Maria", "Bruna", "Mariana", "Joana"]):
+            connection.execute(
+                users.insert().values(
+                    id="id-{}".format(index),
+                    name=name,
+                    last_name="Silva",
+                    cpf="cpf-{}".format(index),
+                    email="user{}@example.com".format(index),
+                )
+            )
+        connection.execute(users.delete().where(users.c.id == "id-0"))
+        connection.execute(users.update().where(users.c.id == "id-3").values(name="Joana Mariano"))
+
+    filters = SqliteTrigramSearchBackend().build_filters(name="mari")
+    ids = [row.id for row in engine.execute(select(users.c.id).where(*filters).order_by(users.c.id))]
+    assert ids == ["id-2", "id-3"]
@@ -0,0 +1,59 @@
+import asyncio
+from flask import Flask
+from setup.asgi import create_asgi_app
+
+
+def create_flask_app():
+    app = Flask(__name__)
+
+    @app.route('/users/export', methods=['GET'])
+    @app.route('/users/batch-get', methods=['POST'])
+    @app.route('/users/bulk', methods=['POST', 'PATCH', 'DELETE'])
+    @app.route('/users/<id>', methods=['GET', 'PUT', 'DELETE'])
+    def wsgi_route(id=None):
+        return 'wsgi'
+
+    return app
+
+
+def call(app, method, path):
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': method,
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'root_path': '',
+        'query_string': b'',
+        'headers': [(b'host', b'localhost')],
+        'server': ('localhost', 80),
+        'client': ('127.0.0.1', 1234),
+    }
+    asyncio.run(app(scope, receive, send))
+
+    return b''.join(message.get('body', b'') for message in messages if message['type'] == 'http.response.body')
+
+
+def test_static_user_routes_reach_the_wsgi_app():
+    """
+    Test the static /users routes are not caught by the async /users/<id> routes
+    :param - None
+    :return - None
+    """
+
+    app = create_asgi_app(create_flask_app())
+
+    assert call(app, 'GET', '/users/export') == b'wsgi'
+    assert call(app, 'DELETE', '/users/bulk') == b'wsgi'
+    assert call(app, 'POST', '/users/batch-get') == b'wsgi'
+    assert call(app, 'PATCH', '/users/bulk') == b'wsgi'
@@ -0,0 +1,171 @@
+import os
+from prometheus_client import REGISTRY, CollectorRegistry, Histogram
+from prometheus_client.multiprocess import MultiProcessCollector
+from prometheus_client.mmap_dict import MmapedDict, mmap_key
+from sqlalchemy import create_engine
+from werkzeug.wrappers import Response
+from src.infra.config import TimedQueuePool
+from setup.metrics import (
+    EndpointLabels,
+    instrument_pool,
+    observe_response_size,
+    mark_process_dead,
+    clear_multiprocess_directory,
+)
+
+REQUESTS_KEY = mmap_key("requests", "requests_total", ["endpoint"], ["/users"], "Requests")
+IN_FLIGHT_KEY = mmap_key("in_flight", "in_flight", [], [], "Requests in flight")
+
+
+def write_worker_file(path, name, key, value):
+    file = MmapedDict(os.path.join(str(path), name))
+    file.write_value(key, value, 0.0)
+    file.close()
+
+
+def collect_requests(path):
+    registry = CollectorRegistry()
+    MultiProcessCollector(registry, path=str(path))
+    return registry.get_sample_value("requests_total", {"endpoint": "/users"})
+
+
+def test_dead_workers_are_archived(tmp_path, monkeypatch):
+    """
+    Test the counters of exited workers still add up after their files are archived
+    :param - None
+    :return - None
+    """
+
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    write_worker_file(tmp_path, "counter_100.db", REQUESTS_KEY, 3.0)
+    write_worker_file(tmp_path, "counter_101.db", REQUESTS_KEY, 4.0)
+    write_worker_file(tmp_path, "counter_102.db", REQUESTS_KEY, 5.0)
+    write_worker_file(tmp_path, "gauge_livesum_100.db", IN_FLIGHT_KEY, 1.0)
+
+    assert collect_requests(tmp_path) == 12.0
+
+    mark_process_dead(100)
+    mark_process_dead(101)
+
+    assert sorted(os.listdir(str(tmp_path))) == ["counter_102.db", "counter_archive.db"]
+    assert collect_requests(tmp_path) == 12.0
+
+    clear_multiprocess_directory(str(tmp_path))
+
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_endpoint_labels_are_capped():
+    """
+    Test routes past the label limit and unmatched requests are labelled 'other'
+    :param - None
+    :return - None
+    """
+
+    labels = EndpointLabels(2)
+
+    assert labels.label("/users") == "/users"
+    assert labels.label("/users/<id>") == "/users/<id>"
+    assert labels.label("/users/export") == "other"
+    assert labels.label(None) == "other"
+    assert labels.label("/users/<id>") == "/users/<id>"
+
+
+def test_response_size_is_observed_without_buffering():
+    """
+    Test the size of a sized response is its Content-Length, a streamed one is counted as consumed
+    :param - None
+    :return - None
+    """
+
+    registry = CollectorRegistry()
+    histogram = Histogram("response_size", "Response size", registry=registry)
+
+    observe_response_size(Response(b"x" * 10), histogram)
+
+    assert registry.get_sample_value("response_size_sum") == 10
+
+    streamed = Response(iter(["ab", "çd"]))
+    observe_response_size(streamed, histogram)
+
+    assert registry.get_sample_value("response_size_count") == 1
+
+    assert b"".join(streamed.response) == "abçd".encode()
+    streamed.close()
+
+    assert registry.get_sample_value("response_size_count") == 2
+    assert registry.get_sample_value("response_size_sum") == 15
+
+
+def test_counted_body_closes_the_stream():
+    """
+    Test closing a streamed response closes its generator even when it was not consumed
+    :param - None
+    :return - None
+    """
+
+    registry = CollectorRegistry()
+    histogram = Histogram("response_size", "Response size", registry=registry)
+    closed = []
+
+    def stream():
+        try:
+            yield "ab"
+            yield "cd"
+        finally:
+            closed.append(True)
+
+    streamed = Response(stream())
+    observe_response_size(streamed, histogram)
+
+    assert next(iter(streamed.response)) == b"ab"
+    streamed.close()
+
+    assert closed == [True]
+    assert registry.get_sample_value("response_size_sum") == 2
+
+
+def test_pool_checkouts_and_checkins_are_counted(tmp_path):
+    """
+    Test an instrumented pool counts checkouts and checkins, exports its gauges and times the wait
+    :param - None
+    :return - None
+    """
+
+    engine = create_engine(
+        "sqlite:///{}".format(tmp_path / "pool.db"), poolclass=TimedQueuePool, pool_size=1, max_overflow=1
+    )
+    instrument_pool(engine)
+    labels = {"database": str(engine.url.database)}
+
+    def sample(name):
+        return REGISTRY.get_sample_value(name, labels) or 0.0
+
+    first = engine.connect()
+    second = engine.connect()
+
+    assert sample("db_pool_checkouts_total") == 2
+    assert sample("db_pool_checked_out") == 2
+    assert sample("db_pool_overflow") == 1
+    assert sample("db_pool_checkout_wait_seconds_count") == 2
+    assert sample("db_pool_checkins_total") == 0
+
+    first.close()
+
+    assert sample("db_pool_checkins_total") == 1
+    assert sample("db_pool_checked_out") == 1
+    assert sample("db_pool_overflow") == 1
+
+    second.close()
+
+    assert sample("db_pool_checked_out") == 0
+    assert sample("db_pool_overflow") == 0
+
+    engine.connect().close()
+
+    assert sample("db_pool_checkouts_total") == 3
+    assert sample("db_pool_checkins_total") == 3
+    assert sample("db_pool_checked_out") == 0
+    assert sample("db_pool_checkout_wait_seconds_count") == 3
+    assert sample("db_pool_checkout_wait_seconds_sum") > 0
+    engine.dispose()
@@ -0,0 +1,60 @@
+import os
+from setup.server import cpu_limit, memory_limit, worker_count
+
+MB = 1024 * 1024
+
+
+def write_cgroup_file(root, path, content):
+    path = os.path.join(str(root), path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        file.write(content + "\n")
+
+
+def test_cgroup_v2_limits(tmp_path):
+    """
+    Test the CPU and memory limits read from cgroup v2 files
+    :param - None
+    :return - None
+    """
+
+    write_cgroup_file(tmp_path, "cpu.max", "150000 100000")
+    write_cgroup_file(tmp_path, "memory.max", str(512 * MB))
+
+    assert cpu_limit(root=str(tmp_path)) == 1.5
+    assert memory_limit(root=str(tmp_path)) == 512 * MB
+
+    write_cgroup_file(tmp_path, "cpu.max", "max 100000")
+    write_cgroup_file(tmp_path, "memory.max", "max")
+
+    assert cpu_limit(root=str(tmp_path)) == len(os.sched_getaffinity(0))
+    assert memory_limit(root=str(tmp_path)) is None
+
+
+def test_cgroup_v1_limits(tmp_path):
+    """
+    Test the CPU and memory limits read from cgroup v1 files
+    :param - None
+    :return - None
+    """
+
+    write_cgroup_file(tmp_path, "cpu/cpu.cfs_quota_us", "200000")
+    write_cgroup_file(tmp_path, "cpu/cpu.cfs_period_us", "100000")
+    write_cgroup_file(tmp_path, "memory/memory.limit_in_bytes", "9223372036854771712")
+
+    assert cpu_limit(root=str(tmp_path)) == 2
+    assert memory_limit(root=str(tmp_path)) is None
+
+
+def test_worker_count():
+    """
+    Test workers are sized from the CPUs and bounded by memory
+    :param - None
+    :return - None
+    """
+
+    assert worker_count(2, None, 256 * MB) == 5
+    assert worker_count(0.5, None, 256 * MB) == 3
+    assert worker_count(2, None, 256 * MB, asynchronous=True) == 2
+    assert worker_count(4, 1024 * MB, 256 * MB) == 4
+    assert worker_count(4, 128 * MB, 256 * MB) == 1
@@ -0,0 +1,69 @@
+import json
+import decimal
+import datetime
+from unittest import mock
+from src.domain.use_cases import base_use_case
+from src.data.user.list_users import ListUsersUseCase
+
+RESPONSE = {
+    "success": True,
+    "data": [
+        {
+            "id": "1",
+            "name": "João",
+            "created_at": datetime.datetime(2024, 5, 17, 10, 30, 15, 123456),
+            "updated_at": decimal.Decimal("1715950215.25"),
+        }
+    ],
+    "total": 1,
+}
+
+
+def test_dumps_matches_serialize():
+    """
+    Test that the single pass encoder produces the same document as serialize, with and
+    without orjson
+    :param - None
+    :return - None
+    """
+
+    use_case = ListUsersUseCase()
+    expected = use_case.serialize(RESPONSE)
+    assert expected["data"][0]["created_at"] == "2024-05-17 10:30:15"
+
+    assert json.loads(use_case.dumps(RESPONSE)) == expected
+
+    with mock.patch.object(base_use_case, "orjson", None):
+        encoded = use_case.dumps(RESPONSE)
+    assert json.loads(encoded) == expected
+    assert encoded.startswith(b'{"data":[{"created_at":')
+
+
+def test_validate_schema_reuses_compiled_validator():
+    """
+    Test that validation reports field errors in one pass and compiles each schema once
+    :param - None
+    :return - None
+    """
+
+    user = {"name": "Ana", "last_name": "Silva", "email": "ana@example.com", "cpf": "12345678901"}
+
+    with mock.patch.object(
+        base_use_case.jsonschema.Draft7Validator,
+        "check_schema",
+        wraps=base_use_case.jsonschema.Draft7Validator.check_schema,
+    ) as check_schema:
+        schema = {"type": "object", "properties": {"name": {"type": "string"}}, "required": ["name"]}
+        assert ListUsersUseCase.validate_schema("User", user, schema).success is True
+        response = ListUsersUseCase.validate_schema("User", {"name": 1}, schema)
+        assert check_schema.call_count == 1
+
+    assert response.success is False
+    assert response.errors[0]["field"] == "name"
+
+    response = ListUsersUseCase.validate_schema("User", {}, schema)
+    assert response.errors[0]["field"] == "name"
+    assert response.errors[0]["msg"] == "'name' is a required property"
+
+    invalid_schema = {"type": "unknown"}
+    assert ListUsersUseCase.validate_schema("User", user, invalid_schema).success is False
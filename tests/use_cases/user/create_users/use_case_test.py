@@ -0,0 +1,65 @@
+import os
+import pytest
+from faker import Faker
+from unittest import mock
+from src.infra.config import DBConnectionHandler
+from src.data.user.create_users import CreateUsersUseCase, CreateUsersParameter
+
+fake = Faker()
+MOCK_DB_PATH = "sqlite:///mock_data.db"
+
+
+@pytest.fixture(scope="session")
+def mock_entities():
+    return [
+        {
+            "cpf": fake.pystr(min_chars=11, max_chars=11),
+            "name": fake.name(),
+            "last_name": fake.last_name(),
+            "email": fake.unique.email(),
+        }
+        for _ in range(3)
+    ]
+
+
+@pytest.fixture(scope="session")
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def db_connection_handler():
+    return DBConnectionHandler()
+
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_create_users_use_case(mock_entities, db_connection_handler):
+    """
+    Test the CreateUsersUseCase invocation
+    :param - None
+    :return - None
+    """
+
+    duplicated = dict(mock_entities[0], email=fake.unique.email())
+    invalid = {"name": fake.name()}
+
+    use_case = CreateUsersUseCase()
+    parameter = CreateUsersParameter(
+        users=mock_entities + [duplicated, invalid], batch_size=2
+    )
+    response = use_case.proceed(parameter)
+
+    assert response["success"] is True
+    assert response["created"] == 3
+    assert response["failed"] == 2
+
+    data = response["data"]
+    assert [item["index"] for item in data] == [0, 1, 2, 3, 4]
+    assert data[3]["errors"][0]["type"] == "conflict"
+    assert data[4]["errors"][0]["type"] == "invalid"
+
+    engine = db_connection_handler.get_engine()
+    for item, entity in zip(data[:3], mock_entities):
+        query_entity = engine.execute(
+            "SELECT * FROM users WHERE id='{}'".format(item["data"]["id"])
+        ).fetchone()
+        assert query_entity.cpf == entity["cpf"]
+        assert query_entity.email == entity["email"]
+
+        engine.execute("DELETE FROM users WHERE id='{}'".format(item["data"]["id"]))
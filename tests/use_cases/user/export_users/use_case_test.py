@@ -0,0 +1,78 @@
+import os
+import json
+import uuid
+import pytest
+from faker import Faker
+from unittest import mock
+from tests.mock_util import MockUtil
+from src.infra.config import DBConnectionHandler
+from src.data.user.export_users import ExportUsersUseCase, ExportUsersParameter
+
+fake = Faker()
+MOCK_DB_PATH = "sqlite:///mock_data.db"
+
+
+@pytest.fixture(scope="session")
+def mock_entity():
+    return {
+        "id": str(uuid.uuid4()),
+        "cpf": fake.pystr(min_chars=11, max_chars=11),
+        "name": fake.name(),
+        "last_name": fake.last_name(),
+        "email": fake.email(),
+    }
+
+
+@pytest.fixture(scope="session")
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def db_connection_handler():
+    return DBConnectionHandler()
+
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_export_use_case(mock_entity, db_connection_handler):
+    """
+    Test the ExportUsersUseCase invocation
+    :param - None
+    :return - None
+    """
+
+    engine = db_connection_handler.get_engine()
+    engine.execute(MockUtil.build_insert_sql("users", mock_entity))
+
+    use_case = ExportUsersUseCase()
+
+    response = use_case.proceed(ExportUsersParameter(cpf=mock_entity["cpf"]))
+    assert response["success"] is True
+    lines = "".join(response["data"]).splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0]) == {
+        key: mock_entity[key] for key in ("id", "name", "email", "last_name", "cpf")
+    }
+
+    response = use_case.proceed(ExportUsersParameter(cpf=mock_entity["cpf"], format="csv"))
+    assert response["success"] is True
+    lines = "".join(response["data"]).splitlines()
+    assert lines[0] == "id,name,email,last_name,cpf"
+    assert lines[1].startswith(mock_entity["id"])
+
+    response = use_case.proceed(ExportUsersParameter(format="xml"))
+    assert response["success"] is False
+
+    engine.execute("DELETE FROM users WHERE id='{}'".format(mock_entity["id"]))
+
+
+def test_export_use_case_invalid_sort():
+    """
+    Test the ExportUsersUseCase rejects an invalid sort before returning a stream
+    :param - None
+    :return - None
+    """
+
+    use_case = ExportUsersUseCase()
+
+    response = use_case.proceed(ExportUsersParameter(column="bogus", format="csv"))
+    assert response["success"] is False
+
+    response = use_case.proceed(ExportUsersParameter(order="sideways"))
+    assert response["success"] is False
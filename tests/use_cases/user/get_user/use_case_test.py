@@ -58,3 +58,39 @@ def test_get_use_case(mock_entity, db_connection_handler):
     assert data["last_name"] == query_entity.last_name
 
     engine.execute("DELETE FROM users WHERE id='{}'".format(data["id"]))
+
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_get_use_case_not_modified(db_connection_handler):
+    """
+    Test the GetUserUseCase answers not_modified for the ETag it returned
+    :param - None
+    :return - None
+    """
+
+    entity = {
+        "id": str(uuid.uuid4()),
+        "cpf": fake.pystr(min_chars=11, max_chars=11),
+        "name": fake.name(),
+        "last_name": fake.last_name(),
+        "email": fake.email(),
+    }
+    engine = db_connection_handler.get_engine()
+    engine.execute(MockUtil.build_insert_sql("users", entity))
+
+    use_case = GetUserUseCase()
+    response = use_case.proceed(GetUserParameter(id=entity["id"]))
+    etag = response["etag"]
+    assert response["success"] is True
+    assert etag == use_case.etag(response["data"])
+
+    response = use_case.proceed(GetUserParameter(id=entity["id"], if_none_match='"other", W/' + etag))
+    assert response["not_modified"] is True
+    assert response["etag"] == etag
+    assert response["data"] is None
+
+    response = use_case.proceed(GetUserParameter(id=entity["id"], if_none_match='"other"'))
+    assert "not_modified" not in response
+    assert response["data"]["id"] == entity["id"]
+
+    engine.execute("DELETE FROM users WHERE id='{}'".format(entity["id"]))
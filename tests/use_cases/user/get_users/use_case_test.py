@@ -0,0 +1,56 @@
+import os
+import uuid
+import pytest
+from faker import Faker
+from unittest import mock
+from tests.mock_util import MockUtil
+from src.infra.config import DBConnectionHandler
+from src.data.user.get_users import GetUsersUseCase, GetUsersParameter
+
+fake = Faker()
+MOCK_DB_PATH = "sqlite:///mock_data.db"
+
+
+@pytest.fixture(scope="session")
+def mock_entity():
+    return {
+        "id": str(uuid.uuid4()),
+        "cpf": fake.pystr(min_chars=11, max_chars=11),
+        "name": fake.name(),
+        "last_name": fake.last_name(),
+        "email": fake.email(),
+    }
+
+
+@pytest.fixture(scope="session")
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def db_connection_handler():
+    return DBConnectionHandler()
+
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_get_users_use_case(mock_entity, db_connection_handler):
+    """
+    Test the GetUsersUseCase invocation
+    :param - None
+    :return - None
+    """
+
+    engine = db_connection_handler.get_engine()
+    engine.execute(MockUtil.build_insert_sql("users", mock_entity))
+
+    unknown_id = str(uuid.uuid4())
+    use_case = GetUsersUseCase()
+    response = use_case.proceed(GetUsersParameter(ids=[unknown_id, mock_entity["id"]]))
+
+    assert response["success"] is True
+    assert response["found"] == 1
+    assert response["missing"] == 1
+    assert response["data"][0] == {"id": unknown_id, "found": False, "data": None}
+    assert response["data"][1]["found"] is True
+    assert response["data"][1]["data"]["email"] == mock_entity["email"]
+
+    response = use_case.proceed(GetUsersParameter(ids=[]))
+    assert response["success"] is False
+
+    engine.execute("DELETE FROM users WHERE id='{}'".format(mock_entity["id"]))
@@ -0,0 +1,72 @@
+import os
+import json
+import pytest
+from faker import Faker
+from unittest import mock
+from src.infra.config import DBConnectionHandler
+from src.data.user.import_users import ImportUsersUseCase, ImportUsersParameter
+
+fake = Faker()
+MOCK_DB_PATH = "sqlite:///mock_data.db"
+
+
+@pytest.fixture(scope="session")
+def mock_entities():
+    return [
+        {
+            "cpf": fake.pystr(min_chars=11, max_chars=11),
+            "name": fake.first_name(),
+            "last_name": fake.last_name(),
+            "email": fake.unique.email(),
+        }
+        for _ in range(3)
+    ]
+
+
+@pytest.fixture(scope="session")
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def db_connection_handler():
+    return DBConnectionHandler()
+
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_import_users_use_case(mock_entities, db_connection_handler):
+    """
+    Test the ImportUsersUseCase invocation with CSV and NDJSON lines
+    :param - None
+    :return - None
+    """
+
+    lines = ["name,last_name,email,cpf\n"]
+    lines += [
+        "{name},{last_name},{email},{cpf}\n".format(**entity) for entity in mock_entities
+    ]
+    lines.append("only name,,,\n")
+
+    use_case = ImportUsersUseCase()
+    response = use_case.proceed(ImportUsersParameter(lines=lines, format="csv"))
+
+    assert response["success"] is True
+    assert response["data"]["read"] == 3
+    assert response["data"]["inserted"] == 3
+    assert response["data"]["invalid"] == 1
+    assert response["errors"][0]["record"] == 4
+
+    renamed = [dict(entity, name=fake.first_name()) for entity in mock_entities]
+    lines = [json.dumps(entity) for entity in renamed]
+    response = use_case.proceed(
+        ImportUsersParameter(lines=lines, format="ndjson", on_conflict="update")
+    )
+
+    assert response["success"] is True
+    assert response["data"]["updated"] == 3
+    assert response["data"]["inserted"] == 0
+
+    engine = db_connection_handler.get_engine()
+    for entity in renamed:
+        query_entity = engine.execute(
+            "SELECT * FROM users WHERE cpf='{}'".format(entity["cpf"])
+        ).fetchone()
+        assert query_entity.name == entity["name"]
+
+        engine.execute("DELETE FROM users WHERE cpf='{}'".format(entity["cpf"]))
@@ -0,0 +1,58 @@
+import os
+import asyncio
+import pytest
+from faker import Faker
+from unittest import mock
+from src.infra.config import DBConnectionHandler
+from src.data.user.list_users import (
+    AsyncListUsersUseCase,
+    ListUsersUseCase,
+    ListUsersParameter,
+)
+from src.data.user.create_user import AsyncCreateUserUseCase, CreateUserParameter
+from src.data.user.delete_user import AsyncDeleteUserUseCase, DeleteUserParameter
+
+fake = Faker()
+MOCK_DB_PATH = "sqlite:///mock_data.db"
+
+
+@pytest.fixture(scope="session")
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def db_connection_handler():
+    return DBConnectionHandler()
+
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_async_list_use_case(db_connection_handler):
+    """
+    Test the AsyncListUsersUseCase answers as ListUsersUseCase, ETag included
+    :param - None
+    :return - None
+    """
+
+    async def proceed():
+        created = await AsyncCreateUserUseCase().proceed(
+            CreateUserParameter(
+                name=fake.name(),
+                email=fake.email(),
+                last_name=fake.last_name(),
+                cpf=fake.pystr(min_chars=11, max_chars=11),
+            )
+        )
+        assert created["success"] is True
+
+        parameter = ListUsersParameter(cpf=created["data"]["cpf"])
+        response = await AsyncListUsersUseCase().proceed(parameter)
+        assert response["data"] == [created["data"]]
+        assert response["total"] == 1
+        assert response["etag"] == ListUsersUseCase().proceed(parameter)["etag"]
+
+        response = await AsyncListUsersUseCase().proceed(
+            parameter._replace(if_none_match=response["etag"])
+        )
+        assert response["not_modified"] is True
+
+        deleted = await AsyncDeleteUserUseCase().proceed(DeleteUserParameter(id=created["data"]["id"]))
+        assert deleted["data"] == created["data"]
+
+    asyncio.run(proceed())
@@ -64,3 +64,61 @@ def test_list_use_case(mock_entity, db_connection_handler):
     assert data["cpf"] == mock_entity["cpf"]
 
     engine.execute("DELETE FROM users WHERE id='{}'".format(data["id"]))
+
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_list_use_case_not_modified(db_connection_handler):
+    """
+    Test the ListUsersUseCase answers not_modified until a user matching the filters changes
+    :param - None
+    :return - None
+    """
+
+    from src.infra.repo import UserRepository
+
+    repository = UserRepository()
+    user = repository.create_user(
+        name=fake.name(),
+        last_name=fake.last_name(),
+        cpf=fake.pystr(min_chars=11, max_chars=11),
+        email=fake.email(),
+    )
+
+    use_case = ListUsersUseCase()
+    parameter = ListUsersParameter(cpf=user.cpf)
+    response = use_case.proceed(parameter)
+    etag = response["etag"]
+    assert response["data"][0]["id"] == user.id
+
+    response = use_case.proceed(parameter._replace(if_none_match=etag))
+    assert response["not_modified"] is True
+    assert response["data"] is None
+
+    # another page of the same filters has its own ETag
+    assert use_case.proceed(parameter._replace(page=1))["etag"] != etag
+
+    repository.patch_user(id=user.id, values={"name": fake.name()})
+    response = use_case.proceed(parameter._replace(if_none_match=etag))
+    assert "not_modified" not in response
+    assert response["etag"] != etag
+
+    repository.delete_user(user.id)
+
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_list_use_case_invalid_cursor(db_connection_handler):
+    """
+    Test the ListUsersUseCase tells an invalid cursor or cursor column apart from a failure
+    :param - None
+    :return - None
+    """
+
+    use_case = ListUsersUseCase()
+
+    response = use_case.proceed(ListUsersParameter(cursor="invalid"))
+    assert response["success"] is False
+    assert response["msg"] == "Invalid cursor"
+
+    response = use_case.proceed(ListUsersParameter(column="password", cursor=""))
+    assert response["success"] is False
+    assert "msg" in response
@@ -0,0 +1,89 @@
+import os
+import uuid
+import pytest
+from faker import Faker
+from unittest import mock
+from tests.mock_util import MockUtil
+from src.infra.config import DBConnectionHandler
+from src.data.user.patch_user import PatchUserUseCase, PatchUserParameter
+
+fake = Faker()
+MOCK_DB_PATH = "sqlite:///mock_data.db"
+
+
+@pytest.fixture(scope="session")
+def mock_entity():
+    return {
+        "id": str(uuid.uuid4()),
+        "cpf": fake.pystr(min_chars=11, max_chars=11),
+        "name": fake.name(),
+        "last_name": fake.last_name(),
+        "email": fake.email(),
+    }
+
+
+@pytest.fixture(scope="session")
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def db_connection_handler():
+    return DBConnectionHandler()
+
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_patch_use_case(mock_entity, db_connection_handler):
+    """
+    Test the PatchUserUseCase invocation
+    :param - None
+    :return - None
+    """
+
+    engine = db_connection_handler.get_engine()
+    engine.execute(MockUtil.build_insert_sql("users", mock_entity))
+
+    use_case = PatchUserUseCase()
+    response = use_case.proceed(PatchUserParameter(id=mock_entity["id"], values={"name": "Patched"}))
+    assert response["success"] is True
+    assert response["data"]["name"] == "Patched"
+    assert response["data"]["email"] == mock_entity["email"]
+    etag = response["etag"]
+
+    with mock.patch.object(use_case.repository, "patch_user") as patch_user:
+        response = use_case.proceed(
+            PatchUserParameter(id=mock_entity["id"], values={"name": "Patched"}, if_match=etag)
+        )
+        assert response["success"] is True
+        assert response["etag"] == etag
+        patch_user.assert_not_called()
+
+    response = use_case.proceed(
+        PatchUserParameter(id=mock_entity["id"], values={"last_name": "Changed"}, if_match=etag)
+    )
+    assert response["success"] is True
+    assert response["etag"] != etag
+
+    response = use_case.proceed(
+        PatchUserParameter(id=mock_entity["id"], values={"last_name": "Again"}, if_match=etag)
+    )
+    assert response["success"] is False
+    assert response["precondition_failed"] is True
+
+    # changed behind the user cache, which still has name "Patched"
+    use_case.repository.get_user(id=mock_entity["id"])
+    engine.execute("UPDATE users SET name='Behind' WHERE id='{}'".format(mock_entity["id"]))
+    response = use_case.proceed(PatchUserParameter(id=mock_entity["id"], values={"name": "Patched"}))
+    assert response["success"] is True
+    assert response["data"]["name"] == "Patched"
+
+    response = use_case.proceed(PatchUserParameter(id=str(uuid.uuid4()), values={"name": "x"}))
+    assert response["not_found"] is True
+
+    response = use_case.proceed(PatchUserParameter(id=mock_entity["id"], values={"id": "x"}))
+    assert response["success"] is False
+    assert len(response["errors"]) == 1
+
+    query_entity = engine.execute(
+        "SELECT * FROM users WHERE id='{}'".format(mock_entity["id"])
+    ).fetchone()
+    assert query_entity.name == "Patched"
+    assert query_entity.last_name == "Changed"
+
+    engine.execute("DELETE FROM users WHERE id='{}'".format(mock_entity["id"]))
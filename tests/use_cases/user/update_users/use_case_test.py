@@ -0,0 +1,82 @@
+import os
+import uuid
+import pytest
+from faker import Faker
+from unittest import mock
+from tests.mock_util import MockUtil
+from src.infra.config import DBConnectionHandler
+from src.data.user.update_users import UpdateUsersUseCase, UpdateUsersParameter
+
+fake = Faker()
+MOCK_DB_PATH = "sqlite:///mock_data.db"
+
+
+@pytest.fixture(scope="session")
+def mock_entity():
+    return {
+        "id": str(uuid.uuid4()),
+        "cpf": fake.pystr(min_chars=11, max_chars=11),
+        "name": fake.name(),
+        "last_name": fake.last_name(),
+        "email": fake.email(),
+    }
+
+
+@pytest.fixture(scope="session")
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def db_connection_handler():
+    return DBConnectionHandler()
+
+
+@mock.patch.dict(os.environ, {"TEST_DATABASE_CONNECTION": MOCK_DB_PATH})
+def test_update_users_use_case(mock_entity, db_connection_handler):
+    """
+    Test the UpdateUsersUseCase invocation
+    :param - None
+    :return - None
+    """
+
+    engine = db_connection_handler.get_engine()
+    engine.execute(MockUtil.build_insert_sql("users", mock_entity))
+
+    use_case = UpdateUsersUseCase()
+    response = use_case.proceed(
+        UpdateUsersParameter(ids=[mock_entity["id"], str(uuid.uuid4())], values={"name": "Bulk"})
+    )
+    assert response["success"] is True
+    assert response["data"] == {"updated": 1, "not_found": 1}
+
+    response = use_case.proceed(
+        UpdateUsersParameter(users=[{"id": mock_entity["id"], "last_name": "Rows"}])
+    )
+    assert response["data"] == {"updated": 1, "not_found": 0}
+
+    query_entity = engine.execute(
+        "SELECT * FROM users WHERE id='{}'".format(mock_entity["id"])
+    ).fetchone()
+    assert query_entity.name == "Bulk"
+    assert query_entity.last_name == "Rows"
+
+    response = use_case.proceed(
+        UpdateUsersParameter(
+            users=[
+                {"id": mock_entity["id"], "name": "First", "last_name": "Twice"},
+                {"id": mock_entity["id"], "name": "Last"},
+            ]
+        )
+    )
+    assert response["data"] == {"updated": 1, "not_found": 0}
+
+    query_entity = engine.execute(
+        "SELECT * FROM users WHERE id='{}'".format(mock_entity["id"])
+    ).fetchone()
+    assert query_entity.name == "Last"
+    assert query_entity.last_name == "Twice"
+
+    response = use_case.proceed(
+        UpdateUsersParameter(users=[{"id": mock_entity["id"], "created_at": "2024-01-01"}])
+    )
+    assert response["success"] is False
+    assert response["errors"][0]["index"] == 0
+
+    engine.execute("DELETE FROM users WHERE id='{}'".format(mock_entity["id"]))